@@ -1,11 +1,17 @@
+import os
 from flask import Flask
 from config import Config
+from utils.log import setup_logging
+from services.cracking_service import cracking_service
+from services.radio import radio_manager
+from services.scanner_daemon import scanner_daemon
 from blueprints.main import main_bp
 from blueprints.user import user_bp
 from blueprints.expert import expert_bp
 
 def create_app():
     """Flask 애플리케이션 팩토리"""
+    setup_logging()
     app = Flask(__name__)
     app.config.from_object(Config)
     
@@ -14,6 +20,22 @@ def create_app():
     app.register_blueprint(user_bp)
     app.register_blueprint(expert_bp)
     
+    # 디버그 리로더의 부모 프로세스에서는 백그라운드 작업을 시작하지 않음
+    if not app.debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        # 링크 이벤트로 무선 인터페이스 캐시 무효화, 첫 스캔 전에 모니터 모드 준비 (백그라운드 스캐너는 시작하면서 직접 준비)
+        radio_manager.start_watcher()
+        if Config.RADIO_PREWARM and not Config.WIFI_SCANNER_DAEMON:
+            for interface in Config.WIFI_INTERFACES:
+                radio_manager.prewarm(interface)
+        
+        # 백그라운드 스캐너 시작 (스캔 API는 현재 스냅샷을 즉시 반환)
+        if Config.WIFI_SCANNER_DAEMON:
+            scanner_daemon.start()
+        
+        # 중단된 크래킹 작업 자동 재개
+        if Config.CRACKING_AUTO_RESUME:
+            cracking_service.resume_interrupted()
+    
     return app
 
 if __name__ == '__main__':
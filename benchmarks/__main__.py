@@ -0,0 +1,57 @@
+"""벤치마크 전체 실행 및 기준선 비교
+
+    python -m benchmarks                      # 전체 실행
+    python -m benchmarks --only scanner pmk   # 일부만 실행
+    python -m benchmarks --save               # 결과를 기준선으로 저장
+    python -m benchmarks --compare            # 저장된 기준선과 비교 (느려진 항목이 있으면 종료 코드 1)
+
+기준선은 머신마다 다르므로 저장소에 포함하지 않습니다 (기본 경로: benchmarks/baseline.json).
+"""
+import argparse
+import os
+import sys
+
+from benchmarks import bench_api, bench_auth, bench_crack, bench_pmk, bench_scanner
+from benchmarks.harness import load_baseline, report, save_baseline
+
+SUITES = {
+    'scanner': bench_scanner.run,
+    'auth': bench_auth.run,
+    'api': bench_api.run,
+    'crack': bench_crack.run,
+    'pmk': bench_pmk.run,
+}
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='WiSafe 벤치마크')
+    parser.add_argument('--only', nargs='+', choices=sorted(SUITES), help='실행할 벤치마크')
+    parser.add_argument('--quick', action='store_true', help='반복/후보 수를 줄여 빠르게 실행')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='기준선 파일 경로')
+    parser.add_argument('--save', action='store_true', help='결과를 기준선으로 저장')
+    parser.add_argument('--compare', action='store_true', help='저장된 기준선과 비교')
+    parser.add_argument('--threshold', type=float, default=0.15, help='회귀로 판단할 성능 저하 비율')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        baseline = load_baseline(args.baseline)
+        if baseline is None:
+            print(f'기준선 파일이 없습니다: {args.baseline} (--save로 먼저 저장)')
+            return 2
+
+    results = {}
+    for name in args.only or SUITES:
+        print(f'[{name}] 측정 중...', file=sys.stderr)
+        results.update(SUITES[name](quick=args.quick))
+
+    regressions = report(results, baseline, args.threshold)
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f'\n기준선 저장: {args.baseline}')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
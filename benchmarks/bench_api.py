@@ -0,0 +1,54 @@
+"""스캔 API 지연 시간 벤치마크 (Flask 테스트 클라이언트)
+
+    python -m benchmarks.bench_api [--real-tools]
+
+- /api/scan: 사용자용 더미 목록 생성 + JSON 직렬화
+- /api/expert/scan: JWT 검증 + 스캐너 스냅샷 + 더미 병합 + JSON 직렬화
+
+무선 어댑터 없이도 측정할 수 있도록 기본으로 가짜 도구(WIRELESS_TOOLS=fake)를 사용합니다.
+WIFI_SCANNER_DAEMON이 꺼져 있으면 expert 스캔은 WIFI_SCAN_CACHE_TTL 캐시 적중 경로를 측정합니다.
+"""
+import argparse
+from typing import Dict
+
+from benchmarks.harness import Result, latency, quiet, report
+from config import Config
+
+
+def run(quick: bool = False, real_tools: bool = False) -> Dict[str, Result]:
+    if not real_tools:
+        Config.WIRELESS_TOOLS = 'fake'
+
+    from app import create_app
+    from utils.jwt_auth import generate_access_token
+
+    repeat = 3 if quick else 5
+    results = {}
+    with quiet():
+        app = create_app()
+        client = app.test_client()
+        headers = {'Authorization': f"Bearer {generate_access_token('admin', Config.JWT_SECRET_KEY)}"}
+
+        results['POST /api/scan'] = latency(lambda: client.post('/api/scan'), unit='ms', repeat=repeat)
+
+        # 첫 요청은 스캐너가 한 번 훑을 때까지 기다려 스냅샷이 비어 있지 않게 함
+        client.post('/api/expert/scan', json={'min_age': 2}, headers=headers)
+        results['POST /api/expert/scan'] = latency(
+            lambda: client.post('/api/expert/scan', headers=headers), unit='ms', repeat=repeat
+        )
+
+        if Config.WIFI_SCANNER_DAEMON:
+            from services.scanner_daemon import scanner_daemon
+            scanner_daemon.stop()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스캔 API 지연 시간')
+    parser.add_argument('--real-tools', action='store_true', help='실제 airodump-ng 사용 (어댑터/sudo 필요)')
+    args = parser.parse_args()
+    report(run(real_tools=args.real_tools))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""JWT 인증 벤치마크
+
+    python -m benchmarks.bench_auth
+
+- verify_token: 유효한 access token 디코딩/검증
+- jwt_required: 데코레이터를 씌운 뷰와 그렇지 않은 뷰의 호출 시간 차이 (요청 컨텍스트 안)
+"""
+from typing import Dict
+
+from flask import Flask
+
+from benchmarks.harness import Result, latency, report
+from config import Config
+from utils.jwt_auth import generate_access_token, jwt_required, verify_token
+
+
+def run(quick: bool = False) -> Dict[str, Result]:
+    repeat = 3 if quick else 5
+    token = generate_access_token('admin', Config.JWT_SECRET_KEY)
+    results = {
+        'verify_token': latency(lambda: verify_token(token, Config.JWT_SECRET_KEY, 'access'), repeat=repeat)
+    }
+
+    def view():
+        return 'ok'
+
+    protected = jwt_required(view)
+    app = Flask(__name__)
+    with app.test_request_context('/api/expert/verify', headers={'Authorization': f'Bearer {token}'}):
+        bare = latency(view, repeat=repeat)
+        decorated = latency(protected, repeat=repeat)
+
+    decorated['value'] -= bare['value']
+    decorated['min'] -= bare['min']
+    results['jwt_required overhead'] = decorated
+    return results
+
+
+def main():
+    report(run())
+
+
+if __name__ == '__main__':
+    main()
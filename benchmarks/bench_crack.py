@@ -0,0 +1,92 @@
+"""WPA 사전 공격 처리량 벤치마크 (candidates/s)
+
+    python -m benchmarks.bench_crack [--capture cap_files/wpa-psk.pcap] [--count 4096]
+
+- pmk+mic (1 core): 후보별 PMK 유도 + MIC 검증, 단일 코어
+- engine: WPADictionaryEngine 프로세스 풀 전체 경로 (wordlist 인덱스, 구간 분배, 결과 수집)
+
+캡처에 4-way 핸드셰이크가 없으면(wpa-psk.pcap) PMK 유도만 측정하고,
+엔진은 핸드셰이크가 있는 FALLBACK_CAPTURE로 측정합니다.
+"""
+import argparse
+import os
+import tempfile
+import time
+from typing import Dict, Optional
+
+from benchmarks.harness import Result, quiet, report, throughput
+from config import Config
+from services.handshake import extract_handshakes
+from services.wordlist import IndexedWordlist
+from services.wpa_engine import WPADictionaryEngine, derive_pmks, make_target, verify_pmk
+
+DEFAULT_CAPTURE = os.path.join(Config.CAPTURE_FILES_DIR, 'wpa-psk.pcap')
+FALLBACK_CAPTURE = os.path.join(Config.CAPTURE_FILES_DIR, 'wpa2.pcap')
+
+
+def _candidates(count: int):
+    return [f'bench-candidate-{i:08d}'.encode() for i in range(count)]
+
+
+def _load(path: str):
+    """(핸드셰이크 또는 None, SSID)"""
+    index = extract_handshakes(path)
+    handshake = index.best()
+    if handshake is not None:
+        return handshake, index.ssid_for(handshake.bssid) or 'bench'
+    return None, next(iter(index.ssids.values()), None) or 'bench'
+
+
+def run(quick: bool = False, capture: str = DEFAULT_CAPTURE, count: Optional[int] = None,
+        workers: Optional[int] = None) -> Dict[str, Result]:
+    count = count or (1024 if quick else 4096)
+    handshake, ssid = _load(capture)
+    target = make_target(handshake, ssid) if handshake else None
+    label = os.path.basename(capture)
+    results = {}
+
+    candidates = _candidates(count // 4)
+    start = time.perf_counter()
+    for pmk in derive_pmks(candidates, ssid.encode()):
+        if target is not None:
+            verify_pmk(target, pmk)
+    name = f'crack {label} {"pmk+mic" if target else "pmk"} (1 core)'
+    results[name] = throughput(len(candidates), time.perf_counter() - start, 'cand/s')
+
+    engine_capture = capture
+    if handshake is None:
+        engine_capture = FALLBACK_CAPTURE
+        handshake, ssid = _load(engine_capture)
+    if handshake is None:
+        return results
+
+    with tempfile.TemporaryDirectory(prefix='wisafe_bench_') as work_dir:
+        wordlist_path = os.path.join(work_dir, 'wordlist.txt')
+        with open(wordlist_path, 'wb') as f:
+            f.write(b'\n'.join(_candidates(count)) + b'\n')
+        wordlist = IndexedWordlist(wordlist_path, os.path.join(work_dir, 'wordlist.idx'))
+        engine = WPADictionaryEngine(workers=workers, pmk_backend=Config.CRACKING_PMK_BACKEND)
+        try:
+            with quiet():
+                start = time.perf_counter()
+                engine.crack(handshake, ssid, wordlist)
+                seconds = time.perf_counter() - start
+        finally:
+            wordlist.close()
+
+    name = f'crack {os.path.basename(engine_capture)} engine ({engine.workers} workers)'
+    results[name] = throughput(count, seconds, 'cand/s')
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='WPA 사전 공격 candidates/s')
+    parser.add_argument('--capture', default=DEFAULT_CAPTURE)
+    parser.add_argument('--count', type=int, default=None, help='엔진 측정 후보 수 (단일 코어는 1/4)')
+    parser.add_argument('--workers', type=int, default=None, help='엔진 워커 수 (기본: CPU 수)')
+    args = parser.parse_args()
+    report(run(capture=args.capture, count=args.count, workers=args.workers))
+
+
+if __name__ == '__main__':
+    main()
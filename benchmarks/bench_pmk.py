@@ -0,0 +1,87 @@
+"""PMK 유도 백엔드 처리량 비교 (keys/s)
+
+    python -m benchmarks.bench_pmk [--capture cap_files/wpa-psk.pcap] [--count 2048]
+
+- hashlib: 후보별 hashlib.pbkdf2_hmac 호출 + MIC 검증
+- numpy: services.sha1_numpy 레인 병렬 SHA-1 (레인 수별)
+- aircrack-ng: 설치되어 있으면 `aircrack-ng -S` 속도 테스트 결과
+
+핸드셰이크가 없는 캡처(wpa-psk.pcap)는 PMK 유도만 측정합니다.
+"""
+import argparse
+import os
+import re
+import shutil
+import subprocess
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.harness import Result, report, throughput
+from config import Config
+from services.handshake import extract_handshakes
+from services.wpa_engine import derive_pmks, make_target, verify_pmk
+
+DEFAULT_CAPTURE = os.path.join(Config.CAPTURE_FILES_DIR, 'wpa-psk.pcap')
+DEFAULT_LANES = (1024, 8192)
+
+
+def _candidates(count: int):
+    return [f'bench-candidate-{i:08d}'.encode() for i in range(count)]
+
+
+def bench_backend(backend: str, ssid: bytes, count: int, target=None) -> Result:
+    """단일 코어 기준 초당 후보 수"""
+    candidates = _candidates(count)
+    start = time.perf_counter()
+    pmks = derive_pmks(candidates, ssid, backend)
+    if target is not None:
+        for pmk in pmks:
+            verify_pmk(target, pmk)
+    return throughput(count, time.perf_counter() - start)
+
+
+def bench_aircrack(timeout: int = 30) -> Optional[float]:
+    """aircrack-ng 내장 속도 테스트 (-S) 결과 (없으면 None)"""
+    if not shutil.which('aircrack-ng'):
+        return None
+    try:
+        output = subprocess.run(['aircrack-ng', '-S'], capture_output=True, text=True, timeout=timeout).stdout
+    except subprocess.TimeoutExpired as e:
+        # 타임아웃 시 stdout은 bytes로 남음
+        output = e.stdout.decode(errors='replace') if isinstance(e.stdout, bytes) else (e.stdout or '')
+    matches = re.findall(r'([\d.]+)\s*k/s', output)
+    return float(matches[-1]) * 1000 if matches else None
+
+
+def run(quick: bool = False, capture: str = DEFAULT_CAPTURE, count: Optional[int] = None,
+        lanes: Optional[List[int]] = None) -> Dict[str, Result]:
+    count = count or (512 if quick else 2048)
+    lanes = lanes or ([DEFAULT_LANES[0]] if quick else list(DEFAULT_LANES))
+
+    index = extract_handshakes(capture)
+    handshake = index.best()
+    ssid = (index.ssid_for(handshake.bssid) if handshake else next(iter(index.ssids.values()), None)) or 'bench'
+    target = make_target(handshake, ssid) if handshake else None
+    label = 'pmk+mic' if target else 'pmk'
+
+    results = {f'{label} hashlib (1 core)': bench_backend('hashlib', ssid.encode(), count, target)}
+    for lane_count in lanes:
+        results[f'{label} numpy x{lane_count} (1 core)'] = bench_backend('numpy', ssid.encode(), lane_count, target)
+
+    rate = bench_aircrack()
+    if rate is not None:
+        results['aircrack-ng -S'] = {'value': rate, 'unit': 'keys/s', 'better': 'higher'}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PMK 백엔드 keys/s 비교')
+    parser.add_argument('--capture', default=DEFAULT_CAPTURE)
+    parser.add_argument('--count', type=int, default=None, help='hashlib 측정 후보 수')
+    parser.add_argument('--lanes', type=int, nargs='+', default=None, help='numpy 레인 수')
+    args = parser.parse_args()
+    report(run(capture=args.capture, count=args.count, lanes=args.lanes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""스캐너 파싱/분류 벤치마크
+
+    python -m benchmarks.bench_scanner
+
+- parse_airodump_stdout: 10/100/1000개 AP의 airodump-ng 화면 출력 픽스처
+- csv_tail_poll: 10/100/1000행 airodump-ng CSV의 AirodumpCSVTail.poll
+  (cold: 처음 읽기, changed: 다시 쓴 파일에서 행 10%만 바뀜, unchanged: 파일 그대로)
+- parse_protocol / get_security_level: 암호화 문자열 분류
+"""
+import os
+import random
+import tempfile
+from typing import Dict, List
+
+from benchmarks.harness import Result, latency, quiet, report
+from services.airodump_csv import AirodumpCSVTail
+from services.wifi_scanner import WiFiScanner
+
+AP_COUNTS = (10, 100, 1000)
+
+# airodump-ng 화면의 ENC CIPHER AUTH 조합
+ENCRYPTIONS = [
+    ('OPN', '', ''),
+    ('WEP', 'WEP', ''),
+    ('WPA', 'TKIP', 'PSK'),
+    ('WPA2', 'CCMP', 'PSK'),
+    ('WPA2', 'CCMP', 'MGT'),
+    ('WPA3', 'CCMP', 'SAE'),
+]
+
+
+def airodump_screen(count: int, seed: int = 0) -> List[str]:
+    """AP count개의 airodump-ng 화면 출력 (재현 가능한 픽스처)"""
+    rng = random.Random(seed)
+    lines = [
+        '',
+        ' CH  6 ][ Elapsed: 12 s ][ 2024-05-02 14:21',
+        '',
+        ' BSSID              PWR  Beacons    #Data, #/s  CH   MB   ENC CIPHER  AUTH ESSID',
+    ]
+    for i in range(count):
+        bssid = ':'.join(f'{rng.randrange(256):02X}' for _ in range(6))
+        enc, cipher, auth = ENCRYPTIONS[i % len(ENCRYPTIONS)]
+        channel = rng.choice([1, 6, 11, 36, 44, 149])
+        essid = f'Network-{i:04d}' if i % 17 else ''
+        lines.append(
+            f' {bssid}  {-rng.randrange(30, 90):3d}  {rng.randrange(1, 500):7d}  {rng.randrange(0, 200):7d}    0  '
+            f'{channel:3d}  54e  {enc:<4} {cipher:<6}  {auth:<4} {essid}'
+        )
+    lines += ['', ' BSSID              STATION            PWR   Rate    Lost    Frames  Probe', '']
+    return lines
+
+
+def airodump_csv(count: int, seed: int = 0, tick: int = 0) -> str:
+    """AP count개의 airodump-ng CSV (tick마다 AP 10%의 beacon 수와 마지막 확인 시각이 바뀜)"""
+    rng = random.Random(seed)
+    lines = ['', 'BSSID, First time seen, Last time seen, channel, Speed, Privacy, Cipher, Authentication, '
+                 'Power, # beacons, # IV, LAN IP, ID-length, ESSID, Key']
+    for i in range(count):
+        bssid = ':'.join(f'{rng.randrange(256):02X}' for _ in range(6))
+        privacy, cipher, auth = ENCRYPTIONS[i % len(ENCRYPTIONS)]
+        channel = rng.choice([1, 6, 11, 36, 44, 149])
+        essid = f'Network-{i:04d}' if i % 17 else ''
+        updates = tick if i % 10 == 0 else 0
+        lines.append(
+            f'{bssid}, 2024-05-02 14:21:00, 2024-05-02 14:21:{updates % 60:02d}, {channel:2d},  54, {privacy:<4}, '
+            f'{cipher}, {auth}, {-rng.randrange(30, 90):4d}, {rng.randrange(1, 500) + updates:8d}, {0:8d}, '
+            f'  0.  0.  0.  0, {len(essid):3d}, {essid}, '
+        )
+    lines += ['', 'Station MAC, First time seen, Last time seen, Power, # packets, BSSID, Probed ESSIDs', '', '']
+    return '\r\n'.join(lines)
+
+
+def bench_csv_tail(count: int, work_dir: str, repeat: int) -> Dict[str, Result]:
+    """AirodumpCSVTail.poll 지연 시간 (처음 읽기, 일부 행만 바뀐 파일, 바뀌지 않은 파일)"""
+    paths = []
+    for tick in range(2):
+        path = os.path.join(work_dir, f'scan{count}-{tick}.csv')
+        with open(path, 'w', newline='') as f:
+            f.write(airodump_csv(count, tick=tick))
+        paths.append(path)
+
+    results = {}
+    results[f'csv_tail_poll_cold[{count}]'] = latency(lambda: AirodumpCSVTail(paths[0]).poll(), unit='ms', repeat=repeat)
+
+    # airodump-ng가 파일을 다시 쓴 것처럼 두 시점의 파일을 번갈아 읽음 (쓰기 비용은 측정에서 제외)
+    tail = AirodumpCSVTail(paths[0])
+    tail.poll()
+    turn = [0]
+
+    def changed():
+        turn[0] ^= 1
+        tail.path = paths[turn[0]]
+        tail.poll()
+
+    results[f'csv_tail_poll_changed[{count}]'] = latency(changed, unit='ms', repeat=repeat)
+    results[f'csv_tail_poll_unchanged[{count}]'] = latency(tail.poll, unit='us', repeat=repeat)
+    return results
+
+
+def run(quick: bool = False) -> Dict[str, Result]:
+    scanner = WiFiScanner(interface='bench0')
+    results = {}
+    repeat = 3 if quick else 5
+
+    with quiet():
+        for count in AP_COUNTS:
+            lines = airodump_screen(count)
+            results[f'parse_airodump_stdout[{count}]'] = latency(
+                lambda: scanner.parse_airodump_stdout(lines), unit='ms', repeat=repeat
+            )
+
+    with tempfile.TemporaryDirectory(prefix='wisafe_bench_') as work_dir:
+        for count in AP_COUNTS:
+            results.update(bench_csv_tail(count, work_dir, repeat))
+
+    encryptions = [' '.join(part for part in combo if part) for combo in ENCRYPTIONS] + ['WPA2 CCMP PSK WPS']
+
+    def classify():
+        for encryption in encryptions:
+            scanner.get_security_level(scanner.parse_protocol(encryption))
+
+    result = latency(classify, unit='us', repeat=repeat)
+    # 문자열 하나당 시간으로 환산
+    result['value'] /= len(encryptions)
+    result['min'] /= len(encryptions)
+    results['parse_protocol+get_security_level'] = result
+    return results
+
+
+def main():
+    report(run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""벤치마크 측정/기준선 비교 공용 함수
+
+각 bench_* 모듈의 run()은 {이름: 측정 결과} 딕셔너리를 반환하고,
+`python -m benchmarks`가 이를 모아 기준선(JSON)으로 저장하거나 저장된 기준선과 비교합니다.
+"""
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, Optional
+
+Result = Dict[str, Any]
+
+# 지연 시간 단위 (초 → 표시 단위 배율)
+UNITS = {'s': 1.0, 'ms': 1e3, 'us': 1e6}
+
+
+def latency(func: Callable[[], Any], unit: str = 'us', repeat: int = 5, min_time: float = 0.2,
+            number: Optional[int] = None) -> Result:
+    """호출당 지연 시간 (repeat회 측정의 중앙값, 낮을수록 좋음)
+
+    Args:
+        func: 측정할 함수 (인자 없음)
+        unit: 결과 단위 ('s', 'ms', 'us')
+        repeat: 측정 반복 횟수
+        min_time: number가 없을 때 측정 1회의 최소 시간 (초)
+        number: 측정 1회당 호출 횟수 (None이면 min_time을 넘도록 자동 결정)
+    """
+    func()  # 워밍업 (import, 캐시 등)
+    if number is None:
+        number = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            if time.perf_counter() - start >= min_time or number >= 1 << 20:
+                break
+            number *= 2
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+
+    scale = UNITS[unit]
+    return {
+        'value': statistics.median(samples) * scale,
+        'min': min(samples) * scale,
+        'unit': unit,
+        'better': 'lower',
+        'number': number,
+        'repeat': repeat
+    }
+
+
+def throughput(count: int, seconds: float, unit: str = 'keys/s') -> Result:
+    """초당 처리량 (높을수록 좋음)"""
+    return {
+        'value': count / seconds if seconds > 0 else 0.0,
+        'unit': unit,
+        'better': 'higher',
+        'count': count,
+        'seconds': seconds
+    }
+
+
+@contextlib.contextmanager
+def quiet():
+    """측정 대상의 print 출력을 버림 (터미널 출력 비용이 측정값에 섞이지 않도록)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def environment() -> Dict[str, Any]:
+    """기준선과 함께 저장할 실행 환경 (다른 머신의 기준선과 비교할 때 참고용)"""
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count()
+    }
+
+
+def save_baseline(path: str, results: Dict[str, Result]):
+    """측정 결과를 기준선으로 저장 (기존 기준선의 다른 항목은 유지)"""
+    data = load_baseline(path) or {'results': {}}
+    data['results'].update(results)
+    data['environment'] = environment()
+    data['saved_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Any]]:
+    """저장된 기준선 (없으면 None)"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def change(current: Result, baseline: Result) -> Optional[float]:
+    """기준선 대비 성능 변화율 (+는 개선, -는 저하)"""
+    before, after = baseline.get('value'), current.get('value')
+    if not before or after is None:
+        return None
+    if current.get('better') == 'higher':
+        return after / before - 1.0
+    return before / after - 1.0 if after else None
+
+
+def report(results: Dict[str, Result], baseline: Optional[Dict[str, Any]] = None,
+           threshold: float = 0.15, out=sys.stdout) -> int:
+    """결과 표 출력 (기준선이 있으면 변화율 포함), threshold를 넘게 느려진 항목 수 반환"""
+    baseline_results = (baseline or {}).get('results', {})
+    width = max([len(name) for name in results] + [10]) + 2
+    header = f'{"benchmark":<{width}}{"value":>14} {"unit":<8}'
+    if baseline is not None:
+        header += f'{"baseline":>14}{"change":>10}'
+    print(header, file=out)
+    print('-' * len(header), file=out)
+
+    regressions = 0
+    for name, result in results.items():
+        line = f'{name:<{width}}{result["value"]:>14.2f} {result["unit"]:<8}'
+        if baseline is not None:
+            before = baseline_results.get(name)
+            delta = change(result, before) if before else None
+            if delta is None:
+                line += f'{"-":>14}{"new":>10}'
+            else:
+                mark = ''
+                if delta < -threshold:
+                    mark = '  REGRESSION'
+                    regressions += 1
+                line += f'{before["value"]:>14.2f}{delta:>+9.1%}{mark}'
+        print(line, file=out)
+
+    if baseline is not None:
+        saved_env = baseline.get('environment', {})
+        if saved_env and saved_env != environment():
+            print(f'\n주의: 기준선은 다른 환경에서 저장되었습니다 ({saved_env.get("platform")}, '
+                  f'CPU {saved_env.get("cpus")}개)', file=out)
+        print(f'\n{threshold:.0%} 이상 느려진 항목: {regressions}개', file=out)
+    return regressions
@@ -1,21 +1,36 @@
 from flask import Blueprint, render_template, jsonify, request, redirect, url_for, make_response, Response
 from data.wifi_data import wifi_generator
 from services.security_check import security_service
-from services.wifi_scanner import wifi_scanner
-from services.cracking_service import cracking_service
+from services.wifi_scanner import create_scanner, wifi_scanner
+from services.cracking_service import FINAL_STATUSES, cracking_service
+from services.scanner_daemon import scanner_daemon
+from services.scan_cache import scan_cache
+from services.channel_plan import parse_channels
 from utils.jwt_auth import (
     generate_access_token, 
     generate_refresh_token, 
     verify_token,
+    token_digest,
+    token_cache,
     get_token_from_request,
     get_refresh_token_from_request,
-    jwt_required
+    jwt_required,
+    revoke_token
 )
 from config import Config
 import json
+import logging
+import math
+import os
+import time
+
+logger = logging.getLogger(__name__)
 
 expert_bp = Blueprint('expert', __name__)
 
+# 더 이상 진행 상황이 바뀌지 않는 크래킹 상태 (서비스의 종료 상태 + 존재하지 않는 작업)
+CRACKING_FINAL_STATUSES = FINAL_STATUSES + ('not_found',)
+
 def login_required(f):
     """로그인 필수 데코레이터 (JWT 기반)"""
     @jwt_required
@@ -84,51 +99,82 @@ def expert_page():
 @expert_bp.route('/api/expert/scan', methods=['POST'])
 @login_required
 def expert_scan_wifi():
-    """관리자용 와이파이 스캔 API (더미 데이터 + 실제 스캔)"""
+    """관리자용 와이파이 스캔 API (더미 데이터 + 실제 스캔)
+    
+    백그라운드 스캐너 사용 시 현재 스냅샷을 즉시 반환합니다.
+    min_age=N: 스캔 세션이 N초 이상 진행된 뒤의 결과, fresh=true: 새로 한 번 훑은 결과만 반환
+    """
     try:
-        print("\n" + "=" * 60)
-        print("[API] WiFi 스캔 요청 수신")
+        data = request.get_json(silent=True) or {}
+        fresh = str(request.args.get('fresh', data.get('fresh', ''))).lower() in ('1', 'true')
+        try:
+            min_age = float(request.args.get('min_age', data.get('min_age', 0)) or 0)
+        except (TypeError, ValueError):
+            min_age = -1.0
+        if not math.isfinite(min_age) or min_age < 0:
+            return jsonify({
+                'success': False,
+                'error': 'min_age는 0 이상의 숫자여야 합니다.'
+            }), 400
+        scanner_status = None
+        source = 'daemon' if Config.WIFI_SCANNER_DAEMON else 'scan'
         
         # 더미 데이터 생성
         dummy_wifi_list = wifi_generator.generate_expert_wifi_list()
-        print(f"[API] 더미 데이터 생성: {len(dummy_wifi_list)}개")
         
         # 실제 WiFi 스캔 수행
         try:
-            print(f"[API] 실제 스캔 시작 (인터페이스: {Config.WIFI_INTERFACE}, 시간: {Config.WIFI_SCAN_DURATION}초)")
-            scanner = wifi_scanner.__class__(
-                interface=Config.WIFI_INTERFACE,
-                scan_duration=Config.WIFI_SCAN_DURATION
-            )
-            real_wifi_list = scanner.scan_wifi()
-            print(f"[API] 실제 스캔 완료: {len(real_wifi_list)}개 발견")
+            if Config.WIFI_SCANNER_DAEMON:
+                # fresh 스캔은 동시에 요청돼도 한 번만 훑고 결과를 공유 (TTL 캐시는 사용하지 않음)
+                if fresh:
+                    real_wifi_list = scan_cache.get(('fresh', min_age), lambda: scanner_daemon.snapshot(min_age=min_age, fresh=True), ttl=0)
+                else:
+                    real_wifi_list = scanner_daemon.snapshot(min_age=min_age)
+                scanner_status = scanner_daemon.status()
+            else:
+                # 어댑터가 여럿이면 채널 계획을 나눠 동시에 스캔하고 BSSID로 병합
+                scanner = create_scanner(
+                    Config.WIFI_INTERFACES,
+                    scan_duration=Config.WIFI_SCAN_DURATION,
+                    channels=parse_channels(Config.WIFI_CHANNELS)
+                )
+                # TTL 안의 결과는 재사용하고(fresh면 제외), 동시 요청은 진행 중인 airodump-ng 스캔 하나를 기다림
+                real_wifi_list = scan_cache.get(('scan', tuple(Config.WIFI_INTERFACES)), scanner.scan_wifi, ttl=0 if fresh else None)
             
             # 더미 데이터와 실제 스캔 데이터 병합
-            merged_wifi_list = scanner.merge_with_dummy(real_wifi_list, dummy_wifi_list)
-            print(f"[API] 데이터 병합 완료: 총 {len(merged_wifi_list)}개 (더미: {len(dummy_wifi_list)}, 실제: {len(real_wifi_list)})")
+            merged_wifi_list = wifi_scanner.merge_with_dummy(real_wifi_list, dummy_wifi_list)
+            logger.debug('WiFi 스캔 응답', extra={
+                'source': source, 'fresh': fresh, 'min_age': min_age,
+                'real': len(real_wifi_list), 'dummy': len(dummy_wifi_list), 'total': len(merged_wifi_list)
+            })
         except Exception as scan_error:
             # 실제 스캔 실패 시 더미 데이터만 반환
-            print(f"[API 오류] 실제 WiFi 스캔 실패: {scan_error}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('실제 WiFi 스캔 실패: %s', scan_error, extra={'source': source})
             merged_wifi_list = dummy_wifi_list
         
-        print("=" * 60 + "\n")
-        
         return jsonify({
             'success': True,
             'wifi_list': merged_wifi_list,
-            'count': len(merged_wifi_list)
+            'count': len(merged_wifi_list),
+            'scanner': scanner_status
         })
     except Exception as e:
-        print(f"[API 오류] 전체 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception('WiFi 스캔 API 오류: %s', e)
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+@expert_bp.route('/api/expert/scan/stats', methods=['GET'])
+@login_required
+def expert_scan_stats():
+    """스캔 캐시 적중/합치기/대기 시간 카운터 및 스캐너 상태 (튜닝용)"""
+    return jsonify({
+        'success': True,
+        'cache': scan_cache.stats(),
+        'scanner': scanner_daemon.status() if Config.WIFI_SCANNER_DAEMON else None
+    })
+
 @expert_bp.route('/api/expert/security-check', methods=['POST'])
 @login_required
 def security_check():
@@ -181,7 +227,7 @@ def security_check():
                 })
             except Exception as crack_error:
                 # 크래킹 시작 실패 시 시뮬레이션으로 폴백
-                print(f"크래킹 시작 실패, 시뮬레이션으로 폴백: {crack_error}")
+                logger.warning('크래킹 시작 실패, 시뮬레이션으로 폴백: %s', crack_error)
                 result = security_service.simulate_security_check(protocol)
                 return jsonify({
                     'success': True,
@@ -200,9 +246,53 @@ def security_check():
             'error': str(e)
         }), 500
 
+@expert_bp.route('/api/expert/crack-capture', methods=['POST'])
+@login_required
+def crack_capture():
+    """저장된 캡처 파일 크래킹 API (무선 어댑터 없이 내장 엔진 사용)"""
+    try:
+        data = request.get_json() or {}
+        cap_file = data.get('cap_file')
+        
+        if not cap_file:
+            return jsonify({
+                'success': False,
+                'error': 'cap_file이 필요합니다.'
+            }), 400
+        
+        # cap_files 디렉토리 밖의 파일 접근 차단
+        cap_file_path = os.path.join(Config.CAPTURE_FILES_DIR, os.path.basename(cap_file))
+        if not os.path.isfile(cap_file_path):
+            return jsonify({
+                'success': False,
+                'error': f'캡처 파일을 찾을 수 없습니다: {cap_file}'
+            }), 404
+        
+        cracking_id = cracking_service.start_offline_cracking(
+            cap_file_path,
+            bssid=data.get('bssid'),
+            ssid=data.get('ssid')
+        )
+        
+        return jsonify({
+            'success': True,
+            'cracking_id': cracking_id,
+            'message': '크래킹을 시작했습니다.'
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @expert_bp.route('/expert/logout', methods=['POST', 'GET'])
 def logout():
     """로그아웃"""
+    # 캐시된 검증 결과가 남지 않도록 요청에 실린 토큰을 모두 폐기
+    revoke_token(get_token_from_request())
+    revoke_token(request.cookies.get('access_token'))
+    revoke_token(request.cookies.get('refresh_token'))
+    
     response = make_response(redirect(url_for('main.landing')))
     
     # 쿠키에서 토큰 삭제
@@ -237,9 +327,10 @@ def refresh_token():
             'error': '유효하지 않거나 만료된 Refresh Token입니다.'
         }), 401
     
-    # 새로운 Access Token 생성
+    # 새로운 Access Token 생성 (쿠키의 이전 Access Token은 폐기)
     username = payload.get('username')
     new_access_token = generate_access_token(username, Config.JWT_SECRET_KEY)
+    revoke_token(request.cookies.get('access_token'))
     
     response = jsonify({
         'success': True,
@@ -266,15 +357,141 @@ def cracking_progress():
         
         progress = cracking_service.get_progress(cracking_id)
         
-        # 크래킹이 완료되었거나 실패한 경우 결과도 포함
-        result = None
-        if progress.get('status') in ['completed', 'failed', 'error']:
-            result = cracking_service.get_result(cracking_id)
+        # 크래킹이 완료되었거나 실패한 경우 결과도 포함 (final: 클라이언트가 종료 상태 목록을 따로 두지 않도록)
+        final = progress.get('status') in CRACKING_FINAL_STATUSES
+        result = cracking_service.get_result(cracking_id) if final else None
         
         return jsonify({
             'success': True,
             'progress': progress,
-            'result': result
+            'result': result,
+            'final': final
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@expert_bp.route('/api/expert/cracking-progress/stream', methods=['GET'])
+@login_required
+def cracking_progress_stream():
+    """크래킹 진행 상황 SSE 스트림 (상태가 바뀔 때만 전송, Last-Event-ID로 이어받기)
+
+    토큰은 연결할 때만 검증되므로 토큰이 만료되거나 폐기되면 스트림을 닫습니다.
+    클라이언트는 재연결이 401로 실패하면 토큰을 갱신하고 마지막 이벤트부터 다시 연결합니다.
+    """
+    cracking_id = request.args.get('cracking_id')
+    
+    if not cracking_id:
+        return jsonify({
+            'success': False,
+            'error': 'cracking_id가 필요합니다.'
+        }), 400
+    
+    # 연결할 때 검증한 토큰의 만료 시각과 digest (요청 컨텍스트가 끝난 뒤 generator에서 확인)
+    token = get_token_from_request()
+    payload = verify_token(token, Config.JWT_SECRET_KEY, 'access') or {}
+    expires_at = payload.get('exp') if isinstance(payload.get('exp'), (int, float)) else 0
+    digest = token_digest(token)
+    
+    def authorized() -> bool:
+        return time.time() < expires_at and not token_cache.is_revoked(digest)
+    
+    board = cracking_service.cracking_progress
+    # EventSource 자동 재연결은 헤더로, 수동 재연결(토큰 갱신 후)은 쿼리로 마지막 이벤트 ID 전달
+    last_version = board.parse_event_id(request.headers.get('Last-Event-ID') or request.args.get('last_event_id'))
+    
+    def event(version: int, progress: dict) -> str:
+        final = progress.get('status') in CRACKING_FINAL_STATUSES
+        result = cracking_service.get_result(cracking_id) if final else None
+        data = json.dumps({'success': True, 'progress': progress, 'result': result, 'final': final}, ensure_ascii=False)
+        return f'id: {board.event_id(version)}\nevent: progress\ndata: {data}\n\n'
+    
+    def generate():
+        version = last_version
+        
+        # 존재하지 않는 작업은 한 번 알리고 종료
+        if cracking_id not in board:
+            yield event(version, cracking_service.get_progress(cracking_id))
+            return
+        
+        while True:
+            # 토큰 만료 시각을 넘겨 기다리지 않음
+            timeout = min(Config.CRACKING_STREAM_KEEPALIVE, max(expires_at - time.time(), 0))
+            change = board.wait_for_change(cracking_id, version, timeout)
+            if not authorized():
+                logger.debug('토큰 만료/폐기로 진행 상황 스트림 종료', extra={'cracking_id': cracking_id})
+                return
+            if change is None:
+                # 주석 줄로 연결 유지 (끊긴 클라이언트는 여기서 감지되어 generator 종료)
+                yield ': keepalive\n\n'
+                continue
+            version, progress = change
+            yield event(version, progress)
+            if progress.get('status') in CRACKING_FINAL_STATUSES:
+                return
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@expert_bp.route('/api/expert/cracking-cancel', methods=['POST'])
+@login_required
+def cracking_cancel():
+    """크래킹 작업 취소 API (대기 중이면 큐에서 제거, 실행 중이면 프로세스 트리 종료)"""
+    try:
+        data = request.get_json() or {}
+        cracking_id = data.get('cracking_id')
+        
+        if not cracking_id:
+            return jsonify({
+                'success': False,
+                'error': 'cracking_id가 필요합니다.'
+            }), 400
+        
+        if not cracking_service.cancel_cracking(cracking_id):
+            return jsonify({
+                'success': False,
+                'error': '대기 또는 실행 중인 작업이 아닙니다.'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'cracking_id': cracking_id,
+            'message': '크래킹을 취소했습니다.'
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@expert_bp.route('/api/expert/cracking-resume', methods=['POST'])
+@login_required
+def cracking_resume():
+    """중단된 크래킹 작업 재개 API (체크포인트 이후 구간만 진행)"""
+    try:
+        data = request.get_json() or {}
+        cracking_id = data.get('cracking_id')
+        
+        if not cracking_id:
+            return jsonify({
+                'success': False,
+                'error': 'cracking_id가 필요합니다.'
+            }), 400
+        
+        if not cracking_service.resume_cracking(cracking_id):
+            return jsonify({
+                'success': False,
+                'error': '재개할 수 있는 체크포인트가 없거나 이미 실행 중입니다.'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'cracking_id': cracking_id,
+            'message': '크래킹을 재개했습니다.'
         })
     except Exception as e:
         return jsonify({
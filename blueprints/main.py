@@ -1,4 +1,6 @@
-from flask import Blueprint, render_template
+from flask import Blueprint, Response, abort, render_template
+from config import Config
+from services.metrics import CONTENT_TYPE, registry
 
 main_bp = Blueprint('main', __name__)
 
@@ -6,3 +8,10 @@ main_bp = Blueprint('main', __name__)
 def landing():
     """랜딩 페이지"""
     return render_template('landing.html')
+
+@main_bp.route('/metrics')
+def metrics():
+    """스캔/크래킹 단계별 메트릭 (Prometheus 텍스트 형식)"""
+    if not Config.METRICS_ENABLED:
+        abort(404)
+    return Response(registry.render(), content_type=CONTENT_TYPE)
@@ -10,13 +10,56 @@ class Config:
     JWT_ALGORITHM = 'HS256'
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=15)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=7)
+    JWT_CACHE_SIZE = int(os.environ.get('JWT_CACHE_SIZE', 1024))  # 검증된 토큰 payload 캐시 크기 (0이면 매번 서명 검증)
+    
+    # 로그 설정
+    LOG_LEVEL = os.environ.get('LOG_LEVEL') or 'INFO'  # 기본 로그 레벨
+    LOG_LEVELS = os.environ.get('LOG_LEVELS') or ''  # 모듈별 레벨 (예: 'services.wifi_scanner=DEBUG,werkzeug=WARNING')
+    LOG_FORMAT = os.environ.get('LOG_FORMAT') or 'text'  # 'text' (메시지 + key=value) 또는 'json' (한 줄 JSON)
+    LOG_QUEUE_SIZE = int(os.environ.get('LOG_QUEUE_SIZE', 10000))  # 출력 대기 레코드 수 상한 (가득 차면 버림, 요청 스레드는 막지 않음)
     
     # WiFi 스캔 설정
     WIFI_INTERFACE = os.environ.get('WIFI_INTERFACE') or 'wlan0'  # wlan0으로 고정
+    WIFI_INTERFACES = [name.strip() for name in (os.environ.get('WIFI_INTERFACES') or '').split(',') if name.strip()] or [WIFI_INTERFACE]  # 스캔 어댑터 목록 (쉼표 구분, 둘 이상이면 채널 계획을 나눠 동시에 스캔)
+    WIFI_CHANNELS = os.environ.get('WIFI_CHANNELS') or ''  # 다중 어댑터 스캔 채널 계획 (쉼표 구분, 비우면 2.4GHz 1~13 + 5GHz 전체)
     WIFI_SCAN_DURATION = int(os.environ.get('WIFI_SCAN_DURATION', 5))  # 스캔 지속 시간 5초
-    SUDO_PASSWORD = os.environ.get('SUDO_PASSWORD') or 'kali'  # sudo 비밀번호
+    WIFI_SCANNER_DAEMON = os.environ.get('WIFI_SCANNER_DAEMON', '1') == '1'  # 백그라운드 스캐너 사용 여부 (스캔 API는 스냅샷 반환)
+    WIFI_SCAN_CACHE_TTL = float(os.environ.get('WIFI_SCAN_CACHE_TTL', 10))  # 스캔 결과 재사용 시간 (초, 동시 요청은 진행 중인 스캔 하나를 공유)
+    WIFI_SCAN_STALE_AFTER = int(os.environ.get('WIFI_SCAN_STALE_AFTER', 120))  # 이 시간(초) 동안 보이지 않은 AP는 스냅샷에서 제외
+    RADIO_CACHE_TTL = float(os.environ.get('RADIO_CACHE_TTL', 5))  # 무선 인터페이스 상태 캐시 시간 (초, netlink 링크 이벤트를 받을 수 있으면 이벤트 때만 갱신)
+    RADIO_PREWARM = os.environ.get('RADIO_PREWARM', '1') == '1'  # 앱 시작 시 백그라운드에서 모니터 모드 미리 준비
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1') == '1'  # /metrics 엔드포인트 (스캔/크래킹 단계별 Prometheus 메트릭) 사용 여부
+    SUDO_PASSWORD = os.environ.get('SUDO_PASSWORD') or 'kali'  # sudo 비밀번호 (권한 도우미가 없을 때만 사용)
+    PRIV_HELPER_SOCKET = os.environ.get('PRIV_HELPER_SOCKET', '/run/wisafe/helper.sock')  # 권한 도우미 Unix 소켓 (python -m utils.privhelper, 없으면 sudo로 실행)
+    TOOL_OUTPUT_DIR = os.environ.get('TOOL_OUTPUT_DIR') or '/tmp/wisafe'  # 스캔 CSV/캡처 파일 출력 루트 (세션별 하위 디렉토리, 권한 도우미를 쓰면 도우미 소유)
+    WIRELESS_TOOLS = os.environ.get('WIRELESS_TOOLS') or 'real'  # 'real' 또는 'fake' (cap_files를 재생하는 stand-in, 어댑터/sudo 불필요)
+    FAKE_TOOLS_DIR = os.environ.get('FAKE_TOOLS_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools', 'fake')  # stand-in 실행 파일 경로
+    FAKE_TOOLS_RATE = float(os.environ.get('FAKE_TOOLS_RATE', 5))  # stand-in 재생 속도 (초당 AP 공개 수 / 캡처 청크 수 / 진행 출력 줄 수)
     
     # 크래킹 설정
     CRACKING_WORDLIST_PATH = os.environ.get('CRACKING_WORDLIST_PATH') or '/usr/share/wordlists/rockyou.txt'
-    CRACKING_TIMEOUT = int(os.environ.get('CRACKING_TIMEOUT', 300))  # 크래킹 타임아웃 (초)
-    CRACKING_PROGRESS_POLL_INTERVAL = int(os.environ.get('CRACKING_PROGRESS_POLL_INTERVAL', 2))  # 진행 상황 조회 간격 (초)
\ No newline at end of file
+    CRACKING_TIMEOUT = int(os.environ.get('CRACKING_TIMEOUT', 300))  # 작업당 실행 시간 제한 (초, 0이면 무제한)
+    CRACKING_MAX_JOBS = int(os.environ.get('CRACKING_MAX_JOBS', 2))  # 동시에 실행할 최대 크래킹 작업 수 (나머지는 우선순위 큐에서 대기)
+    CRACKING_PROGRESS_POLL_INTERVAL = int(os.environ.get('CRACKING_PROGRESS_POLL_INTERVAL', 2))  # 진행 상황 조회 간격 (초)
+    CRACKING_STREAM_KEEPALIVE = int(os.environ.get('CRACKING_STREAM_KEEPALIVE', 15))  # 진행 상황 SSE 스트림 keep-alive 간격 (초)
+    CRACKING_STATE_DIR = os.environ.get('CRACKING_STATE_DIR') or '/var/tmp/wisafe_jobs'  # 크래킹 작업 체크포인트 저장 경로
+    CRACKING_CHECKPOINT_INTERVAL = int(os.environ.get('CRACKING_CHECKPOINT_INTERVAL', 10))  # 체크포인트 저장 간격 (초)
+    CRACKING_AUTO_RESUME = os.environ.get('CRACKING_AUTO_RESUME', '0') == '1'  # 앱 시작 시 중단된 작업 자동 재개
+    CRACKING_WPA_CAPTURE_TIMEOUT = int(os.environ.get('CRACKING_WPA_CAPTURE_TIMEOUT', 60))  # 핸드셰이크 캡처 대기 시간 (초, 핸드셰이크가 잡히면 즉시 종료)
+    CRACKING_WEP_CAPTURE_TIMEOUT = int(os.environ.get('CRACKING_WEP_CAPTURE_TIMEOUT', 30))  # WEP IV 수집 대기 시간 (초, 충분한 IV가 모이면 즉시 종료)
+    CRACKING_CAPTURE_GRACE = int(os.environ.get('CRACKING_CAPTURE_GRACE', 10))  # 대기 시간이 지나도 최근 이 시간(초) 안에 EAPOL/IV가 늘었으면 계속 수집
+    CRACKING_CAPTURE_MAX_WAIT = int(os.environ.get('CRACKING_CAPTURE_MAX_WAIT', 300))  # 계속 수집하더라도 넘지 않는 최대 캡처 시간 (초)
+    CRACKING_WEP_MIN_IVS = int(os.environ.get('CRACKING_WEP_MIN_IVS', 20000))  # aircrack-ng 엔진에서 수집을 멈출 IV 수 (내장 엔진은 키를 찾는 즉시 종료)
+    CRACKING_WPS_CAPTURE_TIMEOUT = int(os.environ.get('CRACKING_WPS_CAPTURE_TIMEOUT', 30))  # WPS 등록 교환(M1~M3) 캡처 대기 시간 (초, 못 잡으면 WPA 사전 공격으로 전환)
+    CRACKING_WPS_SEED_WINDOW = int(os.environ.get('CRACKING_WPS_SEED_WINDOW', 172800))  # Pixie-Dust glibc 시간 시드 탐색 범위 (캡처 시각 ±초, 부팅 후 0~초)
+    WORDLIST_INDEX_DIR = os.environ.get('WORDLIST_INDEX_DIR') or '/var/tmp/wisafe_wordlist_index'  # wordlist 옆에 쓸 수 없을 때 인덱스 저장 경로
+    CRACKING_ENGINE = os.environ.get('CRACKING_ENGINE') or 'aircrack'  # 'aircrack' 또는 'native' (내장 프로세스 풀 엔진)
+    CRACKING_WORKERS = int(os.environ.get('CRACKING_WORKERS', 0))  # 내장 엔진 워커 수 (0이면 CPU 코어 수)
+    CRACKING_BATCH_SIZE = int(os.environ.get('CRACKING_BATCH_SIZE', 256))  # 워커 호출당 후보 수
+    CRACKING_PMK_BACKEND = os.environ.get('CRACKING_PMK_BACKEND') or 'hashlib'  # PMK 유도 백엔드: 'hashlib' 또는 'numpy'
+    CRACKING_NUMPY_LANES = int(os.environ.get('CRACKING_NUMPY_LANES', 8192))  # numpy 백엔드 배치당 후보 수
+    PMK_CACHE_ENABLED = os.environ.get('PMK_CACHE_ENABLED', '1') == '1'  # SSID별 PMK 캐시 사용 여부
+    PMK_CACHE_DIR = os.environ.get('PMK_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'wisafe', 'pmk')  # PMK 캐시 저장 경로 (재부팅 후에도 유지, 소유자 전용 0700 디렉토리)
+    PMK_CACHE_MAX_ENTRIES_PER_SSID = int(os.environ.get('PMK_CACHE_MAX_ENTRIES_PER_SSID', 500000))  # SSID별 최대 PMK 수 (초과 시 LRU 제거)
+    PMK_CACHE_MAX_SSIDS = int(os.environ.get('PMK_CACHE_MAX_SSIDS', 64))  # 유지할 최대 SSID 테이블 수 (초과 시 LRU 제거)
+    CAPTURE_FILES_DIR = os.environ.get('CAPTURE_FILES_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cap_files')  # 오프라인 분석용 캡처 파일 경로
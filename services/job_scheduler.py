@@ -0,0 +1,230 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 작업 우선순위 (작을수록 먼저 실행)
+PRIORITY_INTERACTIVE = 0   # 전문가 화면에서 요청한 보안 점검
+PRIORITY_OFFLINE = 10      # 저장된 캡처 파일 분석
+PRIORITY_RESUME = 20       # 체크포인트에서 재개한 작업
+
+# 작업 상태
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+
+# 취소 사유
+CANCEL_USER = 'cancelled'
+CANCEL_TIMEOUT = 'timeout'
+
+
+class Job:
+    """스케줄러 작업 (취소 이벤트, 실행 예산, 취소 시 정리 함수 포함)"""
+
+    def __init__(self, job_id: str, func: Callable[..., Any], args: Tuple[Any, ...], priority: int,
+                 budget: Optional[float], resource: Optional[str]):
+        self.id = job_id
+        self.func = func
+        self.args = args
+        self.priority = priority
+        self.budget = budget
+        self.resource = resource
+        self.state = JOB_QUEUED
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.deadline: Optional[float] = None
+        self.cancel_event = threading.Event()
+        self.cancel_reason: Optional[str] = None
+        self._cleanups: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def remaining(self) -> Optional[float]:
+        """남은 실행 예산 (초, 예산 없음 또는 시작 전이면 None)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.time())
+
+    def wait(self, timeout: float) -> bool:
+        """time.sleep 대신 사용 (취소되면 즉시 True 반환)"""
+        return self.cancel_event.wait(timeout)
+
+    def add_cleanup(self, cleanup: Callable[[], None]):
+        """취소 시 실행할 정리 함수 등록 (이미 취소되었으면 즉시 실행)"""
+        with self._lock:
+            if not self.cancelled:
+                self._cleanups.append(cleanup)
+                return
+        cleanup()
+
+    def cancel(self, reason: str = CANCEL_USER) -> bool:
+        """작업 취소 (등록된 정리 함수 실행, 이미 취소되었으면 False)"""
+        with self._lock:
+            if self.cancelled:
+                return False
+            self.cancel_reason = reason
+            self.cancel_event.set()
+            cleanups, self._cleanups = self._cleanups, []
+
+        for cleanup in cleanups:
+            try:
+                cleanup()
+            except Exception as e:
+                logger.warning('작업 정리 오류 (%s): %s', self.id, e)
+        return True
+
+
+class JobScheduler:
+    """우선순위 큐 기반 크래킹 작업 스케줄러
+
+    최대 max_workers개 작업만 동시에 실행하고 나머지는 우선순위 순으로 대기합니다.
+    같은 resource(무선 인터페이스 등)를 사용하는 작업은 한 번에 하나만 실행되며,
+    실행 예산(budget)을 넘긴 작업은 감시 스레드가 취소합니다.
+    """
+
+    def __init__(self, max_workers: int = 2, budget: Optional[float] = None):
+        """
+        Args:
+            max_workers: 동시에 실행할 최대 작업 수
+            budget: 작업당 기본 실행 예산 (초, None이면 무제한)
+        """
+        self.max_workers = max(1, max_workers)
+        self.budget = budget
+        self._heap: List[Tuple[int, int, Job]] = []
+        self._seq = itertools.count()
+        self._jobs: Dict[str, Job] = {}
+        self._busy_resources = set()
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+
+    def _ensure_threads(self):
+        """첫 작업 제출 시 워커/감시 스레드 시작"""
+        if self._threads:
+            return
+        for i in range(self.max_workers):
+            thread = threading.Thread(target=self._worker, name=f'cracking-worker-{i}')
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+        watchdog = threading.Thread(target=self._watchdog, name='cracking-watchdog')
+        watchdog.daemon = True
+        watchdog.start()
+        self._threads.append(watchdog)
+
+    def submit(self, job_id: str, func: Callable[..., Any], args: Tuple[Any, ...] = (),
+               priority: int = PRIORITY_INTERACTIVE, resource: Optional[str] = None,
+               budget: Optional[float] = None) -> Job:
+        """작업 제출 (같은 ID의 작업이 대기/실행 중이면 기존 작업 반환)"""
+        with self._cond:
+            existing = self._jobs.get(job_id)
+            if existing is not None:
+                return existing
+
+            job = Job(job_id, func, args, priority, budget if budget is not None else self.budget, resource)
+            self._jobs[job_id] = job
+            heapq.heappush(self._heap, (priority, next(self._seq), job))
+            self._ensure_threads()
+            self._cond.notify_all()
+            return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """대기/실행 중인 작업 조회"""
+        with self._cond:
+            return self._jobs.get(job_id)
+
+    def position(self, job_id: str) -> Optional[int]:
+        """대기 순번 (0이면 다음 실행, 대기 중이 아니면 None)"""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None or job.state != JOB_QUEUED:
+                return None
+            return sum(1 for _, _, other in self._heap
+                       if other.state == JOB_QUEUED and not other.cancelled and (other.priority, other.submitted_at) < (job.priority, job.submitted_at))
+
+    def cancel(self, job_id: str, reason: str = CANCEL_USER) -> Optional[Job]:
+        """작업 취소 (대기 중이면 큐에서 제거, 실행 중이면 정리 함수로 프로세스 종료)"""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job.state == JOB_QUEUED:
+                # 힙에서는 꺼낼 때 건너뜀
+                job.state = JOB_DONE
+                del self._jobs[job_id]
+        job.cancel(reason)
+        with self._cond:
+            self._cond.notify_all()
+        return job
+
+    def stats(self) -> Dict[str, int]:
+        """대기/실행 중인 작업 수"""
+        with self._cond:
+            states = [job.state for job in self._jobs.values()]
+        return {
+            'queued': states.count(JOB_QUEUED),
+            'running': states.count(JOB_RUNNING),
+            'max_workers': self.max_workers
+        }
+
+    def _take(self) -> Optional[Job]:
+        """실행 가능한 최우선 작업 꺼내기 (사용 중인 resource의 작업은 보류)"""
+        deferred = []
+        job = None
+        while self._heap:
+            _, _, candidate = heapq.heappop(self._heap)
+            if candidate.state != JOB_QUEUED:
+                continue
+            if candidate.resource is not None and candidate.resource in self._busy_resources:
+                deferred.append((candidate.priority, next(self._seq), candidate))
+                continue
+            job = candidate
+            break
+        for item in deferred:
+            heapq.heappush(self._heap, item)
+        return job
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                job = self._take()
+                while job is None:
+                    self._cond.wait()
+                    job = self._take()
+                job.state = JOB_RUNNING
+                job.started_at = time.time()
+                if job.budget:
+                    job.deadline = job.started_at + job.budget
+                if job.resource is not None:
+                    self._busy_resources.add(job.resource)
+
+            try:
+                job.func(*job.args)
+            except Exception as e:
+                logger.exception('작업 실행 오류 (%s): %s', job.id, e)
+            finally:
+                with self._cond:
+                    job.state = JOB_DONE
+                    self._busy_resources.discard(job.resource)
+                    if self._jobs.get(job.id) is job:
+                        del self._jobs[job.id]
+                    self._cond.notify_all()
+
+    def _watchdog(self):
+        """실행 예산을 넘긴 작업 취소 (1초 간격)"""
+        while True:
+            with self._cond:
+                self._cond.wait(timeout=1.0)
+                now = time.time()
+                expired = [
+                    job for job in self._jobs.values()
+                    if job.state == JOB_RUNNING and job.deadline is not None and now >= job.deadline
+                ]
+            for job in expired:
+                job.cancel(CANCEL_TIMEOUT)
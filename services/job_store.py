@@ -0,0 +1,113 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class RangeSet:
+    """완료된 wordlist 구간 [start, end) 집합 (겹치거나 맞닿은 구간은 병합)"""
+
+    def __init__(self, ranges: Optional[List[Tuple[int, int]]] = None):
+        self._ranges: List[List[int]] = []
+        for start, end in ranges or []:
+            self.add(start, end)
+
+    def add(self, start: int, end: int):
+        """구간 추가"""
+        if start >= end:
+            return
+        merged = []
+        placed = False
+        for current in self._ranges:
+            if current[1] < start:
+                merged.append(current)
+            elif end < current[0]:
+                if not placed:
+                    merged.append([start, end])
+                    placed = True
+                merged.append(current)
+            else:
+                start = min(start, current[0])
+                end = max(end, current[1])
+        if not placed:
+            merged.append([start, end])
+        self._ranges = merged
+
+    def covered(self) -> int:
+        """완료된 줄 수"""
+        return sum(end - start for start, end in self._ranges)
+
+    def missing(self, total: int) -> List[Tuple[int, int]]:
+        """[0, total) 중 아직 처리하지 않은 구간"""
+        gaps = []
+        position = 0
+        for start, end in self._ranges:
+            if start > position:
+                gaps.append((position, min(start, total)))
+            position = max(position, end)
+            if position >= total:
+                break
+        if position < total:
+            gaps.append((position, total))
+        return [(start, end) for start, end in gaps if start < end]
+
+    def to_list(self) -> List[List[int]]:
+        return [list(current) for current in self._ranges]
+
+
+class JobStore:
+    """크래킹 작업 체크포인트 저장소 (작업당 JSON 파일 하나, 원자적 교체)"""
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: 체크포인트 파일 저장 디렉토리
+        """
+        self.directory = directory
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, cracking_id: str) -> str:
+        safe_id = ''.join(c if c.isalnum() or c in '-_' else '_' for c in cracking_id)
+        return os.path.join(self.directory, f'{safe_id}.json')
+
+    def save(self, cracking_id: str, state: Dict[str, Any]):
+        """체크포인트 저장 (임시 파일에 쓴 뒤 교체하므로 중간에 죽어도 이전 상태 유지)"""
+        state = dict(state, cracking_id=cracking_id, updated_at=time.time())
+        path = self._path(cracking_id)
+        tmp_path = path + '.tmp'
+        with self._lock:
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+
+    def load(self, cracking_id: str) -> Optional[Dict[str, Any]]:
+        """체크포인트 조회"""
+        try:
+            with open(self._path(cracking_id)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def delete(self, cracking_id: str):
+        """체크포인트 삭제 (작업 종료 시)"""
+        try:
+            os.remove(self._path(cracking_id))
+        except OSError:
+            pass
+
+    def list(self) -> List[Dict[str, Any]]:
+        """저장된 모든 체크포인트"""
+        states = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as f:
+                    states.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return states
@@ -0,0 +1,363 @@
+import mmap
+import os
+import struct
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+# 링크 타입 (DLT)
+LINKTYPE_IEEE802_11 = 105
+LINKTYPE_IEEE802_11_PRISM = 119
+LINKTYPE_IEEE802_11_RADIOTAP = 127
+LINKTYPE_IEEE802_11_AVS = 163
+LINKTYPE_PPI = 192
+
+# classic pcap 매직 넘버
+_PCAP_MAGIC_USEC = 0xA1B2C3D4
+_PCAP_MAGIC_NSEC = 0xA1B23C4D
+
+# pcapng 블록 타입
+_PCAPNG_SHB = 0x0A0D0D0A
+_PCAPNG_IDB = 0x00000001
+_PCAPNG_OPB = 0x00000002
+_PCAPNG_SPB = 0x00000003
+_PCAPNG_EPB = 0x00000006
+_PCAPNG_BYTE_ORDER_MAGIC = 0x1A2B3C4D
+
+_U16_LE = struct.Struct('<H')
+_U32_LE = struct.Struct('<I')
+_U32_BE = struct.Struct('>I')
+
+
+class Frame(NamedTuple):
+    """캡처 레코드 하나 (data는 mmap 위의 memoryview 슬라이스)"""
+    timestamp: float
+    linktype: int
+    data: memoryview
+    orig_len: int
+
+    @property
+    def dot11(self) -> Optional[memoryview]:
+        """radiotap/PPI 등 캡처 헤더와 FCS를 제외한 802.11 프레임"""
+        return dot11_payload(self.linktype, self.data)
+
+
+def _radiotap_has_fcs(data: memoryview) -> bool:
+    """radiotap Flags 필드의 FCS 포함 비트 확인"""
+    if len(data) < 8:
+        return False
+    present = _U32_LE.unpack_from(data, 4)[0]
+    if not present & 0x2:
+        return False
+
+    # 확장 present 비트맵 건너뛰기
+    offset = 8
+    word = present
+    while word & 0x80000000:
+        if offset + 4 > len(data):
+            return False
+        word = _U32_LE.unpack_from(data, offset)[0]
+        offset += 4
+
+    # TSFT (8바이트, 8바이트 정렬)가 Flags 앞에 위치
+    if present & 0x1:
+        offset = ((offset + 7) & ~7) + 8
+
+    return offset < len(data) and bool(data[offset] & 0x10)
+
+
+def _ppi_has_fcs(data: memoryview, header_len: int) -> bool:
+    """PPI 802.11-Common 필드의 FCS 포함 플래그 확인"""
+    offset = 8
+    while offset + 4 <= header_len:
+        field_type = _U16_LE.unpack_from(data, offset)[0]
+        field_len = _U16_LE.unpack_from(data, offset + 2)[0]
+        if field_type == 2 and field_len >= 10:
+            return bool(_U16_LE.unpack_from(data, offset + 12)[0] & 0x1)
+        offset += 4 + field_len
+    return False
+
+
+def dot11_payload(linktype: int, data: memoryview) -> Optional[memoryview]:
+    """링크 타입별 캡처 헤더를 제거한 802.11 프레임 반환 (복사 없음)"""
+    length = len(data)
+
+    if linktype == LINKTYPE_IEEE802_11:
+        return data
+
+    if linktype == LINKTYPE_IEEE802_11_RADIOTAP:
+        if length < 4:
+            return None
+        header_len = _U16_LE.unpack_from(data, 2)[0]
+        if header_len > length:
+            return None
+        end = length - 4 if _radiotap_has_fcs(data) else length
+        return data[header_len:end]
+
+    if linktype == LINKTYPE_PPI:
+        if length < 8:
+            return None
+        header_len = _U16_LE.unpack_from(data, 2)[0]
+        if header_len > length:
+            return None
+        end = length - 4 if _ppi_has_fcs(data, header_len) else length
+        return data[header_len:end]
+
+    if linktype == LINKTYPE_IEEE802_11_PRISM:
+        if length < 8:
+            return None
+        header_len = _U32_LE.unpack_from(data, 4)[0]
+        return data[header_len:] if header_len <= length else None
+
+    if linktype == LINKTYPE_IEEE802_11_AVS:
+        if length < 8:
+            return None
+        header_len = _U32_BE.unpack_from(data, 4)[0]
+        return data[header_len:] if header_len <= length else None
+
+    return None
+
+
+class PcapReader:
+    """mmap 기반 pcap/pcapng 리더
+
+    프레임은 파일 매핑 위의 memoryview 슬라이스로 반환되므로 프레임당 복사가 없고,
+    페이지 캐시만 사용하므로 수 GB 캡처도 일정한 메모리로 순회할 수 있습니다.
+    반환된 memoryview는 리더를 닫기 전까지만 유효합니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 캡처 파일 경로 (.cap, .pcap, .pcapng)
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = None
+        self._view = memoryview(b'')
+
+        size = os.fstat(self._file.fileno()).st_size
+        if size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(self._mmap, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                self._mmap.madvise(mmap.MADV_SEQUENTIAL)
+            self._view = memoryview(self._mmap)
+
+        self.format, self.linktype = self._detect_format()
+
+    def _detect_format(self) -> Tuple[str, Optional[int]]:
+        """파일 헤더로 pcap/pcapng 형식 판별"""
+        view = self._view
+        if len(view) < 4:
+            raise ValueError(f'캡처 파일이 너무 짧습니다: {self.path}')
+
+        magic_le = _U32_LE.unpack_from(view, 0)[0]
+        magic_be = _U32_BE.unpack_from(view, 0)[0]
+
+        if magic_le == _PCAPNG_SHB:
+            return 'pcapng', None
+
+        for magic, endian in ((magic_le, '<'), (magic_be, '>')):
+            if magic in (_PCAP_MAGIC_USEC, _PCAP_MAGIC_NSEC):
+                if len(view) < 24:
+                    raise ValueError(f'pcap 헤더가 손상되었습니다: {self.path}')
+                self._endian = endian
+                self._ts_scale = 1e-9 if magic == _PCAP_MAGIC_NSEC else 1e-6
+                linktype = struct.unpack_from(endian + 'I', view, 20)[0] & 0x0FFFFFFF
+                return 'pcap', linktype
+
+        raise ValueError(f'지원하지 않는 캡처 형식입니다: {self.path}')
+
+    def __iter__(self) -> Iterator[Frame]:
+        return self.frames()
+
+    def frames(self) -> Iterator[Frame]:
+        """모든 캡처 레코드 순회"""
+        if self.format == 'pcap':
+            return self._iter_pcap()
+        return self._iter_pcapng()
+
+    def dot11_frames(self) -> Iterator[Tuple[float, memoryview]]:
+        """(타임스탬프, 802.11 프레임) 순회 - 캡처 헤더/FCS 제거"""
+        for timestamp, linktype, data, _ in self.frames():
+            dot11 = dot11_payload(linktype, data)
+            if dot11 is not None and len(dot11) >= 10:
+                yield timestamp, dot11
+
+    def _iter_pcap(self) -> Iterator[Frame]:
+        """classic pcap 레코드 순회"""
+        view = self._view
+        size = len(view)
+        unpack = struct.Struct(self._endian + 'IIII').unpack_from
+        scale = self._ts_scale
+        linktype = self.linktype
+        offset = 24
+
+        while offset + 16 <= size:
+            ts_sec, ts_frac, incl_len, orig_len = unpack(view, offset)
+            offset += 16
+            end = offset + incl_len
+            if end > size:
+                # 기록 중이거나 잘린 마지막 레코드
+                break
+            yield Frame(ts_sec + ts_frac * scale, linktype, view[offset:end], orig_len)
+            offset = end
+
+    def _iter_pcapng(self) -> Iterator[Frame]:
+        """pcapng 블록 순회 (SHB/IDB/EPB/SPB/OPB)"""
+        view = self._view
+        size = len(view)
+        endian = '<'
+        header = struct.Struct('<II')
+        interfaces = []  # [(linktype, snaplen, 초당 타임스탬프 단위)]
+        offset = 0
+
+        while offset + 12 <= size:
+            block_type = _U32_LE.unpack_from(view, offset)[0]
+
+            if block_type == _PCAPNG_SHB:
+                # 섹션마다 바이트 순서와 인터페이스 목록이 새로 시작됨
+                bom = _U32_LE.unpack_from(view, offset + 8)[0]
+                endian = '<' if bom == _PCAPNG_BYTE_ORDER_MAGIC else '>'
+                header = struct.Struct(endian + 'II')
+                interfaces = []
+
+            block_type, block_len = header.unpack_from(view, offset)
+            if block_len < 12 or offset + block_len > size:
+                break
+            body = offset + 8
+
+            if block_type == _PCAPNG_EPB:
+                iface, ts_high, ts_low, cap_len, orig_len = struct.unpack_from(endian + 'IIIII', view, body)
+                if iface < len(interfaces):
+                    linktype, _, units = interfaces[iface]
+                    data_start = body + 20
+                    yield Frame(((ts_high << 32) | ts_low) / units, linktype,
+                                view[data_start:data_start + cap_len], orig_len)
+            elif block_type == _PCAPNG_SPB:
+                if interfaces:
+                    linktype, snaplen, _ = interfaces[0]
+                    orig_len = struct.unpack_from(endian + 'I', view, body)[0]
+                    cap_len = min(orig_len, block_len - 16)
+                    if snaplen:
+                        cap_len = min(cap_len, snaplen)
+                    data_start = body + 4
+                    yield Frame(0.0, linktype, view[data_start:data_start + cap_len], orig_len)
+            elif block_type == _PCAPNG_OPB:
+                iface, _, ts_high, ts_low, cap_len, orig_len = struct.unpack_from(endian + 'HHIIII', view, body)
+                if iface < len(interfaces):
+                    linktype, _, units = interfaces[iface]
+                    data_start = body + 20
+                    yield Frame(((ts_high << 32) | ts_low) / units, linktype,
+                                view[data_start:data_start + cap_len], orig_len)
+            elif block_type == _PCAPNG_IDB:
+                linktype, _, snaplen = struct.unpack_from(endian + 'HHI', view, body)
+                units = self._parse_tsresol(view, body + 8, offset + block_len - 4, endian)
+                interfaces.append((linktype, snaplen, units))
+
+            offset += block_len
+
+    @staticmethod
+    def _parse_tsresol(view: memoryview, start: int, end: int, endian: str) -> float:
+        """IDB 옵션에서 if_tsresol 파싱 (기본값: 마이크로초)"""
+        offset = start
+        while offset + 4 <= end:
+            code, length = struct.unpack_from(endian + 'HH', view, offset)
+            if code == 0:
+                break
+            if code == 9 and length >= 1:
+                resol = view[offset + 4]
+                if resol & 0x80:
+                    return float(2 ** (resol & 0x7F))
+                return float(10 ** resol)
+            offset += 4 + ((length + 3) & ~3)
+        return 1e6
+
+    def close(self):
+        """매핑 해제 (반환된 프레임이 남아 있으면 GC 시점에 해제)"""
+        try:
+            self._view.release()
+            if self._mmap is not None:
+                self._mmap.close()
+        except BufferError:
+            # 외부에서 프레임 슬라이스를 아직 참조 중
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def open_capture(path: str) -> PcapReader:
+    """캡처 파일 열기 (with 문 사용 권장)"""
+    return PcapReader(path)
+
+
+class PcapTail:
+    """기록 중인 classic pcap 파일 증분 리더 (airodump-ng --output-format cap)
+
+    poll할 때마다 지난번에 처리한 마지막 완전한 레코드 이후의 바이트만 읽고,
+    아직 다 기록되지 않은 마지막 레코드는 다음 poll에서 다시 읽습니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 기록 중인 캡처 파일 경로
+        """
+        self.path = path
+        self.linktype: Optional[int] = None
+        self.frames = 0
+        self.bytes_read = 0
+        self._offset = 0
+        self._record: Optional[struct.Struct] = None
+        self._ts_scale = 1e-6
+
+    def _read_header(self, data: bytes) -> bool:
+        """전역 헤더 파싱 (아직 24바이트가 안 되면 False)"""
+        if len(data) < 24:
+            return False
+        for endian in ('<', '>'):
+            magic = struct.unpack_from(endian + 'I', data, 0)[0]
+            if magic in (_PCAP_MAGIC_USEC, _PCAP_MAGIC_NSEC):
+                self._record = struct.Struct(endian + 'IIII')
+                self._ts_scale = 1e-9 if magic == _PCAP_MAGIC_NSEC else 1e-6
+                self.linktype = struct.unpack_from(endian + 'I', data, 20)[0] & 0x0FFFFFFF
+                return True
+        raise ValueError(f'증분 읽기는 classic pcap만 지원합니다: {self.path}')
+
+    def dot11_frames(self) -> Iterator[Tuple[float, memoryview]]:
+        """지난 poll 이후 새로 기록된 (타임스탬프, 802.11 프레임) 순회"""
+        base = self._offset
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(base)
+                data = f.read()
+        except OSError:
+            return
+        self.bytes_read += len(data)
+
+        offset = 0
+        if self._record is None:
+            if not self._read_header(data):
+                return
+            offset = 24
+            self._offset = base + offset
+
+        view = memoryview(data)
+        size = len(view)
+        unpack = self._record.unpack_from
+        scale = self._ts_scale
+        while offset + 16 <= size:
+            ts_sec, ts_frac, incl_len, _ = unpack(view, offset)
+            end = offset + 16 + incl_len
+            if end > size:
+                # 기록 중인 마지막 레코드는 다음 poll에서 다시 읽음
+                break
+            frame = dot11_payload(self.linktype, view[offset + 16:end])
+            offset = end
+            self._offset = base + offset
+            self.frames += 1
+            if frame is not None and len(frame) >= 10:
+                yield ts_sec + ts_frac * scale, frame
@@ -0,0 +1,316 @@
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import stat
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 파일 구조: 64바이트 헤더 + 48바이트 레코드(패스프레이즈 다이제스트 16 + PMK 32)
+_MAGIC = b'WPMK'
+_VERSION = 1
+_HEADER_SIZE = 64
+_DIGEST_SIZE = 16
+_PMK_SIZE = 32
+_RECORD_SIZE = _DIGEST_SIZE + _PMK_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+def _usable_size(size: int) -> int:
+    """헤더와 완전한 레코드까지의 크기"""
+    return _HEADER_SIZE + max(size - _HEADER_SIZE, 0) // _RECORD_SIZE * _RECORD_SIZE
+
+
+def passphrase_digest(passphrase: bytes) -> bytes:
+    """레코드 키 (패스프레이즈 원문은 저장하지 않음)"""
+    return hashlib.blake2b(passphrase, digest_size=_DIGEST_SIZE).digest()
+
+
+class _SSIDTable:
+    """SSID 하나의 추가 전용 PMK 테이블
+
+    레코드는 O_APPEND로 파일 끝에만 추가하고, 조회는 mmap에서 바로 읽습니다.
+    여러 프로세스가 같은 테이블을 쓸 수 있도록 추가/압축은 flock 배타 잠금, 조회는 공유 잠금 아래에서 하며
+    다른 프로세스가 추가한 레코드와 압축으로 교체된 파일은 잠금을 잡을 때 반영합니다.
+    메모리에는 다이제스트 → 오프셋 인덱스를 사용 순서(LRU)대로 유지하며,
+    최대 레코드 수를 넘으면 최근에 사용된 레코드만 남기도록 파일을 다시 씁니다.
+    """
+
+    def __init__(self, path: str, ssid: bytes, max_entries: int):
+        self.path = path
+        self.ssid = ssid
+        self.max_entries = max_entries
+        self._index: 'OrderedDict[bytes, int]' = OrderedDict()
+        self._fd: Optional[int] = None
+        self._mmap = None
+        self._mapped_size = 0
+        self._open()
+
+    def _open(self):
+        """테이블 파일 열기 (없거나 손상된 경우 새로 생성)"""
+        self._index = OrderedDict()
+        self._mmap = None
+        self._mapped_size = 0
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.pread(self._fd, _HEADER_SIZE, 0) != self._header():
+                os.ftruncate(self._fd, 0)
+                os.write(self._fd, self._header())
+
+            # 기록 중단으로 남은 불완전한 레코드 제거
+            size = os.fstat(self._fd).st_size
+            usable = _usable_size(size)
+            if usable != size:
+                os.ftruncate(self._fd, usable)
+
+            self._sync()
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _header(self) -> bytes:
+        header = _MAGIC + bytes([_VERSION, len(self.ssid)]) + self.ssid
+        return header + bytes(_HEADER_SIZE - len(header))
+
+    def _current(self) -> bool:
+        """열어 둔 파일이 아직 경로의 파일인지 (다른 프로세스의 압축으로 교체되지 않았는지)"""
+        try:
+            return os.stat(self.path).st_ino == os.fstat(self._fd).st_ino
+        except FileNotFoundError:
+            return False
+
+    @contextmanager
+    def _locked(self, operation: int):
+        """flock 잠금 (잡는 사이 파일이 교체됐으면 다시 열고 새 파일을 잠금), 잠근 뒤 새 레코드 반영"""
+        while True:
+            fcntl.flock(self._fd, operation)
+            if self._current():
+                break
+            self.close()
+            self._open()
+        fd = self._fd
+        try:
+            self._sync()
+            yield
+        finally:
+            if self._fd == fd:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _sync(self):
+        """파일 크기가 변했으면 다시 매핑하고 다른 프로세스가 추가한 레코드를 인덱스에 반영"""
+        old_size = self._mapped_size
+        size = _usable_size(os.fstat(self._fd).st_size)
+        if size == old_size and self._mmap is not None:
+            return
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = mmap.mmap(self._fd, size, access=mmap.ACCESS_READ)
+        self._mapped_size = size
+        for offset in range(max(old_size, _HEADER_SIZE), size, _RECORD_SIZE):
+            self._index[self._mmap[offset:offset + _DIGEST_SIZE]] = offset
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def lookup(self, digests: List[bytes]) -> Dict[int, bytes]:
+        """다이제스트 목록 중 캐시에 있는 항목의 {위치: PMK} 반환"""
+        hits = {}
+        with self._locked(fcntl.LOCK_SH):
+            index = self._index
+            for position, digest in enumerate(digests):
+                offset = index.get(digest)
+                if offset is None:
+                    continue
+                # 인덱스가 가리키는 레코드의 다이제스트가 다르면 (다른 프로세스가 파일을 바꿈) 적중으로 보지 않음
+                if self._mmap[offset:offset + _DIGEST_SIZE] != digest:
+                    del index[digest]
+                    continue
+                index.move_to_end(digest)
+                start = offset + _DIGEST_SIZE
+                hits[position] = self._mmap[start:start + _PMK_SIZE]
+        return hits
+
+    def append(self, records: Iterable[Tuple[bytes, bytes]]):
+        """(다이제스트, PMK) 레코드 추가"""
+        with self._locked(fcntl.LOCK_EX):
+            # 다른 프로세스가 남긴 불완전한 레코드가 있으면 잘라서 레코드 경계를 맞춤
+            if os.fstat(self._fd).st_size != self._mapped_size:
+                os.ftruncate(self._fd, self._mapped_size)
+
+            data = bytearray()
+            offset = self._mapped_size
+            new_entries = []
+            for digest, pmk in records:
+                if digest in self._index:
+                    continue
+                data += digest
+                data += pmk
+                new_entries.append((digest, offset))
+                offset += _RECORD_SIZE
+            if not data:
+                return
+
+            os.write(self._fd, data)
+            self._index.update(new_entries)
+            self._sync()
+
+            if len(self._index) > self.max_entries:
+                self._compact()
+
+    def _compact(self):
+        """최근 사용된 레코드만 남기고 파일 재작성 (LRU 제거, 배타 잠금 안에서 호출)"""
+        digests = list(self._index.keys())
+        keep_count = self.max_entries * 3 // 4 or self.max_entries
+        keep = digests[max(0, len(digests) - keep_count):]
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self._header())
+            for digest in keep:
+                offset = self._index[digest]
+                f.write(self._mmap[offset:offset + _RECORD_SIZE])
+
+        os.replace(tmp_path, self.path)
+        # 닫으면 이전 파일의 잠금도 풀리고, 기다리던 프로세스는 교체를 감지해 새 파일을 엶
+        self.close()
+        self._open()
+
+    def size_bytes(self) -> int:
+        return self._mapped_size
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class PMKCache:
+    """SSID별 영구 PMK 캐시
+
+    PMK는 (SSID, 패스프레이즈)에만 의존하므로 같은 SSID를 같은 wordlist로 다시 점검하면
+    PBKDF2를 건너뛰고 MIC 검증만 수행할 수 있습니다.
+    SSID 테이블 수가 한도를 넘으면 가장 오래 사용되지 않은 테이블 파일을 삭제합니다.
+    """
+
+    def __init__(self, directory: str, max_entries_per_ssid: int = 500000, max_ssids: int = 64):
+        """
+        Args:
+            directory: 테이블 파일 저장 디렉토리
+            max_entries_per_ssid: SSID별 최대 레코드 수
+            max_ssids: 디스크에 유지할 최대 SSID 테이블 수
+        """
+        self.directory = directory
+        self.max_entries_per_ssid = max_entries_per_ssid
+        self.max_ssids = max_ssids
+        self._tables: 'OrderedDict[bytes, _SSIDTable]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # 다른 사용자가 테이블 파일을 심거나 바꿀 수 없도록 소유자 전용 디렉토리만 사용
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        st = os.lstat(directory)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.geteuid():
+            raise PermissionError(f'PMK 캐시 디렉토리 {directory}는 현재 사용자 소유 디렉토리여야 합니다.')
+        if st.st_mode & 0o077:
+            os.chmod(directory, 0o700)
+
+    def _table_path(self, ssid: bytes) -> str:
+        return os.path.join(self.directory, hashlib.sha1(ssid).hexdigest() + '.pmk')
+
+    def _table(self, ssid: bytes) -> _SSIDTable:
+        """SSID 테이블 열기 (사용 시각 갱신 및 LRU 제거)"""
+        table = self._tables.get(ssid)
+        if table is None:
+            table = _SSIDTable(self._table_path(ssid), ssid, self.max_entries_per_ssid)
+            self._tables[ssid] = table
+            self._evict()
+        else:
+            self._tables.move_to_end(ssid)
+        os.utime(table.path)
+        return table
+
+    def _evict(self):
+        """mtime 기준 가장 오래 사용되지 않은 SSID 테이블 삭제"""
+        paths = [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith('.pmk')
+        ]
+        if len(paths) <= self.max_ssids:
+            return
+
+        paths.sort(key=lambda path: os.stat(path).st_mtime)
+        open_paths = {table.path: ssid for ssid, table in self._tables.items()}
+        for path in paths[:len(paths) - self.max_ssids]:
+            ssid = open_paths.get(path)
+            if ssid is not None:
+                self._tables.pop(ssid).close()
+            os.remove(path)
+
+    def lookup(self, ssid: bytes, passphrases: List[bytes]) -> Dict[int, bytes]:
+        """캐시된 PMK 조회 ({passphrases 내 위치: PMK})"""
+        with self._lock:
+            hits = self._table(ssid).lookup([passphrase_digest(p) for p in passphrases])
+            self.hits += len(hits)
+            self.misses += len(passphrases) - len(hits)
+            return hits
+
+    def store(self, ssid: bytes, pairs: Iterable[Tuple[bytes, bytes]]):
+        """(패스프레이즈, PMK) 쌍 저장"""
+        records = [(passphrase_digest(passphrase), pmk) for passphrase, pmk in pairs]
+        with self._lock:
+            self._table(ssid).append(records)
+
+    def drop(self, ssid: bytes):
+        """SSID 테이블 삭제 (잘못된 PMK가 들어 있는 것으로 확인된 경우)"""
+        with self._lock:
+            table = self._tables.pop(ssid, None)
+            if table is not None:
+                table.close()
+            try:
+                os.remove(self._table_path(ssid))
+            except FileNotFoundError:
+                pass
+
+    def entries(self, ssid: bytes) -> int:
+        """SSID 테이블의 레코드 수"""
+        with self._lock:
+            return len(self._table(ssid))
+
+    def close(self):
+        with self._lock:
+            for table in self._tables.values():
+                table.close()
+            self._tables.clear()
+
+
+_default_cache: Optional[PMKCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_pmk_cache() -> Optional[PMKCache]:
+    """설정 기반 전역 PMK 캐시 (비활성화 시 None)"""
+    global _default_cache
+    from config import Config
+
+    if not Config.PMK_CACHE_ENABLED:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            try:
+                _default_cache = PMKCache(
+                    Config.PMK_CACHE_DIR,
+                    max_entries_per_ssid=Config.PMK_CACHE_MAX_ENTRIES_PER_SSID,
+                    max_ssids=Config.PMK_CACHE_MAX_SSIDS
+                )
+            except OSError as e:
+                logger.warning('PMK 캐시를 사용할 수 없어 비활성화: %s', e)
+                return None
+        return _default_cache
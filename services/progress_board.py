@@ -0,0 +1,68 @@
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class ProgressBoard(dict):
+    """버전이 붙는 진행 상황 저장소
+
+    cracking_progress[cracking_id] = {...} 대입마다 전역 증가 버전을 기록하고
+    해당 작업을 기다리는 스트림만 깨웁니다. 여러 번 바뀐 뒤 깨어나면 최신 상태 하나만 전달됩니다.
+    버전은 프로세스마다 새로 시작하므로 epoch와 함께 이벤트 ID로 사용합니다.
+    """
+
+    def __init__(self, listener: Optional[Callable[[str, Dict[str, Any]], None]] = None):
+        """
+        Args:
+            listener: 대입마다 (키, 값)으로 호출 (잠금 밖에서 호출, 메트릭 수집용)
+        """
+        super().__init__()
+        self._listener = listener
+        self.epoch = format(int(time.time() * 1000), 'x')
+        self._versions: Dict[str, int] = {}
+        self._seq = itertools.count(1)
+        self._lock = threading.Lock()
+        self._conditions: Dict[str, threading.Condition] = {}
+
+    def __setitem__(self, key: str, value: Dict[str, Any]):
+        with self._lock:
+            super().__setitem__(key, value)
+            self._versions[key] = next(self._seq)
+            condition = self._conditions.get(key)
+            if condition is not None:
+                condition.notify_all()
+        if self._listener is not None:
+            self._listener(key, value)
+
+    def version(self, key: str) -> int:
+        """작업의 현재 버전 (없으면 0)"""
+        with self._lock:
+            return self._versions.get(key, 0)
+
+    def event_id(self, version: int) -> str:
+        """SSE 이벤트 ID (epoch-버전)"""
+        return f'{self.epoch}-{version}'
+
+    def parse_event_id(self, event_id: Optional[str]) -> int:
+        """Last-Event-ID에서 버전 추출 (다른 프로세스에서 발급된 ID면 0)"""
+        if not event_id:
+            return 0
+        epoch, _, version = event_id.partition('-')
+        if epoch != self.epoch or not version.isdigit():
+            return 0
+        return int(version)
+
+    def wait_for_change(self, key: str, after: int, timeout: float) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """after 이후 버전이 생길 때까지 대기 (시간 초과 시 None)"""
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            condition = self._conditions.get(key)
+            if condition is None:
+                condition = self._conditions[key] = threading.Condition(self._lock)
+            while self._versions.get(key, 0) <= after:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not condition.wait(remaining):
+                    if self._versions.get(key, 0) <= after:
+                        return None
+            return self._versions[key], dict.__getitem__(self, key)
@@ -0,0 +1,286 @@
+import logging
+import os
+import re
+import select
+import socket
+import subprocess
+import threading
+import time
+from typing import Dict, NamedTuple, Optional
+
+from config import Config
+from utils.privhelper import run_privileged
+from utils.tools import tool_path
+
+logger = logging.getLogger(__name__)
+
+SYSFS_NET = '/sys/class/net'
+
+MODE_MANAGED = 'managed'
+MODE_MONITOR = 'monitor'
+
+# /sys/class/net/<ifname>/type 값 (include/uapi/linux/if_arp.h)
+_ARPHRD_MONITOR = (802, 803)  # ARPHRD_IEEE80211_PRISM, ARPHRD_IEEE80211_RADIOTAP
+_IFF_UP = 0x1
+
+# rtnetlink 링크 이벤트 구독
+_RTMGRP_LINK = 0x1
+
+# iwconfig 출력만으로 판단할 때 무선 인터페이스로 보는 이름
+_WIRELESS_PREFIXES = ('wlan', 'wlp', 'wlx', 'wifi')
+
+
+class RadioInterface(NamedTuple):
+    """무선 인터페이스 상태"""
+    name: str
+    phy: Optional[str]
+    mode: str
+    up: Optional[bool]  # None이면 알 수 없음 (iwconfig로 읽은 경우)
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def read_sysfs(root: str = SYSFS_NET) -> Dict[str, RadioInterface]:
+    """sysfs에서 무선 인터페이스 목록 읽기 (phy80211 또는 wireless 항목이 있는 인터페이스)"""
+    interfaces = {}
+    try:
+        names = sorted(os.listdir(root))
+    except OSError:
+        return interfaces
+
+    for name in names:
+        base = os.path.join(root, name)
+        phy_link = os.path.join(base, 'phy80211')
+        if not os.path.exists(phy_link) and not os.path.isdir(os.path.join(base, 'wireless')):
+            continue
+        phy = os.path.basename(os.path.realpath(phy_link)) if os.path.exists(phy_link) else None
+        arp_type = _read_text(os.path.join(base, 'type'))
+        mode = MODE_MONITOR if arp_type and int(arp_type) in _ARPHRD_MONITOR else MODE_MANAGED
+        flags = _read_text(os.path.join(base, 'flags'))
+        up = bool(int(flags, 16) & _IFF_UP) if flags else None
+        interfaces[name] = RadioInterface(name, phy, mode, up)
+    return interfaces
+
+
+def parse_iwconfig(output: str) -> Dict[str, RadioInterface]:
+    """iwconfig 출력에서 무선 인터페이스 목록 추출 (인터페이스별 문단의 Mode:Monitor로 모드 판단)"""
+    interfaces = {}
+    name = None
+    for line in output.split('\n'):
+        match = re.match(r'^(\w+)\s+', line)
+        if match:
+            name = match.group(1) if 'IEEE 802.11' in line or 'ESSID' in line or 'Mode:' in line else None
+            if name:
+                interfaces[name] = RadioInterface(name, None, MODE_MANAGED, None)
+        if name and 'Mode:Monitor' in line:
+            interfaces[name] = interfaces[name]._replace(mode=MODE_MONITOR)
+    return interfaces
+
+
+class RadioManager:
+    """무선 인터페이스 이름/모드 캐시와 모니터 모드 준비
+
+    /sys/class/net의 phy80211, type(ARPHRD), flags로 상태를 읽어 iwconfig/ip link를 매번 실행하지 않습니다.
+    rtnetlink 링크 이벤트를 받으면 캐시를 무효화하고, 이벤트를 받을 수 없으면 ttl초마다 다시 읽습니다.
+    가짜 도구(WIRELESS_TOOLS=fake)이거나 sysfs에 무선 인터페이스가 없으면 iwconfig 출력을 사용합니다.
+    """
+
+    def __init__(self, sysfs_root: str = SYSFS_NET, ttl: float = 5.0):
+        self.sysfs_root = sysfs_root
+        self.ttl = ttl
+        self.source = None  # 마지막으로 읽은 곳 ('sysfs' 또는 'iwconfig')
+        self.reads = 0
+        self.link_events = 0
+        self._lock = threading.Lock()
+        self._monitor_lock = threading.Lock()  # airmon-ng는 한 번에 하나만 실행
+        self._interfaces: Optional[Dict[str, RadioInterface]] = None
+        self._loaded_at = 0.0
+        self._watching = False
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def invalidate(self):
+        """다음 조회 때 다시 읽도록 캐시 비움"""
+        with self._lock:
+            self._interfaces = None
+
+    def interfaces(self, refresh: bool = False) -> Dict[str, RadioInterface]:
+        """무선 인터페이스 목록 (캐시)"""
+        with self._lock:
+            fresh = self._watching or time.monotonic() - self._loaded_at < self.ttl
+            if self._interfaces is not None and fresh and not refresh:
+                return self._interfaces
+
+        interfaces, source = self._read()
+        with self._lock:
+            self._interfaces = interfaces
+            self._loaded_at = time.monotonic()
+            self.source = source
+            self.reads += 1
+        return interfaces
+
+    def _read(self):
+        if Config.WIRELESS_TOOLS != 'fake':
+            interfaces = read_sysfs(self.sysfs_root)
+            if interfaces:
+                return interfaces, 'sysfs'
+        try:
+            result = subprocess.run([tool_path('iwconfig')], capture_output=True, text=True, timeout=5)
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning('iwconfig 실행 오류: %s', e)
+            return {}, 'iwconfig'
+        interfaces = parse_iwconfig(result.stdout)
+        return {name: iface for name, iface in interfaces.items() if iface.mode == MODE_MONITOR
+                or name.startswith(_WIRELESS_PREFIXES)}, 'iwconfig'
+
+    def wireless_interface(self) -> Optional[str]:
+        """모니터 모드가 아닌 무선 인터페이스 (없으면 아무 무선 인터페이스)"""
+        interfaces = self.interfaces()
+        managed = [name for name, iface in interfaces.items() if iface.mode != MODE_MONITOR]
+        return (managed or list(interfaces) or [None])[0]
+
+    def monitor_interface(self, phy: Optional[str] = None) -> Optional[str]:
+        """모니터 모드 인터페이스 (phy를 주면 같은 무선 장치의 것만)"""
+        for name, iface in self.interfaces().items():
+            if iface.mode == MODE_MONITOR and (phy is None or iface.phy is None or iface.phy == phy):
+                return name
+        return None
+
+    def monitor_for(self, interface: str) -> Optional[str]:
+        """interface에 딸린 모니터 모드 인터페이스 (자기 자신, airmon-ng 이름 <interface>mon, 같은 phy 순)"""
+        interfaces = self.interfaces()
+        for name in (interface, interface + 'mon'):
+            iface = interfaces.get(name)
+            if iface is not None and iface.mode == MODE_MONITOR:
+                return name
+        current = interfaces.get(interface)
+        return self.monitor_interface(current.phy if current else None)
+
+    def ensure_monitor(self, interface: str) -> Optional[str]:
+        """interface의 모니터 모드 인터페이스 준비 (이미 있으면 airmon-ng를 실행하지 않음)"""
+        with self._monitor_lock:
+            monitor = self.monitor_for(interface)
+            if monitor:
+                return monitor
+
+            try:
+                result = run_privileged('monitor_start', interface=interface, timeout=10, preserve_env=True)
+            except (OSError, subprocess.SubprocessError) as e:
+                logger.warning('모니터 모드 활성화 오류: %s', e)
+                return None
+            logger.debug('airmon-ng 출력:\n%s', result.stdout)
+            if result.stderr:
+                logger.debug('airmon-ng 오류 출력:\n%s', result.stderr)
+
+            self.interfaces(refresh=True)
+            monitor = self.monitor_for(interface)
+            if monitor:
+                logger.info('모니터 모드 활성화됨', extra={'interface': interface, 'monitor': monitor})
+                return monitor
+            # 드라이버에 따라 모드 확인이 안 되는 경우 원래 인터페이스 사용 (기존 동작)
+            logger.info('모니터 모드 확인 실패, 기본 인터페이스 사용', extra={'interface': interface})
+            return interface
+
+    def stop_monitor(self, monitor_interface: str):
+        """모니터 모드 비활성화"""
+        with self._monitor_lock:
+            try:
+                run_privileged('monitor_stop', interface=monitor_interface, timeout=10, preserve_env=True)
+            except (OSError, subprocess.SubprocessError) as e:
+                logger.warning('모니터 모드 비활성화 오류: %s', e)
+            self.invalidate()
+
+    def bring_up(self, interface: str) -> bool:
+        """인터페이스 활성화 (이미 UP이면 아무것도 하지 않고 False)"""
+        iface = self.interfaces().get(interface)
+        if iface is not None and iface.up:
+            return False
+        run_privileged('link_up', interface=interface, timeout=5)
+        with self._lock:
+            # sysfs가 없는 환경(iwconfig)에서는 다음 무효화 전까지 UP으로 간주
+            if self._interfaces is not None and interface in self._interfaces:
+                self._interfaces = dict(self._interfaces)
+                self._interfaces[interface] = self._interfaces[interface]._replace(up=True)
+        return True
+
+    def start_watcher(self) -> bool:
+        """rtnetlink 링크 이벤트 구독 스레드 시작 (netlink를 쓸 수 없으면 False, TTL 캐시로 동작)"""
+        if self._watcher is not None:
+            return self._watching
+        if Config.WIRELESS_TOOLS == 'fake' or not hasattr(socket, 'AF_NETLINK'):
+            return False
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+            sock.bind((0, _RTMGRP_LINK))
+        except OSError as e:
+            logger.info('netlink 링크 이벤트를 구독할 수 없어 %s초 TTL 캐시 사용: %s', self.ttl, e)
+            return False
+
+        self._stop.clear()
+        self._watching = True
+        self.invalidate()
+        self._watcher = threading.Thread(target=self._watch, args=(sock,), daemon=True, name='radio-watcher')
+        self._watcher.start()
+        return True
+
+    def stop_watcher(self):
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=2)
+            self._watcher = None
+
+    def _watch(self, sock: socket.socket):
+        try:
+            while not self._stop.is_set():
+                readable, _, _ = select.select([sock], [], [], 1.0)
+                if not readable:
+                    continue
+                # RTM_NEWLINK/RTM_DELLINK (모드 변경, UP/DOWN, 인터페이스 추가/삭제): 내용과 관계없이 다시 읽음
+                sock.recv(65536)
+                self.link_events += 1
+                self.invalidate()
+        except OSError as e:
+            logger.warning('netlink 링크 이벤트 수신 오류: %s', e)
+        finally:
+            self._watching = False
+            sock.close()
+
+    def prewarm(self, interface: Optional[str] = None) -> threading.Thread:
+        """백그라운드에서 모니터 모드를 미리 준비 (첫 스캔이 airmon-ng 대기를 하지 않도록)"""
+        def run():
+            started = time.perf_counter()
+            name = interface or self.wireless_interface()
+            if not name:
+                logger.warning('모니터 모드 사전 준비: 무선 인터페이스가 없습니다.')
+                return
+            monitor = self.ensure_monitor(name)
+            if monitor:
+                self.bring_up(monitor)
+            logger.info('모니터 모드 사전 준비 완료', extra={
+                'interface': name, 'monitor': monitor, 'source': self.source,
+                'elapsed': round(time.perf_counter() - started, 2)
+            })
+
+        thread = threading.Thread(target=run, daemon=True, name='radio-prewarm')
+        thread.start()
+        return thread
+
+    def status(self) -> Dict[str, object]:
+        """캐시 상태 (튜닝용)"""
+        return {
+            'source': self.source,
+            'reads': self.reads,
+            'watching': self._watching,
+            'link_events': self.link_events,
+            'interfaces': [iface._asdict() for iface in (self._interfaces or {}).values()]
+        }
+
+
+# 전역 인스턴스
+radio_manager = RadioManager(ttl=Config.RADIO_CACHE_TTL)
@@ -0,0 +1,127 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from config import Config
+from services.metrics import registry
+
+
+class _Flight:
+    """진행 중인 로드 하나 (같은 키의 동시 요청이 결과를 공유)"""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ScanCache:
+    """TTL 캐시 + single-flight 합치기
+
+    TTL 안의 결과가 있으면 바로 반환하고(hit), 없으면 첫 요청만 loader를 실행합니다(miss).
+    그 사이 같은 키로 들어온 요청은 새로 스캔하지 않고 진행 중인 결과를 기다려 공유합니다(coalesced).
+    loader가 예외를 내면 기다리던 요청에도 같은 예외를 전달하고, 실패한 결과는 캐시하지 않습니다.
+    """
+
+    def __init__(self, ttl: float = 10.0):
+        """
+        Args:
+            ttl: 결과 재사용 시간 (초)
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._flights: Dict[Hashable, _Flight] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.load_seconds = 0.0  # loader 실행 시간 합계
+        self.wait_seconds = 0.0  # 합쳐진 요청이 기다린 시간 합계
+
+    def get(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """캐시된 결과 또는 (진행 중이 아니면) loader 실행 결과
+
+        Args:
+            key: 캐시 키
+            loader: 결과를 만드는 함수 (스캔)
+            ttl: 이 요청에 적용할 TTL (0이면 캐시는 쓰지 않고 진행 중인 로드만 공유)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                self.hits += 1
+                return entry[1]
+
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            started = time.monotonic()
+            flight.event.wait()
+            with self._lock:
+                self.wait_seconds += time.monotonic() - started
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        started = time.monotonic()
+        try:
+            flight.result = loader()
+            with self._lock:
+                self._entries[key] = (time.monotonic(), flight.result)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self.load_seconds += time.monotonic() - started
+                del self._flights[key]
+            flight.event.set()
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """캐시 항목 삭제 (key가 None이면 전체)"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """튜닝용 카운터"""
+        with self._lock:
+            loads = self.misses
+            return {
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'errors': self.errors,
+                'in_flight': len(self._flights),
+                'avg_load_seconds': round(self.load_seconds / loads, 3) if loads else 0.0,
+                'avg_wait_seconds': round(self.wait_seconds / self.coalesced, 3) if self.coalesced else 0.0,
+                'wait_seconds_total': round(self.wait_seconds, 3)
+            }
+
+
+# 전역 인스턴스
+scan_cache = ScanCache(Config.WIFI_SCAN_CACHE_TTL)
+
+registry.counter('wisafe_scan_cache_hits_total', '스캔 캐시: TTL 안의 결과를 반환한 요청 수').set_function(lambda: scan_cache.hits)
+registry.counter('wisafe_scan_cache_misses_total', '스캔 캐시: 새로 스캔한 요청 수').set_function(lambda: scan_cache.misses)
+registry.counter('wisafe_scan_cache_coalesced_total', '스캔 캐시: 진행 중인 스캔을 기다려 공유한 요청 수').set_function(
+    lambda: scan_cache.coalesced
+)
+registry.counter('wisafe_scan_cache_errors_total', '스캔 캐시: 실패한 스캔 수').set_function(lambda: scan_cache.errors)
@@ -0,0 +1,259 @@
+import logging
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from config import Config
+from services.airodump_csv import AccessPoint, AirodumpCSVTail, csv_path
+from services.channel_plan import parse_channels
+from services.metrics import registry
+from services.wifi_scanner import AIRODUMP_EXITS, SCAN_STAGE_SECONDS, MultiAdapterScanner, WiFiScanner, merge_access_points
+from utils.process import kill_process_tree
+from utils.privhelper import popen_privileged
+
+logger = logging.getLogger(__name__)
+
+
+class ScannerDaemon:
+    """모니터 인터페이스를 점유하고 AP 테이블을 계속 갱신하는 백그라운드 스캐너
+
+    airodump-ng를 한 번 띄워 두고 CSV를 증분 파싱하므로, 스캔 API는 요청마다
+    모니터 모드 준비와 WIFI_SCAN_DURATION 대기 없이 현재 스냅샷을 바로 반환합니다.
+    같은 인터페이스로 캡처하는 크래킹 작업 동안에는 pause()로 airodump-ng를 내려 둡니다.
+    어댑터가 여럿이면 채널 계획을 나눠 어댑터마다 airodump-ng를 띄우고 AP 테이블을 BSSID로 병합합니다.
+    """
+
+    def __init__(self, interface: Optional[str] = None, session: str = 'scan_daemon',
+                 poll_interval: float = 0.5, stale_after: float = 120, interfaces: Optional[List[str]] = None,
+                 channels: Optional[List[int]] = None):
+        """
+        Args:
+            interface: WiFi 어댑터 인터페이스 (None이면 자동 감지)
+            session: airodump-ng CSV 출력 디렉토리 이름 (TOOL_OUTPUT_DIR 아래)
+            poll_interval: CSV 변경 확인 간격 (초)
+            stale_after: 이 시간(초) 동안 다시 보이지 않은 AP는 스냅샷에서 제외
+            interfaces: 채널 계획을 나눠 맡을 어댑터 목록 (둘 이상일 때만 사용)
+            channels: 다중 어댑터 채널 계획 (None이면 2.4GHz + 5GHz 전체)
+        """
+        interfaces = interfaces or [interface]
+        self.scanner = WiFiScanner(interface=interfaces[0])
+        self.scanner.scan_session = session
+        self.multi: Optional[MultiAdapterScanner] = None
+        if len(interfaces) > 1:
+            self.multi = MultiAdapterScanner(interfaces, channels=channels)
+            self.multi.scan_session = session
+        self.shards: List[WiFiScanner] = []
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+
+        self.access_points: Dict[str, AccessPoint] = {}
+        self.seen_at: Dict[str, float] = {}  # BSSID별 마지막으로 행이 바뀐 시각
+        self.session_started_at: Optional[float] = None  # 현재 airodump-ng 세션 시작 시각
+        self.last_update: Optional[float] = None
+        self.error: Optional[str] = None
+
+        self._changed = threading.Condition()
+        self._stop = threading.Event()
+        self._pause_count = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def paused(self) -> bool:
+        return self._pause_count > 0
+
+    def start(self):
+        """스캔 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._changed:
+            if self.running:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='scanner-daemon')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        """스캔 중지 (airodump-ng 종료)"""
+        self._stop.set()
+        with self._changed:
+            self._changed.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+
+    @contextmanager
+    def pause(self):
+        """인터페이스를 다른 작업에 넘겨주는 동안 스캔 일시 중지"""
+        with self._changed:
+            self._pause_count += 1
+            self._changed.notify_all()
+            # 스캔 스레드가 airodump-ng를 내릴 때까지 대기
+            self._changed.wait_for(lambda: self.session_started_at is None or not self.running, timeout=10)
+        try:
+            yield
+        finally:
+            with self._changed:
+                self._pause_count -= 1
+                self._changed.notify_all()
+
+    def _run(self):
+        backoff = 1.0
+        while not self._stop.is_set():
+            if self.paused:
+                with self._changed:
+                    self._changed.wait(timeout=1.0)
+                continue
+
+            self.shards = self._prepare()
+            if not self.shards:
+                self.error = '모니터 모드 인터페이스를 준비할 수 없습니다.'
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 60.0)
+                continue
+
+            self.error = None
+            if self._scan_session(self.shards):
+                backoff = 1.0
+            else:
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 60.0)
+
+    def _prepare(self) -> List[WiFiScanner]:
+        """모니터 모드 인터페이스 준비 (어댑터가 여럿이면 채널을 나눠 맡은 스캐너 목록)"""
+        if self.multi is not None:
+            return self.multi.prepare()
+        return [self.scanner] if self.scanner.prepare_monitor_interface() else []
+
+    def _scan_session(self, shards: List[WiFiScanner]) -> bool:
+        """airodump-ng 한 세션 실행 (어댑터마다 하나, 중지/일시 중지 요청까지, 비정상 종료면 False)"""
+        if self.paused:
+            return True
+        processes = []
+        prefixes: List[str] = []
+        tails: List[Optional[AirodumpCSVTail]] = [None] * len(shards)
+        try:
+            for scanner in shards:
+                process = popen_privileged(
+                    'scan',
+                    session=scanner.scan_session,
+                    interface=scanner.monitor_interface,
+                    channels=scanner.channels,
+                    preserve_env=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                processes.append(process)
+                prefixes.append(process.output_prefix)
+                logger.info('스캐너 데몬 airodump-ng 시작', extra={
+                    'interface': scanner.monitor_interface, 'channels': len(scanner.channels) if scanner.channels else 'auto'
+                })
+
+            with self._changed:
+                self.session_started_at = time.time()
+            while not self._stop.is_set() and not self.paused:
+                for scanner, process in zip(shards, processes):
+                    if process.poll() is not None:
+                        self.error = f'{scanner.monitor_interface}의 airodump-ng가 종료되었습니다. (반환 코드: {process.returncode})'
+                        logger.error('스캐너 데몬: %s', self.error)
+                        AIRODUMP_EXITS.inc(source='daemon')
+                        return False
+
+                for i, prefix in enumerate(prefixes):
+                    if tails[i] is None:
+                        path = csv_path(prefix)
+                        tails[i] = AirodumpCSVTail(path) if path else None
+                    tail = tails[i]
+                    if tail is None:
+                        continue
+                    with SCAN_STAGE_SECONDS.time(stage='daemon_parse'):
+                        changed = tail.poll()
+                    now = time.time()
+                    with self._changed:
+                        for bssid in changed:
+                            # 다른 어댑터에서도 보이는 AP는 어댑터별 최신 행 중 신호가 센 쪽을 사용
+                            self.access_points[bssid] = merge_access_points(
+                                {bssid: other.access_points[bssid]} for other in tails
+                                if other is not None and bssid in other.access_points
+                            )[bssid]
+                            self.seen_at[bssid] = now
+                        if tail.reads:
+                            self.last_update = now
+                        self._changed.notify_all()
+
+                with self._changed:
+                    self._changed.wait(timeout=self.poll_interval)
+            return True
+        finally:
+            for process in processes:
+                kill_process_tree(process)
+            with self._changed:
+                self.session_started_at = None
+                self._changed.notify_all()
+            logger.info('스캐너 데몬 airodump-ng 종료')
+
+    def snapshot(self, min_age: float = 0.0, fresh: bool = False, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """현재 AP 목록
+
+        Args:
+            min_age: 현재 세션이 최소 이 시간(초) 동안 스캔한 뒤의 결과를 반환
+            fresh: True면 WIFI_SCAN_DURATION 동안 새로 한 번 훑은 결과 중 그 사이에 보인 AP만 반환
+            timeout: 최대 대기 시간 (초, None이면 필요한 대기 시간 + 10초)
+        """
+        self.start()
+        requested_at = time.time()
+        sweep = Config.WIFI_SCAN_DURATION if fresh else 0.0
+        deadline = requested_at + (timeout if timeout is not None else max(min_age, sweep) + 10)
+
+        def ready() -> bool:
+            now = time.time()
+            if now < requested_at + sweep:
+                return False
+            if min_age and (self.session_started_at is None or now - self.session_started_at < min_age):
+                return False
+            return True
+
+        with self._changed:
+            while not ready() and not self._stop.is_set():
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._changed.wait(timeout=min(remaining, 1.0))
+
+            since = requested_at if fresh else time.time() - self.stale_after
+            access_points = [
+                ap for bssid, ap in self.access_points.items()
+                if self.seen_at.get(bssid, 0) >= since
+            ]
+
+        return [self.scanner.access_point_to_wifi(ap) for ap in access_points]
+
+    def status(self) -> Dict[str, Any]:
+        """스캐너 상태 (API 응답용)"""
+        now = time.time()
+        with self._changed:
+            return {
+                'running': self.running,
+                'paused': self.paused,
+                'interface': self.scanner.monitor_interface if self.multi is None else None,
+                'shards': [
+                    {'interface': scanner.monitor_interface, 'channels': scanner.channels}
+                    for scanner in self.shards
+                ] if self.multi is not None else None,
+                'scan_age': round(now - self.session_started_at, 1) if self.session_started_at else None,
+                'last_update_age': round(now - self.last_update, 1) if self.last_update else None,
+                'access_points': len(self.access_points),
+                'error': self.error
+            }
+
+
+# 전역 인스턴스
+scanner_daemon = ScannerDaemon(interfaces=Config.WIFI_INTERFACES, channels=parse_channels(Config.WIFI_CHANNELS),
+                               stale_after=Config.WIFI_SCAN_STALE_AFTER)
+
+registry.gauge('wisafe_scanner_daemon_access_points', '백그라운드 스캐너 AP 테이블 크기').set_function(
+    lambda: len(scanner_daemon.access_points)
+)
@@ -0,0 +1,100 @@
+from typing import List, Sequence
+
+import numpy as np
+
+# SHA-1 초기값과 라운드 상수
+_IV = np.array([0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0], dtype=np.uint32)
+_K = [np.uint32(0x5A827999), np.uint32(0x6ED9EBA1), np.uint32(0x8F1BBCDC), np.uint32(0xCA62C1D6)]
+
+# 64바이트(ipad/opad) 뒤에 20바이트 다이제스트를 붙인 메시지의 패딩 워드
+_DIGEST_PADDING = [np.uint32(0x80000000)] + [np.uint32(0)] * 9 + [np.uint32((64 + 20) * 8)]
+
+
+def _rotl(x, n: int):
+    return (x << np.uint32(n)) | (x >> np.uint32(32 - n))
+
+
+def compress(state: Sequence[np.ndarray], block: Sequence) -> List[np.ndarray]:
+    """SHA-1 압축 함수 (레인당 후보 하나, uint32 배열 단위로 80라운드 수행)
+
+    Args:
+        state: 5개의 (N,) uint32 배열
+        block: 16개의 (N,) uint32 배열 또는 모든 레인에 공통인 스칼라
+
+    Returns:
+        갱신된 상태 (5개의 (N,) uint32 배열)
+    """
+    w = list(block)
+    for t in range(16, 80):
+        w.append(_rotl(w[t - 3] ^ w[t - 8] ^ w[t - 14] ^ w[t - 16], 1))
+
+    a, b, c, d, e = state
+    for t in range(80):
+        if t < 20:
+            f = d ^ (b & (c ^ d))
+        elif t < 40 or t >= 60:
+            f = b ^ c ^ d
+        else:
+            f = (b & c) | (d & (b | c))
+        temp = _rotl(a, 5) + f + e + _K[t // 20] + w[t]
+        e = d
+        d = c
+        c = _rotl(b, 30)
+        b = a
+        a = temp
+
+    return [state[0] + a, state[1] + b, state[2] + c, state[3] + d, state[4] + e]
+
+
+def _words(data: np.ndarray) -> List[np.ndarray]:
+    """(N, 64) uint8 블록을 16개의 빅엔디언 (N,) uint32 워드로 변환"""
+    packed = data.view('>u4').astype(np.uint32)
+    return [np.ascontiguousarray(packed[:, i]) for i in range(16)]
+
+
+def _salt_block(ssid: bytes, index: int) -> List[np.uint32]:
+    """HMAC 내부 해시의 첫 메시지 블록: SSID || INT(i) || 패딩 (모든 레인 공통)"""
+    message = ssid + index.to_bytes(4, 'big')
+    if len(message) > 55:
+        raise ValueError('SSID가 너무 깁니다 (최대 32바이트).')
+    block = message + b'\x80' + bytes(55 - len(message)) + ((64 + len(message)) * 8).to_bytes(8, 'big')
+    return [np.uint32(int.from_bytes(block[i:i + 4], 'big')) for i in range(0, 64, 4)]
+
+
+def pbkdf2_sha1_batch(passphrases: Sequence[bytes], ssid: bytes, iterations: int = 4096) -> List[bytes]:
+    """여러 패스프레이즈의 PMK(32바이트)를 한 번에 계산
+
+    HMAC의 ipad/opad 상태를 레인별로 미리 압축해 두고, 반복마다 내부/외부 해시를
+    모든 레인에 대해 동시에 수행합니다. PMK는 PBKDF2 블록 T1(20바이트)과 T2(앞 12바이트)로 구성됩니다.
+    """
+    count = len(passphrases)
+    if not count:
+        return []
+
+    keys = np.zeros((count, 64), dtype=np.uint8)
+    for i, passphrase in enumerate(passphrases):
+        if len(passphrase) > 63:
+            raise ValueError('패스프레이즈가 너무 깁니다 (최대 63바이트).')
+        keys[i, :len(passphrase)] = np.frombuffer(passphrase, dtype=np.uint8)
+
+    iv = [np.full(count, word, dtype=np.uint32) for word in _IV]
+    inner_state = compress(iv, _words(keys ^ np.uint8(0x36)))
+    outer_state = compress(iv, _words(keys ^ np.uint8(0x5C)))
+
+    blocks = []
+    for index in (1, 2):
+        # U1 = HMAC(P, SSID || INT(i))
+        inner = compress(inner_state, _salt_block(ssid, index))
+        u = compress(outer_state, inner + _DIGEST_PADDING)
+        t = [word.copy() for word in u]
+
+        # U_j = HMAC(P, U_{j-1}), T = U1 ^ U2 ^ ... ^ U_c
+        for _ in range(iterations - 1):
+            inner = compress(inner_state, u + _DIGEST_PADDING)
+            u = compress(outer_state, inner + _DIGEST_PADDING)
+            for word_t, word_u in zip(t, u):
+                word_t ^= word_u
+        blocks.append(np.stack(t, axis=1))
+
+    digest = np.concatenate(blocks, axis=1).astype('>u4').view(np.uint8)
+    return [row[:32].tobytes() for row in digest]
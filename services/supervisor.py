@@ -0,0 +1,306 @@
+import codecs
+import heapq
+import itertools
+import logging
+import os
+import re
+import selectors
+import signal
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Pattern, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 도구 출력에서 뽑아내는 이벤트 패턴
+PERCENT_PATTERN = r'(\d+\.\d+)%'
+IV_PATTERN = r'(\d+)\s+IV'
+KEY_FOUND_PATTERN = r'KEY FOUND!\s*\[(.+)\]'
+
+_READ_SIZE = 65536
+_POLL_INTERVAL = 0.5  # pidfd를 쓸 수 없을 때 종료 확인 주기 (초)
+_DRAIN_GRACE = 1.0  # 프로세스 종료 후 손자 프로세스가 잡고 있는 파이프를 기다리는 시간 (초)
+_KILL_GRACE = 5.0  # 기한 초과 시 SIGTERM 후 SIGKILL까지 (초)
+
+
+class ProcessEvent(NamedTuple):
+    """출력 한 줄에서 패턴이 일치한 이벤트"""
+    name: str
+    groups: Tuple[str, ...]
+    line: str
+    timestamp: float
+
+
+class Supervised:
+    """감시 중인 프로세스 하나 (출력 줄, 이벤트, 종료 상태)
+
+    출력은 최근 tail_lines줄, 이벤트는 최근 max_events개만 보관하고
+    이름별 마지막 이벤트(last)는 항상 남깁니다 (KEY FOUND 등).
+    """
+
+    def __init__(self, process, name: str, patterns: Dict[str, Pattern], tail_lines: int, max_events: int,
+                 max_line: int, deadline: Optional[float]):
+        self.process = process
+        self.name = name
+        self.patterns = patterns
+        self.max_line = max_line
+        self.deadline = deadline  # time.monotonic() 기준 강제 종료 시각
+        self.lines: Deque[str] = deque(maxlen=tail_lines)
+        self.events: Deque[ProcessEvent] = deque(maxlen=max_events)
+        self.last: Dict[str, ProcessEvent] = {}
+        self.line_count = 0
+        self.returncode: Optional[int] = None
+        self.timed_out = False
+        self._subscribers: List[Callable[[ProcessEvent], None]] = []
+        self._done = threading.Event()
+        # 감시 스레드 전용 상태
+        self._streams: Dict[int, Tuple[object, list]] = {}  # fd -> (증분 디코더, 미완성 줄 조각)
+        self._pidfd: Optional[int] = None
+        self._exited_at: Optional[float] = None
+        self._killed_at: Optional[float] = None
+
+    def subscribe(self, callback: Callable[[ProcessEvent], None]):
+        """이벤트 구독 (감시 스레드에서 호출되므로 빨리 반환해야 함)"""
+        self._subscribers.append(callback)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """프로세스 종료와 출력 수신이 끝날 때까지 대기 (끝났으면 True)"""
+        return self._done.wait(timeout)
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def output(self) -> str:
+        """보관 중인 최근 출력"""
+        return '\n'.join(self.lines)
+
+    def value(self, name: str, group: int = 1) -> Optional[str]:
+        """이름별 마지막 이벤트의 그룹 값"""
+        event = self.last.get(name)
+        return event.groups[group - 1] if event is not None else None
+
+    def _feed_line(self, line: str):
+        line = line[:self.max_line]
+        self.lines.append(line)
+        self.line_count += 1
+        for name, pattern in self.patterns.items():
+            match = pattern.search(line)
+            if match is None:
+                continue
+            event = ProcessEvent(name, match.groups(), line, time.time())
+            self.events.append(event)
+            self.last[name] = event
+            for callback in self._subscribers:
+                try:
+                    callback(event)
+                except Exception:
+                    logger.exception('프로세스 이벤트 처리 오류', extra={'tool': self.name, 'event': name})
+
+    def _feed(self, fd: int, data: bytes, final: bool = False):
+        decoder, pending = self._streams[fd]
+        # aircrack-ng/airodump-ng는 화면을 \r로 다시 그리므로 \r도 줄 구분으로 처리
+        parts = re.split(r'[\r\n]', decoder.decode(data, final))
+        pending.append(parts[0])
+        if len(parts) > 1:
+            self._flush_pending(pending)
+            for part in parts[1:-1]:
+                if part:
+                    self._feed_line(part)
+            pending.append(parts[-1])
+        if final or sum(len(part) for part in pending) > self.max_line:
+            self._flush_pending(pending)
+
+    def _flush_pending(self, pending: list):
+        line = ''.join(pending)
+        pending.clear()
+        if line:
+            self._feed_line(line)
+
+
+class ProcessSupervisor:
+    """자식 프로세스 출력/종료를 스레드 하나의 selector(epoll)로 다중화하는 감시자
+
+    stdout/stderr 파이프를 읽어 줄 단위로 패턴을 맞추고 구독자에게 이벤트를 전달하며,
+    pidfd로 종료를 감지하고 기한이 지난 프로세스 그룹은 SIGTERM, 그래도 남으면 SIGKILL로 종료합니다.
+    watch()에 넘긴 프로세스의 stdout/stderr는 호출한 쪽에서 직접 읽으면 안 됩니다.
+    """
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._pending: List[Supervised] = []
+        self._watched: List[Supervised] = []
+        self._timers: List[Tuple[float, int, Supervised]] = []  # (시각, 순번, 대상) 힙
+        self._counter = itertools.count()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_w, False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, process, patterns: Optional[Dict[str, str]] = None, deadline: Optional[float] = None,
+              on_event: Optional[Callable[[ProcessEvent], None]] = None, name: Optional[str] = None,
+              tail_lines: int = 200, max_events: int = 256, max_line: int = 4096) -> Supervised:
+        """프로세스 감시 시작
+
+        Args:
+            process: subprocess.Popen 또는 HelperProcess (stdout/stderr가 PIPE면 읽음)
+            patterns: {이벤트 이름: 정규식} (첫 번째 그룹이 값)
+            deadline: 이 시간(초)이 지나면 프로세스 그룹 강제 종료 (None이면 무제한)
+            on_event: 이벤트 구독자
+        """
+        compiled = {key: re.compile(pattern) for key, pattern in (patterns or {}).items()}
+        args = getattr(process, 'args', None)
+        # 셸 명령 문자열(sudo 대체 경로)은 비밀번호가 들어 있으므로 이름으로 쓰지 않음
+        label = name or (os.path.basename(args[0]) if isinstance(args, list) and args else 'process')
+        supervised = Supervised(process, label, compiled, tail_lines, max_events, max_line,
+                                time.monotonic() + deadline if deadline else None)
+        if on_event is not None:
+            supervised.subscribe(on_event)
+        with self._lock:
+            self._pending.append(supervised)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name='process-supervisor')
+                self._thread.start()
+        self._wake()
+        return supervised
+
+    def count(self) -> int:
+        """감시 중인 프로세스 수"""
+        with self._lock:
+            return len(self._watched) + len(self._pending)
+
+    def _wake(self):
+        try:
+            os.write(self._wake_w, b'\0')
+        except BlockingIOError:
+            pass
+
+    def _schedule(self, when: float, supervised: Supervised):
+        heapq.heappush(self._timers, (when, next(self._counter), supervised))
+
+    def _register(self, supervised: Supervised):
+        for stream in (supervised.process.stdout, supervised.process.stderr):
+            if stream is None:
+                continue
+            fd = stream.fileno()
+            supervised._streams[fd] = (codecs.getincrementaldecoder('utf-8')(errors='replace'), [])
+            self._selector.register(fd, selectors.EVENT_READ, supervised)
+
+        try:
+            supervised._pidfd = os.pidfd_open(supervised.process.pid)
+            self._selector.register(supervised._pidfd, selectors.EVENT_READ, supervised)
+        except (AttributeError, OSError):
+            # pidfd가 없거나 이미 회수된 프로세스: 주기적으로 poll()
+            supervised._pidfd = None
+            self._schedule(time.monotonic(), supervised)
+        if supervised.deadline is not None:
+            self._schedule(supervised.deadline, supervised)
+        with self._lock:
+            self._watched.append(supervised)
+
+    def _close_stream(self, supervised: Supervised, fd: int):
+        supervised._feed(fd, b'', final=True)
+        del supervised._streams[fd]
+        self._selector.unregister(fd)
+
+    def _run(self):
+        while True:
+            try:
+                self._step()
+            except Exception:
+                # 감시 스레드가 죽으면 wait()하는 작업이 모두 멈추므로 계속 진행
+                logger.exception('프로세스 감시 오류')
+                time.sleep(0.1)
+
+    def _step(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for supervised in pending:
+            self._register(supervised)
+
+        timeout = None
+        if self._timers:
+            timeout = max(0.0, self._timers[0][0] - time.monotonic())
+        for key, _ in self._selector.select(timeout):
+            supervised = key.data
+            if supervised is None:
+                os.read(self._wake_r, 4096)
+            elif key.fd == supervised._pidfd:
+                self._check_exit(supervised)
+            elif key.fd in supervised._streams:
+                # 같은 select 결과에서 먼저 처리한 종료 이벤트로 이미 닫힌 파이프는 건너뜀
+                try:
+                    data = os.read(key.fd, _READ_SIZE)
+                except OSError:
+                    data = b''
+                if data:
+                    supervised._feed(key.fd, data)
+                else:
+                    self._close_stream(supervised, key.fd)
+                    self._check_exit(supervised)
+
+        now = time.monotonic()
+        while self._timers and self._timers[0][0] <= now:
+            _, _, supervised = heapq.heappop(self._timers)
+            if not supervised.done:
+                self._on_timer(supervised, now)
+
+    def _on_timer(self, supervised: Supervised, now: float):
+        if supervised.deadline is not None and now >= supervised.deadline and supervised.returncode is None:
+            if supervised._killed_at is None:
+                supervised.timed_out = True
+                supervised._killed_at = now
+                logger.warning('프로세스 실행 기한 초과, 종료', extra={'tool': supervised.name, 'pid': supervised.process.pid})
+                self._signal(supervised, signal.SIGTERM)
+                self._schedule(now + _KILL_GRACE, supervised)
+            elif now - supervised._killed_at >= _KILL_GRACE:
+                self._signal(supervised, signal.SIGKILL)
+        self._check_exit(supervised)
+        if not supervised.done and supervised._pidfd is None:
+            self._schedule(now + _POLL_INTERVAL, supervised)
+
+    @staticmethod
+    def _signal(supervised: Supervised, sig: int):
+        # start_new_session으로 실행한 프로세스 그룹 전체 (권한 도우미 프로세스는 도우미가 전달)
+        try:
+            signal_group = getattr(supervised.process, 'signal_group', None)
+            if signal_group is not None:
+                signal_group(sig)
+            else:
+                os.killpg(supervised.process.pid, sig)
+        except OSError:
+            pass
+
+    def _check_exit(self, supervised: Supervised):
+        if supervised.returncode is None:
+            try:
+                supervised.returncode = supervised.process.poll()
+            except OSError as e:
+                logger.warning('프로세스 상태 확인 오류: %s', e, extra={'tool': supervised.name})
+                supervised.returncode = -1
+            if supervised.returncode is None:
+                return
+            now = time.monotonic()
+            supervised._exited_at = now
+            if supervised._pidfd is not None:
+                self._selector.unregister(supervised._pidfd)
+                os.close(supervised._pidfd)
+                supervised._pidfd = None
+            if supervised._streams:
+                # 남은 출력을 읽을 시간을 조금 줌 (파이프를 잡고 있는 손자 프로세스 대비)
+                self._schedule(now + _DRAIN_GRACE, supervised)
+                return
+
+        if supervised._streams and time.monotonic() - supervised._exited_at < _DRAIN_GRACE:
+            return
+        for fd in list(supervised._streams):
+            self._close_stream(supervised, fd)
+        with self._lock:
+            self._watched.remove(supervised)
+        supervised._done.set()
+
+
+# 전역 인스턴스
+process_supervisor = ProcessSupervisor()
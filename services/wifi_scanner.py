@@ -1,343 +1,249 @@
+import logging
 import subprocess
 import re
-import os
+import threading
 import time
-from typing import List, Dict, Any, Optional
-from config import Config
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Dict, Any, Optional
+from utils.privhelper import popen_privileged
+from utils.process import kill_process_tree
+from services.airodump_csv import AccessPoint, AirodumpCSVTail, csv_path
+from services.channel_plan import DEFAULT_CHANNELS, shard_channels
+from services.metrics import registry
+from services.radio import radio_manager
+from services.supervisor import process_supervisor
+
+logger = logging.getLogger(__name__)
+
+# 스캔 파이프라인 메트릭 (/metrics)
+SCAN_STAGE_SECONDS = registry.histogram('wisafe_scan_stage_seconds', '스캔 단계별 소요 시간 (초)', ('stage',))
+SCAN_SECONDS = registry.histogram('wisafe_scan_seconds', 'scan_wifi 전체 소요 시간 (초)', ('result',))
+SCAN_ACCESS_POINTS = registry.histogram(
+    'wisafe_scan_access_points', '스캔 한 번에 발견한 AP 수', buckets=(0, 1, 5, 10, 15, 25, 50, 100, 250)
+)
+SCAN_EARLY_STOPS = registry.counter('wisafe_scan_early_stops_total', 'AP 수 상한에 도달해 조기 종료한 스캔 수')
+MAX_WIFI_COUNT = 15  # 스캔 한 번에 모을 AP 수 (도달하면 조기 종료, 다중 어댑터는 병합한 AP 수 기준)
+
+AIRODUMP_EXITS = registry.counter('wisafe_airodump_unexpected_exits_total', '스캔 중 airodump-ng가 먼저 종료된 횟수', ('source',))
+
+
+class ScanError(RuntimeError):
+    """WiFi 스캔 실패 (AP가 없는 결과와 구분해 스캔 캐시에 저장되지 않도록 빈 목록 대신 발생)"""
 
 
 class WiFiScanner:
     """airodump-ng를 사용한 실제 WiFi 스캔 서비스 (블로킹 문제 수정)"""
     
-    def __init__(self, interface: Optional[str] = None, scan_duration: int = 15):
+    def __init__(self, interface: Optional[str] = None, scan_duration: int = 15, channels: Optional[List[int]] = None):
         """
         Args:
             interface: WiFi 어댑터 인터페이스 (None이면 자동 감지)
             scan_duration: 스캔 지속 시간 (초)
+            channels: 순회할 채널 목록 (None이면 airodump-ng 기본 채널 순회)
         """
         self.interface = interface
         self.scan_duration = scan_duration
+        self.channels = channels
         self.monitor_interface = None
-        self.scan_output_dir = "/tmp/wisafe_scan"
+        self.scan_session = "scan"  # TOOL_OUTPUT_DIR 아래 출력 디렉토리 이름
         
     def detect_wifi_interface(self) -> Optional[str]:
-        """WiFi 어댑터 인터페이스 자동 감지"""
-        try:
-            # iwconfig로 무선 인터페이스 찾기
-            result = subprocess.run(
-                ['iwconfig'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            # wlan0, wlan1, wlp 등 무선 인터페이스 찾기
-            for line in result.stdout.split('\n'):
-                if 'IEEE 802.11' in line or 'ESSID' in line:
-                    match = re.search(r'^(\w+)\s+', line)
-                    if match:
-                        interface = match.group(1)
-                        # lo, eth 등은 제외
-                        if interface.startswith(('wlan', 'wlp', 'wlx', 'wifi')):
-                            return interface
-            
-            # ip link로도 시도
-            result = subprocess.run(
-                ['ip', 'link', 'show'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            for line in result.stdout.split('\n'):
-                if 'wlan' in line.lower() or 'wlp' in line.lower():
-                    match = re.search(r':\s*(\w+):', line)
-                    if match:
-                        interface = match.group(1)
-                        if interface.startswith(('wlan', 'wlp', 'wlx', 'wifi')):
-                            return interface
-            
-            return None
-        except Exception as e:
-            print(f"WiFi 인터페이스 감지 오류: {e}")
-            return None
+        """WiFi 어댑터 인터페이스 자동 감지 (radio_manager 캐시)"""
+        return radio_manager.wireless_interface()
     
     def start_monitor_mode(self, interface: str) -> Optional[str]:
-        """모니터 모드 활성화"""
-        try:
-            # airmon-ng로 모니터 모드 시작 (sudo 비밀번호 자동 입력, -E로 환경 변수 유지)
-            result = subprocess.run(
-                f"echo '{Config.SUDO_PASSWORD}' | sudo -S -E airmon-ng start {interface}",
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            print(f"[모니터 모드] airmon-ng stdout:\n{result.stdout}")
-            if result.stderr:
-                print(f"[모니터 모드] airmon-ng stderr:\n{result.stderr}")
-            
-            # 모니터 모드 활성화 후 iwconfig로 확인
-            iwconfig_result = subprocess.run(
-                ['iwconfig'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            # 원래 인터페이스가 모니터 모드인지 확인
-            for line in iwconfig_result.stdout.split('\n'):
-                if interface in line and 'Mode:Monitor' in line:
-                    print(f"[모니터 모드] 인터페이스 {interface}가 모니터 모드로 활성화됨")
-                    return interface
-            
-            # 원래 인터페이스 이름 반환
-            print(f"[모니터 모드] 기본 인터페이스 사용: {interface}")
-            return interface
-                
-        except Exception as e:
-            print(f"모니터 모드 활성화 오류: {e}")
-            return None
+        """모니터 모드 활성화 (이미 모니터 모드 인터페이스가 있으면 그대로 사용)"""
+        return radio_manager.ensure_monitor(interface)
     
     def stop_monitor_mode(self, monitor_interface: str):
         """모니터 모드 비활성화"""
-        try:
-            if monitor_interface:
-                subprocess.run(
-                    f"echo '{Config.SUDO_PASSWORD}' | sudo -S -E airmon-ng stop {monitor_interface}",
-                    shell=True,
-                    capture_output=True,
-                    timeout=10
-                )
-        except Exception as e:
-            print(f"모니터 모드 비활성화 오류: {e}")
+        if monitor_interface:
+            radio_manager.stop_monitor(monitor_interface)
     
-    def scan_wifi(self) -> List[Dict[str, Any]]:
-        """실제 WiFi 스캔 수행"""
-        print("=" * 50)
-        print("[WiFi 스캔 시작 - airodump-ng]")
-        print(f"설정된 인터페이스: {self.interface}")
-        print(f"스캔 지속 시간: {self.scan_duration}초")
-        
+    def prepare_monitor_interface(self) -> Optional[str]:
+        """WiFi 인터페이스 감지 후 모니터 모드 인터페이스 준비 (실패 시 None)"""
         # 인터페이스 감지
         if not self.interface:
-            print("[1단계] WiFi 인터페이스 자동 감지 중...")
-            self.interface = self.detect_wifi_interface()
-            print(f"감지된 인터페이스: {self.interface}")
+            with SCAN_STAGE_SECONDS.time(stage='detect_interface'):
+                self.interface = self.detect_wifi_interface()
+            logger.debug('WiFi 인터페이스 자동 감지', extra={'interface': self.interface})
         
         if not self.interface:
-            print("[오류] WiFi 인터페이스를 찾을 수 없습니다.")
-            return []
+            logger.error('WiFi 인터페이스를 찾을 수 없습니다.')
+            return None
         
-        print(f"[2단계] 사용할 인터페이스: {self.interface}")
+        # 이 어댑터의 모니터 모드 인터페이스 확인 (sysfs/iwconfig 결과 캐시)
+        with SCAN_STAGE_SECONDS.time(stage='monitor_check'):
+            self.monitor_interface = radio_manager.monitor_for(self.interface)
         
-        # 출력 디렉토리 생성
-        os.makedirs(self.scan_output_dir, exist_ok=True)
-        print(f"[3단계] 출력 디렉토리: {self.scan_output_dir}")
+        # 모니터 모드가 없으면 활성화 시도
+        if not self.monitor_interface:
+            with SCAN_STAGE_SECONDS.time(stage='monitor_mode'):
+                self.monitor_interface = self.start_monitor_mode(self.interface)
+            if not self.monitor_interface:
+                logger.error('모니터 모드를 활성화할 수 없습니다.', extra={'interface': self.interface})
+                return None
         
-        # 모니터 모드 인터페이스 확인
-        self.monitor_interface = None
+        # 인터페이스 명시적으로 활성화 (이미 UP이면 생략)
+        link_up_started = time.perf_counter()
         try:
-            result = subprocess.run(
-                ['iwconfig'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            for line in result.stdout.split('\n'):
-                if 'Mode:Monitor' in line:
-                    match = re.search(r'^(\w+)\s+', line)
-                    if match:
-                        self.monitor_interface = match.group(1)
-                        print(f"[4단계] 모니터 모드 인터페이스 확인: {self.monitor_interface}")
-                        break
+            if radio_manager.bring_up(self.monitor_interface):
+                time.sleep(1)
         except Exception as e:
-            print(f"[경고] 모니터 모드 확인 오류: {e}")
+            logger.warning('인터페이스 활성화 중 오류 (무시하고 진행): %s', e)
+        SCAN_STAGE_SECONDS.observe(time.perf_counter() - link_up_started, stage='link_up')
         
-        # 모니터 모드가 없으면 활성화 시도
-        if not self.monitor_interface:
-            print("[4단계] 모니터 모드 활성화 시도 중...")
-            self.monitor_interface = self.start_monitor_mode(self.interface)
-            if self.monitor_interface:
-                print(f"[성공] 모니터 모드 활성화: {self.monitor_interface}")
-            else:
-                print("[오류] 모니터 모드를 활성화할 수 없습니다.")
-                return []
+        return self.monitor_interface
+    
+    def scan_wifi(self) -> List[Dict[str, Any]]:
+        """실제 WiFi 스캔 수행 (실패하면 ScanError, 빈 목록은 AP가 없다는 뜻)"""
+        logger.info('WiFi 스캔 시작', extra={'interface': self.interface, 'duration': self.scan_duration})
+        scan_started = time.perf_counter()
         
-        print(f"[5단계] 사용할 모니터 인터페이스: {self.monitor_interface}")
+        # 인터페이스 감지 및 모니터 모드 준비
+        if not self.prepare_monitor_interface():
+            SCAN_SECONDS.observe(time.perf_counter() - scan_started, result='no_interface')
+            raise ScanError('모니터 모드 인터페이스를 준비할 수 없습니다.')
         
         try:
-            # 인터페이스 명시적으로 활성화
-            print(f"[6단계] 인터페이스 활성화 중...")
-            try:
-                up_result = subprocess.run(
-                    f"echo '{Config.SUDO_PASSWORD}' | sudo -S ip link set {self.monitor_interface} up",
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                print(f"  - 인터페이스 {self.monitor_interface} 활성화 완료")
-                time.sleep(1)
-            except Exception as e:
-                print(f"  - 경고: 인터페이스 활성화 중 오류 (무시하고 진행): {e}")
-            
-            # airodump-ng 실행
-            print(f"[7단계] airodump-ng 실행 준비")
-            print(f"  - 인터페이스: {self.monitor_interface}")
-            
-            cmd = f"echo '{Config.SUDO_PASSWORD}' | sudo -S -E airodump-ng --ignore-negative-one {self.monitor_interface}"
-            print(f"[8단계] airodump-ng 실행 중...")
-            print(f"  - 명령어: sudo -E airodump-ng --ignore-negative-one {self.monitor_interface}")
-            
-            # airodump-ng 실행 (백그라운드, stderr 무시)
-            process = subprocess.Popen(
-                cmd,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True
-            )
-            
-            print(f"[9단계] 스캔 대기 중... (최대 {self.scan_duration}초, 최대 15개)")
-            
-            # stdout을 실시간으로 읽어서 파싱
-            stdout_lines = []
-            found_bssids = set()
-            start_time = time.time()
-            MAX_WIFI_COUNT = 15
-            
-            # 스캔 시간 동안 stdout 읽기
-            early_stop = False
-            while time.time() - start_time < self.scan_duration:
-                if process.stdout:
-                    try:
-                        # non-blocking 읽기
-                        import select
-                        import sys
-                        
-                        if sys.platform != 'win32' and hasattr(select, 'select'):
-                            ready, _, _ = select.select([process.stdout], [], [], 0.1)
-                            if ready:
-                                line = process.stdout.readline()
-                                if line:
-                                    line_stripped = line.strip()
-                                    stdout_lines.append(line_stripped)
-                                    
-                                    # BSSID 패턴 체크
-                                    bssid_match = re.search(r'([0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}', line_stripped)
-                                    if bssid_match:
-                                        found_bssids.add(bssid_match.group())
-                                        print(f"  - WiFi 발견 중: {len(found_bssids)}개")
-                                        
-                                        # 15개 도달 시 조기 종료
-                                        if len(found_bssids) >= MAX_WIFI_COUNT:
-                                            elapsed = time.time() - start_time
-                                            print(f"  - 15개 도달! 조기 종료 ({elapsed:.1f}초)")
-                                            early_stop = True
-                                            break
-                        else:
-                            # Windows 또는 select가 없는 경우
-                            line = process.stdout.readline()
-                            if line:
-                                line_stripped = line.strip()
-                                stdout_lines.append(line_stripped)
-                                
-                                # BSSID 패턴 체크
-                                bssid_match = re.search(r'([0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}', line_stripped)
-                                if bssid_match:
-                                    found_bssids.add(bssid_match.group())
-                                    print(f"  - WiFi 발견 중: {len(found_bssids)}개")
-                                    
-                                    if len(found_bssids) >= MAX_WIFI_COUNT:
-                                        elapsed = time.time() - start_time
-                                        print(f"  - 15개 도달! 조기 종료 ({elapsed:.1f}초)")
-                                        early_stop = True
-                                        break
-                    except Exception:
-                        pass
-                
-                if early_stop:
-                    break
-                
-                time.sleep(0.1)
-            
-            if early_stop:
-                print(f"[9-1단계] 조기 종료: {len(found_bssids)}개 WiFi 발견")
-            
-            print(f"[10단계] airodump-ng 프로세스 종료 중...")
-            # 프로세스 강제 종료
-            try:
-                process.terminate()
-                time.sleep(0.5)
-                
-                if process.poll() is None:
-                    print(f"  - 프로세스 강제 종료 중...")
-                    process.kill()
-                    time.sleep(0.5)
-                
-                return_code = process.poll()
-                if return_code is None:
-                    print(f"  - 경고: 프로세스 종료 확인 실패, 계속 진행...")
-                else:
-                    print(f"  - 프로세스 종료 완료 (반환 코드: {return_code})")
-                    
-                    if return_code != 0 and return_code > 0:
-                        print(f"  - 오류: airodump-ng가 오류 코드 {return_code}로 종료되었습니다.")
-                    elif return_code < 0:
-                        signal_name = abs(return_code)
-                        signal_names = {15: "SIGTERM", 9: "SIGKILL"}
-                        signal_desc = signal_names.get(signal_name, f"신호 {signal_name}")
-                        print(f"  - 프로세스가 {signal_desc}로 종료됨 (정상 종료)")
-            except Exception as e:
-                print(f"  - 프로세스 종료 오류: {e}, 강제 종료 시도...")
-                try:
-                    process.kill()
-                    time.sleep(0.5)
-                except:
-                    pass
-            
-            # stdout 파이프 닫기 (블로킹 방지 - 수정된 부분!)
-            try:
-                if process.stdout:
-                    process.stdout.close()
-                    print(f"  - stdout 파이프 닫기 완료")
-            except Exception as e:
-                print(f"  - stdout 닫기 오류 (무시): {e}")
-            
-            print(f"[11단계] stdout 파싱 중... (총 {len(stdout_lines)}줄)")
-            
-            # stdout에서 WiFi 데이터 파싱
-            wifi_list = self.parse_airodump_stdout(stdout_lines)
-            print(f"[12단계] 파싱 완료: {len(wifi_list)}개의 WiFi 발견")
-            
-            if wifi_list:
-                for i, wifi in enumerate(wifi_list, 1):
-                    print(f"  {i}. {wifi.get('ssid', 'N/A')} ({wifi.get('bssid', 'N/A')}) - {wifi.get('protocol', 'N/A')}")
-            else:
-                print(f"  - 파싱된 WiFi가 없습니다.")
-            
-            print("=" * 50)
+            access_points = self.capture()
+            wifi_list = [self.access_point_to_wifi(ap) for ap in access_points.values()]
+            SCAN_ACCESS_POINTS.observe(len(wifi_list))
+            SCAN_SECONDS.observe(time.perf_counter() - scan_started, result='ok')
+            logger.info('WiFi 스캔 완료', extra={
+                'access_points': len(wifi_list),
+                'elapsed': round(time.perf_counter() - scan_started, 2)
+            })
+            if logger.isEnabledFor(logging.DEBUG):
+                for wifi in wifi_list:
+                    logger.debug('AP', extra={'ssid': wifi['ssid'], 'bssid': wifi['bssid'], 'protocol': wifi['protocol']})
             return wifi_list
             
         except Exception as e:
-            print(f"[오류] WiFi 스캔 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
+            SCAN_SECONDS.observe(time.perf_counter() - scan_started, result='error')
+            raise ScanError(f'WiFi 스캔 오류: {e}') from e
         finally:
             # 모니터 모드는 유지 (다음 스캔을 위해)
             pass
     
+    def capture(self, stop: Optional[Callable[[Dict[str, AccessPoint]], bool]] = None) -> Dict[str, AccessPoint]:
+        """준비된 모니터 인터페이스로 scan_duration 동안 airodump-ng를 실행하고 BSSID별 AP 행 반환
+
+        stop을 주면 AP 수 상한 대신 stop(현재 AP 행)이 참일 때 조기 종료합니다 (확인할 때마다 호출).
+        """
+        # airodump-ng 실행 (백그라운드, 화면 출력 대신 1초마다 갱신되는 CSV 파일을 파싱, 채널 계획이 있으면 그 채널만 순회)
+        airodump_started = time.perf_counter()
+        parse_seconds = 0.0
+        process = popen_privileged(
+            'scan',
+            session=self.scan_session,
+            interface=self.monitor_interface,
+            channels=self.channels,
+            preserve_env=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        output_prefix = process.output_prefix
+        logger.debug('airodump-ng 실행', extra={
+            'interface': self.monitor_interface, 'prefix': output_prefix, 'channels': len(self.channels) if self.channels else 'auto'
+        })
+        # 종료 감지 및 스캔 스레드가 멈춰도 airodump-ng가 남지 않도록 하는 기한
+        supervised = process_supervisor.watch(process, deadline=self.scan_duration + 10, name='airodump-ng')
+        
+        # CSV 파일이 갱신될 때마다 바뀐 행만 파싱
+        tail = None
+        start_time = time.time()
+        early_stop = False
+        
+        while time.time() - start_time < self.scan_duration:
+            if tail is None:
+                path = csv_path(output_prefix)
+                if path:
+                    tail = AirodumpCSVTail(path)
+            
+            poll_started = time.perf_counter()
+            changed = tail is not None and tail.poll()
+            parse_seconds += time.perf_counter() - poll_started
+            if changed:
+                logger.debug('WiFi 발견 중', extra={'access_points': len(tail), 'rate_limit': 1.0})
+            
+            # AP 수 상한 도달 시 조기 종료 (stop을 주면 호출자가 판단)
+            if stop is not None:
+                reached = stop(tail.access_points if tail is not None else {})
+            else:
+                reached = bool(changed) and len(tail) >= MAX_WIFI_COUNT
+            if reached:
+                elapsed = time.time() - start_time
+                logger.info('AP 수 상한 도달, 조기 종료', extra={
+                    'interface': self.monitor_interface, 'access_points': len(tail) if tail else 0,
+                    'elapsed': round(elapsed, 1)
+                })
+                early_stop = True
+                break
+            
+            # CSV는 1초마다 갱신되므로 0.2초 간격으로 확인 (airodump-ng가 먼저 종료되면 바로 깨어남)
+            if supervised.wait(0.2):
+                logger.error('airodump-ng가 스캔 중 종료되었습니다.', extra={
+                    'interface': self.monitor_interface, 'returncode': supervised.returncode
+                })
+                AIRODUMP_EXITS.inc(source='scan')
+                break
+        
+        if early_stop and stop is None:
+            SCAN_EARLY_STOPS.inc()
+        SCAN_STAGE_SECONDS.observe(time.perf_counter() - airodump_started, stage='airodump')
+        
+        stop_started = time.perf_counter()
+        # 프로세스 그룹 종료 (sudo/셸만 종료되고 airodump-ng가 남지 않도록)
+        try:
+            kill_process_tree(process, timeout=0.5)
+            if process.poll() is None:
+                logger.warning('airodump-ng 종료 확인 실패, 계속 진행')
+        except Exception as e:
+            logger.warning('airodump-ng 종료 오류: %s', e)
+        
+        SCAN_STAGE_SECONDS.observe(time.perf_counter() - stop_started, stage='airodump_stop')
+        
+        # 종료 직전에 기록된 내용 반영
+        parse_started = time.perf_counter()
+        if tail is None:
+            path = csv_path(output_prefix)
+            tail = AirodumpCSVTail(path) if path else None
+        if tail is not None:
+            tail.poll()
+        SCAN_STAGE_SECONDS.observe(parse_seconds + time.perf_counter() - parse_started, stage='parse')
+        
+        logger.debug('airodump-ng 캡처 종료', extra={
+            'interface': self.monitor_interface,
+            'access_points': len(tail) if tail else 0,
+            'csv_reads': tail.reads if tail else 0,
+            'csv_rows': tail.parsed_rows if tail else 0
+        })
+        return dict(tail.access_points) if tail else {}
+    
+    def access_point_to_wifi(self, ap: AccessPoint) -> Dict[str, Any]:
+        """CSV AP 행을 WiFi 정보로 변환"""
+        encryption = ap.encryption.upper()
+        protocol = self.parse_protocol(encryption)
+        
+        return {
+            'ssid': ap.essid or '<Hidden Network>',
+            'bssid': ap.bssid,
+            'protocol': protocol,
+            'channel': ap.channel if ap.channel > 0 else 0,
+            'signal_strength': ap.power if ap.power < 0 else 0,
+            'security_level': self.get_security_level(protocol),
+            'vulnerabilities': self.get_vulnerabilities(protocol),
+            'encryption': encryption,
+            'is_real_scan': True
+        }
+    
     def parse_airodump_stdout(self, lines: List[str]) -> List[Dict[str, Any]]:
         """airodump-ng stdout 파싱"""
         wifi_list = []
         
-        print(f"[stdout 파싱] 총 라인 수: {len(lines)}")
-        
         if not lines:
-            print(f"[stdout 파싱 오류] stdout이 비어있습니다.")
+            logger.warning('airodump-ng stdout이 비어있습니다.')
             return wifi_list
         
         # 헤더 찾기
@@ -345,27 +251,23 @@ class WiFiScanner:
         for i, line in enumerate(lines):
             if 'BSSID' in line and ('ESSID' in line or 'Station' in line):
                 header_line = i
-                print(f"[stdout 파싱] 헤더 라인 발견: {i}")
-                print(f"[stdout 파싱] 헤더 내용: {line.strip()[:100]}")
                 break
         
         if header_line is None:
-            print(f"[stdout 파싱 오류] 헤더를 찾을 수 없습니다.")
-            print(f"[stdout 파싱] 첫 10줄:")
-            for i, line in enumerate(lines[:10], 1):
-                print(f"  {i}: {line.strip()[:80]}")
+            logger.warning('airodump-ng stdout에서 헤더를 찾을 수 없습니다.', extra={
+                'lines': len(lines), 'head': [line.strip()[:80] for line in lines[:10]]
+            })
             return wifi_list
         
         # 데이터 파싱
         parsed_count = 0
         skipped_count = 0
         
-        for line_num, line in enumerate(lines[header_line + 1:], start=header_line + 2):
+        for line in lines[header_line + 1:]:
             line = line.strip()
             
             # Station 섹션 시작 시 중단
             if 'Station' in line or not line:
-                print(f"[stdout 파싱] 데이터 섹션 종료 (라인 {line_num})")
                 break
             
             # MAC 주소 형식 확인
@@ -447,9 +349,8 @@ class WiFiScanner:
             
             wifi_list.append(wifi_info)
             parsed_count += 1
-            print(f"[stdout 파싱] WiFi 발견 ({parsed_count}): {essid} ({bssid}) - {protocol}")
         
-        print(f"[stdout 파싱 완료] 파싱: {parsed_count}개, 건너뜀: {skipped_count}개")
+        logger.debug('airodump-ng stdout 파싱 완료', extra={'parsed': parsed_count, 'skipped': skipped_count})
         return wifi_list
     
     def parse_protocol(self, encryption: str) -> str:
@@ -505,5 +406,147 @@ class WiFiScanner:
         return merged_list
 
 
+
+def merge_access_points(groups: Iterable[Dict[str, AccessPoint]]) -> Dict[str, AccessPoint]:
+    """어댑터별 AP 행을 BSSID로 병합 (신호가 가장 센 행을 쓰고, 숨김 SSID와 마지막 확인 시각은 다른 행으로 보완)"""
+    merged: Dict[str, AccessPoint] = {}
+    for access_points in groups:
+        for bssid, ap in access_points.items():
+            current = merged.get(bssid)
+            if current is None:
+                merged[bssid] = ap
+                continue
+            # power는 음수 dBm, -1과 0 이상은 측정값 없음
+            best, other = (ap, current) if _signal(ap) > _signal(current) else (current, ap)
+            merged[bssid] = best._replace(
+                essid=best.essid or other.essid,
+                last_seen=max(best.last_seen, other.last_seen)
+            )
+    return merged
+
+
+def _signal(ap: AccessPoint) -> int:
+    return ap.power if ap.power < -1 else -1000
+
+
+class MultiAdapterScanner:
+    """여러 어댑터에 채널 계획을 나눠 맡겨 동시에 스캔하고 결과를 BSSID로 병합
+
+    예를 들어 어댑터가 둘이면 하나는 2.4GHz, 하나는 5GHz 채널만 순회하므로 한 어댑터가 모든 채널을
+    오가는 것보다 한 바퀴가 짧고 채널당 머무는 시간이 길어집니다.
+    모니터 모드를 준비하지 못한 어댑터의 채널은 준비된 어댑터들이 나눠 맡습니다.
+    """
+    
+    def __init__(self, interfaces: List[str], channels: Optional[List[int]] = None, scan_duration: int = 15):
+        """
+        Args:
+            interfaces: WiFi 어댑터 인터페이스 목록
+            channels: 나눠 맡을 채널 계획 (None이면 2.4GHz + 5GHz 전체)
+            scan_duration: 스캔 지속 시간 (초)
+        """
+        self.interfaces = list(interfaces)
+        self.channels = channels or DEFAULT_CHANNELS
+        self.scan_duration = scan_duration
+        self.scan_session = "scan"
+        self.shards: List[WiFiScanner] = []
+    
+    def prepare(self) -> List[WiFiScanner]:
+        """어댑터별 모니터 모드를 준비하고 준비된 어댑터에 채널 계획 분배 (채널을 맡은 스캐너 목록)"""
+        scanners = []
+        for interface in self.interfaces:
+            scanner = WiFiScanner(interface=interface, scan_duration=self.scan_duration)
+            scanner.scan_session = f'{self.scan_session}-{interface}'
+            scanners.append(scanner)
+        
+        # airmon-ng는 radio_manager가 하나씩 실행하지만 인터페이스 활성화 대기는 겹침
+        with ThreadPoolExecutor(max_workers=len(scanners), thread_name_prefix='scan-prepare') as pool:
+            monitors = list(pool.map(lambda scanner: scanner.prepare_monitor_interface(), scanners))
+        
+        ready = []
+        for scanner, monitor in zip(scanners, monitors):
+            if not monitor:
+                logger.warning('모니터 모드를 준비하지 못한 어댑터 제외', extra={'interface': scanner.interface})
+            elif any(other.monitor_interface == monitor for other in ready):
+                # 같은 무선 장치를 가리키는 어댑터 이름이 둘 이상이면 한 번만 사용
+                logger.warning('같은 모니터 인터페이스를 쓰는 어댑터 제외', extra={
+                    'interface': scanner.interface, 'monitor': monitor
+                })
+            else:
+                ready.append(scanner)
+        
+        for scanner, channels in zip(ready, shard_channels(self.channels, len(ready))):
+            scanner.channels = channels
+        self.shards = [scanner for scanner in ready if scanner.channels]
+        logger.debug('채널 계획 분배', extra={
+            'shards': {scanner.monitor_interface: scanner.channels for scanner in self.shards}
+        })
+        return self.shards
+    
+    def scan_wifi(self) -> List[Dict[str, Any]]:
+        """어댑터별 스캔을 동시에 실행하고 BSSID로 병합한 WiFi 목록 반환 (모든 어댑터가 실패하면 ScanError)"""
+        logger.info('다중 어댑터 WiFi 스캔 시작', extra={'interfaces': self.interfaces, 'duration': self.scan_duration})
+        scan_started = time.perf_counter()
+        
+        shards = self.prepare()
+        if not shards:
+            logger.error('스캔할 수 있는 어댑터가 없습니다.', extra={'interfaces': self.interfaces})
+            SCAN_SECONDS.observe(time.perf_counter() - scan_started, result='no_interface')
+            raise ScanError('스캔할 수 있는 어댑터가 없습니다.')
+        
+        # AP 수 상한은 어댑터별이 아니라 병합한 BSSID 수에 적용하고, 도달하면 모든 어댑터가 함께 멈춤
+        found = set()
+        found_lock = threading.Lock()
+        reached = threading.Event()
+        
+        def stop(access_points: Dict[str, AccessPoint]) -> bool:
+            if access_points and not reached.is_set():
+                with found_lock:
+                    found.update(access_points)
+                    if len(found) >= MAX_WIFI_COUNT:
+                        reached.set()
+            return reached.is_set()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix='scan-shard') as pool:
+                results = list(pool.map(lambda scanner: self._capture(scanner, stop), shards))
+            if reached.is_set():
+                SCAN_EARLY_STOPS.inc()
+            if all(result is None for result in results):
+                raise ScanError('모든 어댑터의 스캔이 실패했습니다.')
+            shards, results = zip(*[(scanner, result) for scanner, result in zip(shards, results) if result is not None])
+            access_points = merge_access_points(results)
+            wifi_list = [shards[0].access_point_to_wifi(ap) for ap in access_points.values()]
+            SCAN_ACCESS_POINTS.observe(len(wifi_list))
+            SCAN_SECONDS.observe(time.perf_counter() - scan_started, result='ok')
+            logger.info('다중 어댑터 WiFi 스캔 완료', extra={
+                'access_points': len(wifi_list),
+                'per_adapter': {scanner.monitor_interface: len(result) for scanner, result in zip(shards, results)},
+                'elapsed': round(time.perf_counter() - scan_started, 2)
+            })
+            return wifi_list
+        except Exception as e:
+            SCAN_SECONDS.observe(time.perf_counter() - scan_started, result='error')
+            if isinstance(e, ScanError):
+                raise
+            raise ScanError(f'다중 어댑터 WiFi 스캔 오류: {e}') from e
+    
+    @staticmethod
+    def _capture(scanner: WiFiScanner, stop: Callable[[Dict[str, AccessPoint]], bool]) -> Optional[Dict[str, AccessPoint]]:
+        # 어댑터 하나가 실패해도 나머지 결과는 사용 (실패하면 None)
+        try:
+            return scanner.capture(stop)
+        except Exception as e:
+            logger.exception('어댑터 스캔 오류: %s', e, extra={'interface': scanner.monitor_interface})
+            return None
+
+
+def create_scanner(interfaces: List[str], scan_duration: int = 15, channels: Optional[List[int]] = None):
+    """어댑터가 하나면 WiFiScanner, 둘 이상이면 MultiAdapterScanner"""
+    if len(interfaces) > 1:
+        return MultiAdapterScanner(interfaces, channels=channels, scan_duration=scan_duration)
+    return WiFiScanner(interface=interfaces[0] if interfaces else None, scan_duration=scan_duration,
+                       channels=channels or None)
+
+
 # 전역 인스턴스
 wifi_scanner = WiFiScanner()
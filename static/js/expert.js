@@ -528,6 +528,8 @@ document.addEventListener('DOMContentLoaded', function() {
     
     let currentCrackingId = null;
     let progressPollInterval = null;
+    let progressEventSource = null;
+    let lastProgressEventId = null;
     
     function performSecurityCheck(wifiData) {
         if (wifiData.protocol.toLowerCase() === 'open') {
@@ -540,11 +542,8 @@ document.addEventListener('DOMContentLoaded', function() {
         progressFill.style.width = '0%';
         progressText.textContent = '점검을 시작합니다...';
         
-        // 기존 polling 중지
-        if (progressPollInterval) {
-            clearInterval(progressPollInterval);
-            progressPollInterval = null;
-        }
+        // 기존 진행 상황 수신 중지
+        stopProgressUpdates();
         
         // 더미 데이터인지 확인
         const isRealScan = wifiData.is_real_scan === true;
@@ -569,8 +568,8 @@ document.addEventListener('DOMContentLoaded', function() {
                     // 크래킹 ID 저장
                     currentCrackingId = data.cracking_id;
                     
-                    // 실시간 진행 상황 polling 시작
-                    startProgressPolling(currentCrackingId);
+                    // 실시간 진행 상황 수신 시작 (SSE)
+                    startProgressStream(currentCrackingId);
                 } else {
                     showAlert('보안 점검 중 오류가 발생했습니다: ' + (data.error || '알 수 없는 오류'), 'error');
                     securityCheckProgress.style.display = 'none';
@@ -683,10 +682,20 @@ document.addEventListener('DOMContentLoaded', function() {
     
     // 보안 점검 취소
     window.cancelSecurityCheck = function() {
-        if (progressPollInterval) {
-            clearInterval(progressPollInterval);
-            progressPollInterval = null;
+        stopProgressUpdates();
+        
+        // 서버에서 실행 중인 크래킹 작업도 중단 (프로세스 종료)
+        if (currentCrackingId) {
+            fetchWithAuth('/api/expert/cracking-cancel', {
+                method: 'POST',
+                body: JSON.stringify({ cracking_id: currentCrackingId })
+            })
+            .catch(error => {
+                console.error('크래킹 취소 오류:', error);
+            });
+            currentCrackingId = null;
         }
+        
         securityCheckProgress.style.display = 'none';
         showAlert('보안 점검이 취소되었습니다.', 'warning');
     };
@@ -840,6 +849,66 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
     
+    function stopProgressUpdates() {
+        // 진행 상황 polling/스트림 중지
+        if (progressPollInterval) {
+            clearInterval(progressPollInterval);
+            progressPollInterval = null;
+        }
+        if (progressEventSource) {
+            progressEventSource.close();
+            progressEventSource = null;
+        }
+    }
+    
+    function startProgressStream(crackingId, resumeFromEventId = null, refreshTried = false) {
+        // 상태가 바뀔 때만 서버가 전송 (EventSource 미지원 브라우저는 polling)
+        if (!window.EventSource) {
+            startProgressPolling(crackingId);
+            return;
+        }
+        
+        stopProgressUpdates();
+        lastProgressEventId = resumeFromEventId;
+        
+        let url = `/api/expert/cracking-progress/stream?cracking_id=${encodeURIComponent(crackingId)}`;
+        if (resumeFromEventId) {
+            url += `&last_event_id=${encodeURIComponent(resumeFromEventId)}`;
+        }
+        
+        const eventSource = new EventSource(url);
+        progressEventSource = eventSource;
+        
+        eventSource.addEventListener('progress', (event) => {
+            lastProgressEventId = event.lastEventId;
+            refreshTried = false;
+            handleCrackingProgress(JSON.parse(event.data));
+        });
+        
+        eventSource.onerror = () => {
+            // 네트워크 오류는 브라우저가 Last-Event-ID로 자동 재연결
+            // 인증 만료(401) 등으로 연결이 닫히면 토큰 갱신 후 마지막 이벤트부터 다시 연결
+            if (eventSource !== progressEventSource || eventSource.readyState !== EventSource.CLOSED) {
+                return;
+            }
+            progressEventSource = null;
+            
+            // 갱신 직후에도 연결되지 않으면 polling으로 전환
+            if (refreshTried) {
+                startProgressPolling(crackingId);
+                return;
+            }
+            refreshAccessToken().then(refreshed => {
+                if (crackingId !== currentCrackingId) return;
+                if (refreshed) {
+                    startProgressStream(crackingId, lastProgressEventId, true);
+                } else {
+                    startProgressPolling(crackingId);
+                }
+            });
+        };
+    }
+    
     function startProgressPolling(crackingId) {
         // 즉시 한 번 조회
         checkCrackingProgress(crackingId);
@@ -859,59 +928,61 @@ document.addEventListener('DOMContentLoaded', function() {
             return response.json();
         })
         .then(data => {
-            if (data.success && data.progress) {
-                const progress = data.progress;
-                
-                // 진행률 업데이트
-                progressFill.style.width = `${progress.progress || 0}%`;
-                progressText.textContent = progress.message || '진행 중...';
+            if (data) handleCrackingProgress(data);
+        })
+        .catch(error => {
+            console.error('진행 상황 조회 오류:', error);
+        });
+    }
+    
+    function handleCrackingProgress(data) {
+        if (data.success && data.progress) {
+            const progress = data.progress;
+            
+            // 진행률 업데이트
+            progressFill.style.width = `${progress.progress || 0}%`;
+            progressText.textContent = progress.message || '진행 중...';
+            
+            // 크래킹 상태 확인
+            if (progress.status === 'completed') {
+                // 크래킹 완료
+                stopProgressUpdates();
                 
-                // 크래킹 상태 확인
-                if (progress.status === 'completed') {
-                    // 크래킹 완료
-                    clearInterval(progressPollInterval);
-                    progressPollInterval = null;
+                // 결과 표시
+                if (data.result && data.result.success) {
+                    const password = data.result.password || '알 수 없음';
+                    showAlert(`크래킹 성공!\n\n패스워드: ${password}\n\n방법: ${data.result.method || '알 수 없음'}`, 'success');
                     
-                    // 결과 표시
-                    if (data.result && data.result.success) {
-                        const password = data.result.password || '알 수 없음';
-                        showAlert(`크래킹 성공!\n\n패스워드: ${password}\n\n방법: ${data.result.method || '알 수 없음'}`, 'success');
-                        
-                        // WiFi 데이터 업데이트
-                        if (currentWifiData) {
-                            currentWifiData.check_status = 'vulnerable';
-                            currentWifiData.cracked_password = password;
-                            updateWifiListStatus();
-                        }
-                    } else {
-                        showAlert('크래킹이 완료되었지만 패스워드를 찾지 못했습니다.', 'warning');
+                    // WiFi 데이터 업데이트
+                    if (currentWifiData) {
+                        currentWifiData.check_status = 'vulnerable';
+                        currentWifiData.cracked_password = password;
+                        updateWifiListStatus();
                     }
-                    
-                    // 진행 표시 숨김
-                    setTimeout(() => {
-                        securityCheckProgress.style.display = 'none';
-                    }, 2000);
-                    
-                } else if (progress.status === 'failed' || progress.status === 'error') {
-                    // 크래킹 실패
-                    clearInterval(progressPollInterval);
-                    progressPollInterval = null;
-                    
-                    showAlert(`크래킹 실패: ${progress.message || '알 수 없는 오류'}`, 'error');
-                    
-                    // 진행 표시 숨김
-                    setTimeout(() => {
-                        securityCheckProgress.style.display = 'none';
-                    }, 2000);
+                } else {
+                    showAlert('크래킹이 완료되었지만 패스워드를 찾지 못했습니다.', 'warning');
                 }
-                // 'running' 상태는 계속 진행
-            } else {
-                console.error('진행 상황 조회 실패:', data.error);
+                
+                // 진행 표시 숨김
+                setTimeout(() => {
+                    securityCheckProgress.style.display = 'none';
+                }, 2000);
+                
+            } else if (data.final) {
+                // 크래킹 실패 (종료 상태 목록은 서버가 판단)
+                stopProgressUpdates();
+                
+                showAlert(`크래킹 실패: ${progress.message || '알 수 없는 오류'}`, 'error');
+                
+                // 진행 표시 숨김
+                setTimeout(() => {
+                    securityCheckProgress.style.display = 'none';
+                }, 2000);
             }
-        })
-        .catch(error => {
-            console.error('진행 상황 조회 오류:', error);
-        });
+            // 'queued', 'running' 상태는 계속 진행
+        } else {
+            console.error('진행 상황 조회 실패:', data.error);
+        }
     }
     
     function updateWifiListStatus() {
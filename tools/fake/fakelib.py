@@ -0,0 +1,174 @@
+"""airodump-ng/aircrack-ng stand-in 공용 함수
+
+cap_files의 캡처에서 AP 목록(비콘/프로브 응답)을 만들고, 녹화된 airodump-ng CSV 픽스처의 AP를 더합니다.
+stand-in 실행 파일은 이 디렉토리에서 실행되므로 저장소 루트를 import 경로에 추가합니다.
+"""
+import glob
+import os
+import struct
+import sys
+from typing import Dict, Iterator, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from config import Config  # noqa: E402
+from services import dot11  # noqa: E402
+from services.airodump_csv import parse_ap_row  # noqa: E402
+from services.pcap import open_capture  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+CSV_AP_HEADER = ('BSSID, First time seen, Last time seen, channel, Speed, Privacy, Cipher, '
+                 'Authentication, Power, # beacons, # IV, LAN IP, ID-length, ESSID, Key')
+CSV_STATION_HEADER = 'Station MAC, First time seen, Last time seen, Power, # packets, BSSID, Probed ESSIDs'
+
+_PCAP_GLOBAL_HEADER = 24
+_PCAP_RECORD = struct.Struct('<IIII')
+
+# RSN AKM 스위트 → airodump-ng AUTH 표기
+_AKM_NAMES = {1: 'MGT', 2: 'PSK', 6: 'PSK', 8: 'SAE'}
+
+
+def capture_files() -> List[str]:
+    """재생에 사용할 캡처 파일 목록"""
+    return sorted(
+        path for path in glob.glob(os.path.join(Config.CAPTURE_FILES_DIR, '*'))
+        if path.endswith(('.cap', '.pcap', '.pcapng'))
+    )
+
+
+def _security(capability: int, elements: Dict[int, List[bytes]]) -> Dict[str, object]:
+    """비콘 IE에서 airodump-ng Privacy/Cipher/Authentication/WPS 판정"""
+    privacy, ciphers, auths, wps = [], [], [], False
+    for value in elements.get(48, []):
+        # RSN: 버전(2) + 그룹 암호(4) + pairwise 수(2) + pairwise... + AKM 수(2) + AKM...
+        if len(value) < 8:
+            continue
+        count = struct.unpack_from('<H', value, 6)[0]
+        offset = 8 + 4 * count
+        suites = [value[8 + 4 * i + 3] for i in range(count) if 8 + 4 * i + 4 <= len(value)]
+        ciphers += ['CCMP' if suite == 4 else 'TKIP' if suite == 2 else 'GCMP' for suite in suites]
+        akms = []
+        if offset + 2 <= len(value):
+            akm_count = struct.unpack_from('<H', value, offset)[0]
+            akms = [value[offset + 2 + 4 * i + 3] for i in range(akm_count) if offset + 2 + 4 * i + 4 <= len(value)]
+        auths += [_AKM_NAMES.get(akm, 'PSK') for akm in akms]
+        privacy += ['WPA3'] if 8 in akms else []
+        privacy += ['WPA2'] if any(akm != 8 for akm in akms) or not akms else []
+    for value in elements.get(221, []):
+        if value[:4] == b'\x00\x50\xf2\x01':
+            privacy.append('WPA')
+            ciphers.append('TKIP')
+            auths.append('PSK')
+        elif value[:4] == b'\x00\x50\xf2\x04':
+            wps = True
+    if not privacy:
+        privacy = ['WEP'] if capability & 0x10 else ['OPN']
+        ciphers = ['WEP'] if capability & 0x10 else []
+
+    def unique(items):
+        return ' '.join(dict.fromkeys(items))
+
+    return {'privacy': unique(privacy), 'cipher': unique(ciphers), 'auth': unique(auths), 'wps': wps}
+
+
+def capture_access_points() -> List[Dict[str, object]]:
+    """캡처 파일의 비콘/프로브 응답에서 AP 목록 (BSSID당 하나)"""
+    access_points: Dict[str, Dict[str, object]] = {}
+    for path in capture_files():
+        with open_capture(path) as reader:
+            for _, frame in reader.dot11_frames():
+                ftype, subtype = dot11.frame_type(frame)
+                if ftype != dot11.TYPE_MANAGEMENT or subtype not in (dot11.SUBTYPE_BEACON, dot11.SUBTYPE_PROBE_RESPONSE):
+                    continue
+                if len(frame) < 36:
+                    continue
+                bssid = dot11.mac_to_str(bytes(frame[16:22])).upper()
+                if bssid in ('00:00:00:00:00:00', 'FF:FF:FF:FF:FF:FF'):
+                    continue
+                ap = access_points.get(bssid)
+                if ap is not None:
+                    ap['beacons'] += 1
+                    continue
+
+                elements: Dict[int, List[bytes]] = {}
+                for element_id, value in dot11.iter_elements(frame, 36):
+                    elements.setdefault(element_id, []).append(bytes(value))
+                ssid = elements.get(0, [b''])[0]
+                channel = elements.get(3, [b'\x00'])[0]
+                capability = struct.unpack_from('<H', frame, 34)[0]
+                access_points[bssid] = dict(
+                    _security(capability, elements),
+                    bssid=bssid,
+                    essid=ssid.rstrip(b'\x00').decode('utf-8', errors='replace'),
+                    channel=channel[0] if channel else 0,
+                    beacons=1,
+                    capture=path
+                )
+
+    # 신호 세기는 재현 가능하도록 순서대로 부여
+    for i, ap in enumerate(access_points.values()):
+        ap['power'] = -35 - 7 * i
+    return list(access_points.values())
+
+
+def fixture_access_points() -> List[Dict[str, object]]:
+    """녹화된 airodump-ng CSV 픽스처의 AP (캡처에 비콘이 없는 AP 등)"""
+    path = os.path.join(FIXTURES_DIR, 'airodump.csv')
+    if not os.path.exists(path):
+        return []
+    access_points = []
+    with open(path, 'rb') as f:
+        for line in f.read().split(b'Station MAC')[0].splitlines():
+            ap = parse_ap_row(line)
+            if ap is None:
+                continue
+            access_points.append({
+                'bssid': ap.bssid, 'essid': ap.essid, 'channel': ap.channel, 'privacy': ap.privacy,
+                'cipher': ap.cipher, 'auth': ap.auth, 'power': ap.power, 'beacons': ap.beacons,
+                'wps': False, 'capture': None
+            })
+    return access_points
+
+
+def all_access_points() -> List[Dict[str, object]]:
+    """캡처 AP + 픽스처 AP (같은 BSSID는 캡처 우선)"""
+    access_points = capture_access_points()
+    known = {ap['bssid'] for ap in access_points}
+    return access_points + [ap for ap in fixture_access_points() if ap['bssid'] not in known]
+
+
+def capture_for_bssid(bssid: str) -> Optional[str]:
+    """BSSID의 프레임이 들어 있는 캡처 파일"""
+    target = bytes.fromhex(bssid.replace(':', ''))
+    for path in capture_files():
+        with open_capture(path) as reader:
+            for _, frame in reader.dot11_frames():
+                if len(frame) >= 24 and target in (bytes(frame[4:10]), bytes(frame[10:16]), bytes(frame[16:22])):
+                    return path
+    return None
+
+
+def pcap_chunks(path: str, chunks: int) -> Iterator[bytes]:
+    """pcap 파일을 레코드 경계에서 chunks개 조각으로 분할 (첫 조각에 전역 헤더 포함)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:4] != b'\xd4\xc3\xb2\xa1':
+        # pcapng/빅엔디언은 분할하지 않고 한 번에 기록
+        yield data
+        return
+
+    boundaries = [_PCAP_GLOBAL_HEADER]
+    offset = _PCAP_GLOBAL_HEADER
+    while offset + _PCAP_RECORD.size <= len(data):
+        offset += _PCAP_RECORD.size + _PCAP_RECORD.unpack_from(data, offset)[2]
+        boundaries.append(min(offset, len(data)))
+
+    records = len(boundaries) - 1
+    per_chunk = max(1, -(-records // max(1, chunks)))
+    start = 0
+    for i in range(per_chunk, records + per_chunk, per_chunk):
+        end = boundaries[min(i, records)]
+        yield data[start:end]
+        start = end
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""가짜 도구로 스캔 → 병합 → 크래킹 → 진행 상황 전체 흐름 실행 (어댑터/sudo 불필요)
+
+    python tools/fake/pipeline.py [--bssid 00:0C:41:82:B2:55] [--rate 20]
+
+cap_files를 재생하는 airodump-ng/aircrack-ng stand-in을 사용하고, 찾을 키가 들어 있는
+임시 wordlist를 만들어 단계별 소요 시간을 출력합니다.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+DEFAULT_BSSID = '00:0C:41:82:B2:55'  # wpa2.pcap (Coherer)
+DEFAULT_KEY = 'Induction'
+
+
+def make_wordlist(path: str, key: str, filler: int):
+    """filler개의 오답 뒤에 key가 오는 wordlist"""
+    with open(path, 'w') as f:
+        for i in range(filler):
+            f.write(f'candidate{i:06d}\n')
+        f.write(key + '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bssid', default=DEFAULT_BSSID, help='크래킹할 AP')
+    parser.add_argument('--key', default=DEFAULT_KEY, help='wordlist에 넣을 키')
+    parser.add_argument('--filler', type=int, default=1000, help='키 앞의 오답 수')
+    parser.add_argument('--rate', type=float, default=20.0, help='FAKE_TOOLS_RATE')
+    parser.add_argument('--timeout', type=float, default=180.0, help='크래킹 대기 시간 (초)')
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix='wisafe_fake_')
+    wordlist_path = os.path.join(work_dir, 'wordlist.txt')
+    make_wordlist(wordlist_path, args.key, args.filler)
+
+    # Config는 import 시점에 환경 변수를 읽으므로 먼저 설정
+    os.environ.update({
+        'WIRELESS_TOOLS': 'fake',
+        'FAKE_TOOLS_RATE': str(args.rate),
+        'CRACKING_WORDLIST_PATH': wordlist_path,
+        'CRACKING_STATE_DIR': os.path.join(work_dir, 'state'),
+        'CRACKING_AUTO_RESUME': '0'
+    })
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    sys.path.insert(0, root)
+
+    from app import create_app
+    from config import Config
+
+    app = create_app()
+    client = app.test_client()
+    started = time.time()
+
+    def step(name: str):
+        print(f'[{time.time() - started:7.2f}s] {name}')
+
+    response = client.post('/expert/login', json={'username': 'admin', 'password': 'admin'})
+    headers = {'Authorization': f"Bearer {response.get_json()['access_token']}"}
+    step('로그인')
+
+    response = client.post('/api/expert/scan', json={'min_age': 2}, headers=headers)
+    wifi_list = response.get_json()['wifi_list']
+    real = [wifi for wifi in wifi_list if wifi.get('is_real_scan')]
+    step(f'스캔/병합: 전체 {len(wifi_list)}개, 실제 {len(real)}개')
+    for wifi in real:
+        print(f"           {wifi.get('bssid')}  {wifi.get('protocol'):<8} ch{wifi.get('channel')}  {wifi.get('ssid')}")
+
+    target = next((wifi for wifi in real if wifi.get('bssid', '').upper() == args.bssid.upper()), None)
+    if target is None:
+        print(f'{args.bssid}가 스캔 결과에 없습니다.')
+        return 1
+
+    response = client.post('/api/expert/security-check', json={'wifi_data': target}, headers=headers)
+    cracking_id = response.get_json().get('cracking_id')
+    step(f'크래킹 시작: {cracking_id} (WPA 핸드셰이크 대기 포함)')
+
+    last_message = None
+    deadline = time.time() + args.timeout
+    while time.time() < deadline:
+        data = client.get(f'/api/expert/cracking-progress?cracking_id={cracking_id}', headers=headers).get_json()
+        progress = data.get('progress') or {}
+        if progress.get('message') != last_message:
+            last_message = progress.get('message')
+            step(f"{progress.get('progress', 0):3}% {progress.get('status')}: {last_message}")
+        if data.get('result') is not None:
+            step(f"결과: {data['result']}")
+            break
+        time.sleep(0.5)
+    else:
+        step('시간 초과')
+
+    if Config.WIFI_SCANNER_DAEMON:
+        from services.scanner_daemon import scanner_daemon
+        scanner_daemon.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
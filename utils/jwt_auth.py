@@ -1,43 +1,155 @@
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
 import jwt
+from jwt.algorithms import HMACAlgorithm
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import lru_cache, wraps
 from flask import request, jsonify, current_app
 from typing import Dict, Optional, Tuple
+from config import Config
+
+_HS256 = HMACAlgorithm(HMACAlgorithm.SHA256)
+
+
+@lru_cache(maxsize=8)
+def _signing_key(secret_key: str) -> bytes:
+    """HS256 서명 키 (요청마다 다시 준비하지 않도록 비밀 키별로 한 번만 계산)"""
+    return _HS256.prepare_key(secret_key)
+
+
+def token_digest(token: str) -> bytes:
+    """캐시/폐기 목록 키로 쓰는 토큰 digest (원문 토큰은 보관하지 않음)"""
+    return hashlib.sha256(token.encode('utf-8')).digest()
+
+
+class TokenCache:
+    """검증된 토큰 payload LRU 캐시
+
+    토큰 digest와 비밀 키를 키로, 서명과 만료를 검증한 payload를 토큰의 exp까지 보관합니다.
+    폐기(revoke)한 토큰은 exp까지 별도 목록에 남겨 캐시 적중 여부와 관계없이 거부합니다.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Args:
+            max_size: 보관할 최대 토큰 수 (0이면 캐시 사용 안 함, 폐기 목록은 유지)
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Tuple[bytes, str], Dict]' = OrderedDict()
+        self._revoked: Dict[bytes, float] = {}  # digest -> exp
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, digest: bytes, secret_key: str) -> Optional[Dict]:
+        """만료되지 않은 캐시 payload (없으면 None)"""
+        key = (digest, secret_key)
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            if payload['exp'] <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return payload
+
+    def put(self, digest: bytes, secret_key: str, payload: Dict):
+        """검증된 payload 저장 (exp가 없는 토큰은 만료 시점을 알 수 없어 저장하지 않음)"""
+        if self.max_size <= 0 or not isinstance(payload.get('exp'), (int, float)):
+            return
+        with self._lock:
+            if digest in self._revoked:
+                return
+            self._entries[(digest, secret_key)] = payload
+            self._entries.move_to_end((digest, secret_key))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def is_revoked(self, digest: bytes) -> bool:
+        with self._lock:
+            return digest in self._revoked
+
+    def revoke(self, token: str):
+        """토큰 폐기 (캐시에서 제거하고 exp까지 검증 거부)"""
+        try:
+            # 만료 시점만 필요하므로 서명은 확인하지 않음 (위조 토큰은 어차피 검증 실패)
+            exp = jwt.decode(token, options={'verify_signature': False}).get('exp')
+        except jwt.InvalidTokenError:
+            return
+        if not isinstance(exp, (int, float)):
+            return
+
+        digest = token_digest(token)
+        now = time.time()
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == digest]:
+                del self._entries[key]
+            # 이미 만료된 폐기 항목은 검증에서도 거부되므로 정리
+            self._revoked = {revoked: until for revoked, until in self._revoked.items() if until > now}
+            if exp > now:
+                self._revoked[digest] = exp
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._revoked.clear()
 
 def generate_access_token(username: str, secret_key: str) -> str:
     """Access Token 생성 (15분 만료)"""
     payload = {
         'username': username,
         'type': 'access',
+        'jti': uuid.uuid4().hex,  # 같은 초에 발급한 토큰도 서로 달라야 하나만 폐기 가능
         'exp': datetime.utcnow() + timedelta(minutes=15),
         'iat': datetime.utcnow()
     }
-    return jwt.encode(payload, secret_key, algorithm='HS256')
+    return jwt.encode(payload, _signing_key(secret_key), algorithm='HS256')
 
 def generate_refresh_token(username: str, secret_key: str) -> str:
     """Refresh Token 생성 (7일 만료)"""
     payload = {
         'username': username,
         'type': 'refresh',
+        'jti': uuid.uuid4().hex,  # 같은 초에 발급한 토큰도 서로 달라야 하나만 폐기 가능
         'exp': datetime.utcnow() + timedelta(days=7),
         'iat': datetime.utcnow()
     }
-    return jwt.encode(payload, secret_key, algorithm='HS256')
+    return jwt.encode(payload, _signing_key(secret_key), algorithm='HS256')
 
 def verify_token(token: str, secret_key: str, token_type: str = 'access') -> Optional[Dict]:
-    """JWT 토큰 검증 및 디코딩"""
-    try:
-        payload = jwt.decode(token, secret_key, algorithms=['HS256'])
-        
-        # 토큰 타입 확인
-        if payload.get('type') != token_type:
-            return None
-            
-        return payload
-    except jwt.ExpiredSignatureError:
+    """JWT 토큰 검증 및 디코딩 (한 번 검증한 토큰은 exp까지 캐시에서 반환)"""
+    digest = token_digest(token)
+    if token_cache.is_revoked(digest):
         return None
-    except jwt.InvalidTokenError:
+    
+    payload = token_cache.get(digest, secret_key)
+    if payload is None:
+        try:
+            payload = jwt.decode(token, _signing_key(secret_key), algorithms=['HS256'])
+        except jwt.ExpiredSignatureError:
+            return None
+        except jwt.InvalidTokenError:
+            return None
+        token_cache.put(digest, secret_key, payload)
+    
+    # 토큰 타입 확인
+    if payload.get('type') != token_type:
         return None
+    
+    return dict(payload)
+
+def revoke_token(token: Optional[str]):
+    """로그아웃/갱신으로 더 이상 쓰지 않는 토큰 폐기"""
+    if token:
+        token_cache.revoke(token)
 
 def get_token_from_request() -> Optional[str]:
     """요청에서 JWT 토큰 추출 (쿠키 또는 Authorization 헤더)"""
@@ -81,7 +193,6 @@ def jwt_required(f):
     """JWT 인증 데코레이터 (JSON 응답용)"""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        from config import Config
         from flask import redirect, url_for
         
         token = get_token_from_request()
@@ -113,3 +224,5 @@ def jwt_required(f):
     
     return decorated_function
 
+# 전역 인스턴스
+token_cache = TokenCache(Config.JWT_CACHE_SIZE)
@@ -0,0 +1,158 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from config import Config
+
+# LogRecord 기본 속성 (나머지 extra={...} 항목은 구조화 필드로 출력)
+_RESERVED = set(vars(logging.LogRecord('', logging.INFO, '', 0, '', (), None))) | {'message', 'asctime', 'rate_limit'}
+
+_setup_lock = threading.Lock()
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional['BufferedQueueHandler'] = None
+
+
+def record_fields(record: logging.LogRecord) -> Dict[str, object]:
+    """extra로 전달된 구조화 필드"""
+    return {key: value for key, value in record.__dict__.items() if key not in _RESERVED and not key.startswith('_')}
+
+
+class StructuredFormatter(logging.Formatter):
+    """한 줄 로그 형식 (text: 메시지 뒤에 key=value, json: JSON 객체)"""
+
+    def __init__(self, json_output: bool = False):
+        super().__init__('%(asctime)s %(levelname)s %(name)s: %(message)s')
+        self.json_output = json_output
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        fields = record_fields(record)
+        if self.json_output:
+            data = {
+                'ts': round(record.created, 3),
+                'level': record.levelname,
+                'logger': record.name,
+                'msg': record.message,
+            }
+            data.update(fields)
+            if record.exc_info:
+                data['exc'] = self.formatException(record.exc_info)
+            return json.dumps(data, ensure_ascii=False, default=str)
+
+        record.asctime = self.formatTime(record)
+        line = self.formatMessage(record)
+        if fields:
+            line += ' ' + ' '.join(f'{key}={value}' for key, value in fields.items())
+        if record.exc_info:
+            line += '\n' + self.formatException(record.exc_info)
+        return line
+
+
+class RateLimitFilter(logging.Filter):
+    """extra={'rate_limit': 초}가 붙은 레코드는 같은 호출(로거 + 메시지 템플릿)당 주기마다 한 번만 통과
+
+    생략된 횟수는 다음에 통과하는 레코드의 suppressed 필드로 보고합니다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._last: Dict[Tuple[str, str], Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        interval = getattr(record, 'rate_limit', None)
+        if not interval:
+            return True
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            last, suppressed = self._last.get(key, (float('-inf'), 0))
+            if now - last < interval:
+                self._last[key] = (last, suppressed + 1)
+                return False
+            self._last[key] = (now, 0)
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class BufferedQueueHandler(logging.handlers.QueueHandler):
+    """호출 스레드에서는 레코드를 큐에 넣기만 하는 핸들러
+
+    출력(터미널, journald 파이프 등)은 QueueListener 스레드가 담당합니다.
+    큐가 가득 차면 호출 스레드를 막지 않고 레코드를 버리고 dropped를 늘립니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 포맷은 리스너 스레드에서 하고, 여기서는 인자만 문자열로 확정 (이후 객체가 바뀌어도 안전)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    """'services.wifi_scanner=DEBUG,werkzeug=WARNING' 형식의 모듈별 레벨"""
+    levels = {}
+    for item in spec.split(','):
+        name, sep, level = item.strip().partition('=')
+        if not sep or not name.strip():
+            continue
+        value = logging.getLevelName(level.strip().upper())
+        if isinstance(value, int):
+            levels[name.strip()] = value
+    return levels
+
+
+def setup_logging(level: Optional[str] = None, levels: Optional[str] = None, json_output: Optional[bool] = None,
+                  stream=None) -> BufferedQueueHandler:
+    """루트 로거에 큐 핸들러를 연결하고 백그라운드 출력 스레드 시작 (여러 번 호출해도 한 번만 설정)"""
+    global _listener, _queue_handler
+    with _setup_lock:
+        root = logging.getLogger()
+        root.setLevel(level or Config.LOG_LEVEL)
+        for name, value in parse_levels(Config.LOG_LEVELS if levels is None else levels).items():
+            logging.getLogger(name).setLevel(value)
+        if _queue_handler is not None:
+            return _queue_handler
+
+        output = logging.StreamHandler(stream or sys.stderr)
+        output.setFormatter(StructuredFormatter(Config.LOG_FORMAT == 'json' if json_output is None else json_output))
+
+        _queue_handler = BufferedQueueHandler(queue.Queue(Config.LOG_QUEUE_SIZE))
+        _queue_handler.addFilter(RateLimitFilter())
+        root.addHandler(_queue_handler)
+
+        _listener = logging.handlers.QueueListener(_queue_handler.queue, output, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+        return _queue_handler
+
+
+def shutdown_logging():
+    """남은 레코드를 모두 출력하고 출력 스레드 종료"""
+    global _listener, _queue_handler
+    with _setup_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        logging.getLogger().removeHandler(_queue_handler)
+        if _queue_handler.dropped:
+            print(f'로그 큐가 가득 차 {_queue_handler.dropped}건을 버렸습니다.', file=sys.stderr)
+        _listener = None
+        _queue_handler = None
@@ -0,0 +1,613 @@
+"""root 권한 도구 실행 도우미
+
+앱이 권한이 필요한 도구를 실행할 때마다 `echo 비밀번호 | sudo -S` 셸 파이프라인을 만드는 대신,
+root로 한 번 띄워 둔 도우미에 Unix 소켓으로 요청합니다.
+
+    sudo python -m utils.privhelper --allow-uid $(id -u)   # PRIV_HELPER_SOCKET에서 대기
+
+요청/응답은 한 줄짜리 JSON이며, 요청은 도구 인자가 아니라 이름이 정해진 작업(monitor_start, scan, capture,
+crack 등)과 검증된 값(인터페이스 이름, BSSID, 채널)입니다. 도구 인자는 도우미 안에서 만들고, 스캔/캡처 출력은
+도우미가 소유한 출력 디렉토리(TOOL_OUTPUT_DIR)의 세션별 하위 디렉토리에만 씁니다.
+spawn 요청은 앱이 만든 파이프 끝을 SCM_RIGHTS로 함께 보내 자식 프로세스의 stdin/stdout/stderr로 사용합니다.
+자식은 도우미가 새 세션으로 실행하고 소유하므로 앱은 pid로 상태를 묻고 프로세스 그룹 전체에 신호를 보낼 수 있으며,
+앱 프로세스가 죽으면 도우미가 정리합니다. 도우미 소켓이 없으면 같은 작업을 sudo로 실행합니다.
+"""
+import argparse
+import json
+import logging
+import os
+import re
+import resource
+import shlex
+import shutil
+import signal
+import socket
+import stat
+import struct
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import Config
+from utils.tools import tool_argv, tool_command
+
+logger = logging.getLogger(__name__)
+
+# 도우미가 수행하는 작업 (그 외 요청은 거부)
+RUN_OPERATIONS = ('monitor_start', 'monitor_stop', 'link_up')  # 완료까지 대기
+SPAWN_OPERATIONS = ('scan', 'capture', 'crack')  # 백그라운드 실행
+
+_INTERFACE_PATTERN = re.compile(r'^[A-Za-z0-9_][A-Za-z0-9_.-]{0,14}$')  # IFNAMSIZ - 1
+_BSSID_PATTERN = re.compile(r'^(?:[0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}$')
+_NAME_PATTERN = re.compile(r'^[A-Za-z0-9_][A-Za-z0-9_.:-]{0,127}$')  # 출력 세션/파일 이름 (경로 구분자 불가)
+
+_MAX_FDS = 3
+_RETRY_AFTER = 5.0  # 연결 실패 후 다시 시도하기까지 (초)
+_KEEP_FINISHED = 60.0  # 종료된 자식의 반환 코드 보관 시간 (초)
+
+
+class HelperError(OSError):
+    """도우미가 요청을 거부하거나 처리하지 못함"""
+
+
+class HelperUnavailable(HelperError):
+    """도우미에 연결할 수 없음 (sudo 방식으로 대체)"""
+
+
+def _interface(value: Any) -> str:
+    if not isinstance(value, str) or not _INTERFACE_PATTERN.match(value):
+        raise ValueError(f'잘못된 인터페이스 이름: {value!r}')
+    return value
+
+
+def _bssid(value: Any) -> str:
+    if not isinstance(value, str) or not _BSSID_PATTERN.match(value):
+        raise ValueError(f'잘못된 BSSID: {value!r}')
+    return value.upper()
+
+
+def _channel(value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, (int, str)) or not str(value).isdigit():
+        raise ValueError(f'잘못된 채널: {value!r}')
+    channel = int(value)
+    if not 1 <= channel <= 196:
+        raise ValueError(f'잘못된 채널: {value!r}')
+    return channel
+
+
+def _name(value: Any) -> str:
+    if not isinstance(value, str) or not _NAME_PATTERN.match(value):
+        raise ValueError(f'잘못된 출력 이름: {value!r}')
+    return value
+
+
+def _under(path: str, root: str) -> bool:
+    root = os.path.realpath(root)
+    return os.path.realpath(path).startswith(root + os.sep)
+
+
+def build_command(op: str, params: Dict[str, Any], output_root: str) -> Tuple[List[str], Optional[str]]:
+    """작업 이름과 값으로 도구 인자 목록과 출력 파일 접두사 만들기 (검증 실패 시 ValueError)
+
+    출력 파일은 output_root/<session>/<name>-NN.* 에만 쓰고, crack은 output_root 아래의 .cap 파일만 읽습니다.
+    """
+    if op == 'monitor_start':
+        return ['airmon-ng', 'start', _interface(params.get('interface'))], None
+    if op == 'monitor_stop':
+        return ['airmon-ng', 'stop', _interface(params.get('interface'))], None
+    if op == 'link_up':
+        return ['ip', 'link', 'set', _interface(params.get('interface')), 'up'], None
+    if op == 'scan':
+        prefix = os.path.join(output_root, _name(params.get('session')), 'scan')
+        argv = ['airodump-ng', '--ignore-negative-one', '--output-format', 'csv', '--write-interval', '1', '-w', prefix]
+        channels = params.get('channels') or []
+        if not isinstance(channels, list):
+            raise ValueError('channels는 채널 번호 목록이어야 합니다.')
+        if channels:
+            argv += ['-c', ','.join(str(_channel(channel)) for channel in channels)]
+        return argv + [_interface(params.get('interface'))], prefix
+    if op == 'capture':
+        prefix = os.path.join(output_root, _name(params.get('session')), _name(params.get('name', 'capture')))
+        return ['airodump-ng', '-c', str(_channel(params.get('channel'))), '--bssid', _bssid(params.get('bssid')),
+                '-w', prefix, '--output-format', 'cap', _interface(params.get('interface'))], prefix
+    if op == 'crack':
+        capture = params.get('capture')
+        if not isinstance(capture, str) or not capture.endswith('.cap') or not _under(capture, output_root):
+            raise ValueError(f'출력 디렉토리 밖의 캡처 파일: {capture!r}')
+        argv = ['aircrack-ng']
+        wordlist = params.get('wordlist')
+        if wordlist is not None:
+            if not isinstance(wordlist, str) or not os.path.isabs(wordlist) or not os.path.isfile(wordlist):
+                raise ValueError(f'잘못된 wordlist: {wordlist!r}')
+            argv += ['-w', wordlist]
+        if params.get('bssid') is not None:
+            argv += ['-b', _bssid(params.get('bssid'))]
+        return argv + [os.path.realpath(capture)], None
+    raise ValueError(f'알 수 없는 작업: {op}')
+
+
+def _clear_outputs(prefix: str):
+    """이전 실행의 airodump-ng 출력 파일 삭제 (-01 번호가 다시 쓰이도록)"""
+    directory, name = os.path.split(prefix)
+    for entry in os.listdir(directory):
+        if entry.startswith(name + '-'):
+            try:
+                os.unlink(os.path.join(directory, entry))
+            except OSError:
+                pass
+
+
+def _peer_credentials(conn: socket.socket):
+    """연결한 프로세스의 (pid, uid, gid)"""
+    return struct.unpack('3i', conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i')))
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class _Child:
+    """도우미가 실행한 자식 프로세스"""
+
+    def __init__(self, process: subprocess.Popen, owner: int):
+        self.process = process
+        self.owner = owner  # 요청한 앱 프로세스 pid (죽으면 자식도 종료)
+        self.finished_at: Optional[float] = None
+        self.killed_at: Optional[float] = None
+
+
+class PrivilegedHelper:
+    """root 쪽 도우미 서버 (연결마다 스레드 하나)"""
+
+    def __init__(self, path: str, allowed_uids: Optional[List[int]] = None, output_root: str = Config.TOOL_OUTPUT_DIR):
+        self.path = path
+        self.output_root = os.path.abspath(output_root)
+        self.allowed_uids = {0, os.getuid()} | set(allowed_uids or ())
+        self.children: Dict[int, _Child] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._server: Optional[socket.socket] = None
+
+    def serve_forever(self):
+        # 도구 출력 파일은 도우미만 쓸 수 있는 디렉토리에 만듦 (앱 쪽에서 심볼릭 링크를 심어 root 쓰기를 유도할 수 없도록)
+        os.umask(0o022)
+        os.makedirs(self.output_root, mode=0o755, exist_ok=True)
+        self._check_owned(self.output_root)
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        # 접근 제어는 SO_PEERCRED uid 검사로 함
+        os.chmod(self.path, 0o666)
+        self._server.listen(16)
+        threading.Thread(target=self._reap, daemon=True, name='privhelper-reaper').start()
+        logger.info('권한 도우미 대기 중', extra={'socket': self.path, 'uids': sorted(self.allowed_uids)})
+
+        try:
+            while not self._stop.is_set():
+                try:
+                    conn, _ = self._server.accept()
+                except OSError:
+                    break
+                threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        """대기 중단 및 남은 자식 프로세스 그룹 종료"""
+        self._stop.set()
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+        with self._lock:
+            children = list(self.children.values())
+        for child in children:
+            if child.process.poll() is None:
+                self._killpg(child.process.pid, signal.SIGKILL)
+
+    @staticmethod
+    def _check_owned(path: str):
+        st = os.lstat(path)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.geteuid() or st.st_mode & 0o022:
+            raise HelperError(f'{path}는 도우미 소유이고 다른 사용자가 쓸 수 없는 디렉토리여야 합니다.')
+
+    def _session_dir(self, session: str) -> str:
+        path = os.path.join(self.output_root, _name(session))
+        try:
+            os.mkdir(path, 0o755)
+        except FileExistsError:
+            pass
+        self._check_owned(path)
+        return path
+
+    def _serve(self, conn: socket.socket):
+        with conn:
+            peer_pid, peer_uid, peer_gid = _peer_credentials(conn)
+            if peer_uid not in self.allowed_uids:
+                logger.warning('허용되지 않은 uid의 연결 거부', extra={'pid': peer_pid, 'uid': peer_uid})
+                return
+            buffer = b''
+            fds: List[int] = []
+            while True:
+                while b'\n' not in buffer:
+                    try:
+                        data, new_fds, _, _ = socket.recv_fds(conn, 65536, _MAX_FDS)
+                    except OSError:
+                        data, new_fds = b'', []
+                    fds.extend(new_fds)
+                    if not data:
+                        for fd in fds:
+                            os.close(fd)
+                        return
+                    buffer += data
+                line, buffer = buffer.split(b'\n', 1)
+                try:
+                    response = self.handle(json.loads(line), fds, peer_pid, peer_uid, peer_gid)
+                except Exception as e:
+                    response = {'ok': False, 'error': str(e)}
+                for fd in fds:
+                    os.close(fd)
+                fds = []
+                conn.sendall(json.dumps(response).encode() + b'\n')
+
+    def handle(self, request: Dict[str, Any], fds: List[int], owner: int, uid: Optional[int] = None,
+               gid: Optional[int] = None) -> Dict[str, Any]:
+        """요청 하나 처리 (owner/uid/gid는 요청한 앱 프로세스)"""
+        op = request.get('op')
+        if op == 'ping':
+            return {'ok': True, 'pid': os.getpid(), 'output_root': self.output_root}
+        if op in RUN_OPERATIONS:
+            return self._run(op, request)
+        if op in SPAWN_OPERATIONS:
+            return self._spawn(op, request, fds, owner, uid, gid)
+        if op == 'discard':
+            shutil.rmtree(os.path.join(self.output_root, _name(request.get('session'))), ignore_errors=True)
+            return {'ok': True}
+        if op in ('poll', 'wait', 'signal'):
+            with self._lock:
+                child = self.children.get(int(request.get('pid', -1)))
+            if child is None:
+                return {'ok': False, 'error': '도우미가 실행한 프로세스가 아닙니다.'}
+            if op == 'signal':
+                sig = signal.Signals(int(request['signal']))
+                # 이미 회수한 자식의 pid는 다른 프로세스(그룹)에 재사용될 수 있으므로 살아 있을 때만 신호
+                if child.process.poll() is not None:
+                    return {'ok': True}
+                if request.get('group', True):
+                    self._killpg(child.process.pid, sig)
+                else:
+                    child.process.send_signal(sig)
+                return {'ok': True}
+            try:
+                returncode = child.process.wait(timeout=float(request.get('timeout', 0))) if op == 'wait' else child.process.poll()
+            except subprocess.TimeoutExpired:
+                returncode = None
+            return {'ok': True, 'returncode': returncode}
+        return {'ok': False, 'error': f'알 수 없는 요청: {op}'}
+
+    def _run(self, op: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        args, _ = build_command(op, request, self.output_root)
+        argv = tool_argv(args)
+        timeout = request.get('timeout')
+        process = subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                   start_new_session=True)
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._killpg(process.pid, signal.SIGKILL)
+            process.communicate()
+            return {'ok': False, 'error': f'{argv[0]} 시간 초과 ({timeout}초)', 'timeout': True}
+        return {
+            'ok': True,
+            'args': args,
+            'returncode': process.returncode,
+            'stdout': stdout.decode(errors='replace'),
+            'stderr': stderr.decode(errors='replace')
+        }
+
+    def _spawn(self, op: str, request: Dict[str, Any], fds: List[int], owner: int, uid: Optional[int],
+               gid: Optional[int]) -> Dict[str, Any]:
+        args, prefix = build_command(op, request, self.output_root)
+        if prefix is not None:
+            self._session_dir(request['session'])
+            _clear_outputs(prefix)
+        argv = tool_argv(args)
+        streams = request.get('streams', [None, None, None])
+        if len(streams) != 3:
+            raise ValueError('streams는 [stdin, stdout, stderr] 형식이어야 합니다.')
+        # streams[i]는 받은 fd 목록의 인덱스 (None이면 /dev/null)
+        stdio = [fds[index] if index is not None else subprocess.DEVNULL for index in streams]
+
+        preexec_fn = None
+        cpu_limit = request.get('cpu_limit')
+        if cpu_limit:
+            cpu_limit = int(cpu_limit)
+            preexec_fn = lambda: resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit, cpu_limit + 5))
+
+        # aircrack-ng는 root가 필요 없으므로 요청한 사용자 권한으로 실행 (wordlist는 그 사용자가 읽을 수 있는 파일만)
+        credentials = {}
+        if op == 'crack' and os.geteuid() == 0 and uid is not None:
+            credentials = {'user': uid, 'group': gid, 'extra_groups': []}
+
+        process = subprocess.Popen(argv, stdin=stdio[0], stdout=stdio[1], stderr=stdio[2],
+                                   start_new_session=True, preexec_fn=preexec_fn, **credentials)
+        with self._lock:
+            self.children[process.pid] = _Child(process, owner)
+        return {'ok': True, 'pid': process.pid, 'args': args, 'output': prefix}
+
+    @staticmethod
+    def _killpg(pid: int, sig: int):
+        try:
+            os.killpg(pid, sig)
+        except OSError:
+            pass
+
+    def _reap(self):
+        """종료된 자식 정리, 요청한 앱 프로세스가 죽은 자식은 종료"""
+        while not self._stop.wait(1.0):
+            now = time.monotonic()
+            with self._lock:
+                children = list(self.children.items())
+            for pid, child in children:
+                if child.process.poll() is not None:
+                    if child.finished_at is None:
+                        child.finished_at = now
+                    elif now - child.finished_at > _KEEP_FINISHED:
+                        with self._lock:
+                            self.children.pop(pid, None)
+                elif not _pid_alive(child.owner):
+                    # SIGTERM 후 응답이 없으면 SIGKILL
+                    self._killpg(pid, signal.SIGKILL if child.killed_at and now - child.killed_at > 5 else signal.SIGTERM)
+                    child.killed_at = child.killed_at or now
+
+
+class HelperProcess:
+    """도우미가 실행한 프로세스 (subprocess.Popen에서 쓰는 부분만 같은 인터페이스)"""
+
+    def __init__(self, client: 'HelperClient', pid: int, args: List[str], stdin=None, stdout=None, stderr=None,
+                 output_prefix: Optional[str] = None):
+        self.client = client
+        self.pid = pid
+        self.args = args
+        self.output_prefix = output_prefix  # 출력 파일 접두사 (<접두사>-01.csv 등)
+        self.stdin = stdin
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None:
+            self.returncode = self.client.request({'op': 'poll', 'pid': self.pid})['returncode']
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.returncode is None:
+            chunk = 1.0 if deadline is None else max(0.0, min(1.0, deadline - time.monotonic()))
+            self.returncode = self.client.request({'op': 'wait', 'pid': self.pid, 'timeout': chunk})['returncode']
+            if self.returncode is None and deadline is not None and time.monotonic() >= deadline:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+        return self.returncode
+
+    def send_signal(self, sig: int):
+        self.client.request({'op': 'signal', 'pid': self.pid, 'signal': int(sig), 'group': False})
+
+    def signal_group(self, sig: int):
+        """프로세스 그룹 전체에 신호 (kill_process_tree에서 사용)"""
+        self.client.request({'op': 'signal', 'pid': self.pid, 'signal': int(sig), 'group': True})
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+
+class HelperClient:
+    """도우미 클라이언트 (연결을 풀에 보관하여 재사용)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._idle: List[tuple] = []
+        self._lock = threading.Lock()
+        self._failed_at = float('-inf')
+
+    def available(self) -> bool:
+        """도우미 소켓이 있고 최근 연결 실패가 없으면 True"""
+        return bool(self.path) and time.monotonic() - self._failed_at > _RETRY_AFTER and os.path.exists(self.path)
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.path)
+        except OSError as e:
+            sock.close()
+            self._failed_at = time.monotonic()
+            raise HelperUnavailable(f'권한 도우미에 연결할 수 없습니다: {e}') from e
+        return sock, sock.makefile('rb')
+
+    def request(self, request: Dict[str, Any], fds: List[int] = ()) -> Dict[str, Any]:
+        """요청 하나 보내고 응답 받기 (실패하면 HelperError)"""
+        with self._lock:
+            connection = self._idle.pop() if self._idle else None
+        if connection is None:
+            connection = self._connect()
+        sock, reader = connection
+        payload = json.dumps(request).encode() + b'\n'
+        try:
+            if fds:
+                socket.send_fds(sock, [payload], list(fds))
+            else:
+                sock.sendall(payload)
+            line = reader.readline()
+        except OSError as e:
+            reader.close()
+            sock.close()
+            raise HelperUnavailable(f'권한 도우미 연결 오류: {e}') from e
+        if not line:
+            reader.close()
+            sock.close()
+            self._failed_at = time.monotonic()
+            raise HelperUnavailable('권한 도우미가 연결을 닫았습니다.')
+
+        with self._lock:
+            self._idle.append(connection)
+        response = json.loads(line)
+        if not response.get('ok'):
+            if response.get('timeout'):
+                raise subprocess.TimeoutExpired(request.get('op'), request.get('timeout'))
+            raise HelperError(response.get('error', '권한 도우미 오류'))
+        return response
+
+    def run(self, op: str, timeout: Optional[float] = None, **params) -> subprocess.CompletedProcess:
+        response = self.request(dict(params, op=op, timeout=timeout))
+        return subprocess.CompletedProcess(response['args'], response['returncode'], response['stdout'], response['stderr'])
+
+    def spawn(self, op: str, stdin=None, stdout=None, stderr=None, text: bool = False,
+              cpu_limit: Optional[int] = None, **params) -> HelperProcess:
+        """도우미에서 작업 실행 (stdin/stdout/stderr는 subprocess.PIPE, DEVNULL 또는 None)"""
+        send_fds, streams, local = [], [], []
+        try:
+            for i, spec in enumerate((stdin, stdout, stderr)):
+                if spec == subprocess.PIPE:
+                    read_fd, write_fd = os.pipe()
+                    child_fd, parent_fd = (read_fd, write_fd) if i == 0 else (write_fd, read_fd)
+                    streams.append(len(send_fds))
+                    send_fds.append(child_fd)
+                    mode = ('w' if i == 0 else 'r') + ('' if text else 'b')
+                    local.append(open(parent_fd, mode, buffering=-1 if i or not text else 1))
+                else:
+                    streams.append(None)
+                    local.append(None)
+            response = self.request(dict(params, op=op, streams=streams, cpu_limit=cpu_limit), send_fds)
+        except BaseException:
+            for stream in local:
+                if stream is not None:
+                    stream.close()
+            raise
+        finally:
+            for fd in send_fds:
+                os.close(fd)
+        return HelperProcess(self, response['pid'], response['args'], *local, output_prefix=response['output'])
+
+
+def _local_command(op: str, params: Dict[str, Any]) -> Tuple[List[str], Optional[str]]:
+    """도우미 없이 sudo로 실행할 때의 도구 인자 (출력 디렉토리는 앱이 만들고 이전 출력 정리)"""
+    args, prefix = build_command(op, params, Config.TOOL_OUTPUT_DIR)
+    if prefix is not None:
+        os.makedirs(os.path.dirname(prefix), exist_ok=True)
+        _clear_outputs(prefix)
+    return args, prefix
+
+
+def run_privileged(op: str, timeout: Optional[float] = None, preserve_env: bool = False,
+                   **params) -> subprocess.CompletedProcess:
+    """root 권한 작업 실행 후 완료 대기 (monitor_start/monitor_stop/link_up, 도우미가 없으면 sudo, 출력은 텍스트)"""
+    if op not in RUN_OPERATIONS:
+        raise ValueError(f'알 수 없는 작업: {op}')
+    if helper_client.available():
+        try:
+            return helper_client.run(op, timeout=timeout, **params)
+        except HelperUnavailable as e:
+            logger.warning('%s, sudo로 실행', e)
+    args, _ = _local_command(op, params)
+    return subprocess.run(
+        tool_command(shlex.join(args), preserve_env=preserve_env),
+        shell=True,
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
+
+
+def popen_privileged(op: str, cpu_limit: Optional[int] = None, preserve_env: bool = False, stdin=None,
+                     stdout=None, stderr=None, text: bool = False, **params):
+    """root 권한 작업을 새 세션(프로세스 그룹)으로 실행 (도우미가 없으면 sudo, kill_process_tree로 종료)
+
+    scan(session, interface, channels), capture(session, name, interface, bssid, channel),
+    crack(capture, wordlist, bssid) 작업을 실행하며, 반환한 프로세스의 output_prefix가 출력 파일 접두사입니다.
+
+    Args:
+        cpu_limit: CPU 시간 제한 (RLIMIT_CPU, 초)
+    """
+    if op not in SPAWN_OPERATIONS:
+        raise ValueError(f'알 수 없는 작업: {op}')
+    if helper_client.available():
+        try:
+            return helper_client.spawn(op, stdin=stdin, stdout=stdout, stderr=stderr, text=text, cpu_limit=cpu_limit,
+                                       **params)
+        except HelperUnavailable as e:
+            logger.warning('%s, sudo로 실행', e)
+
+    args, prefix = _local_command(op, params)
+    preexec_fn = None
+    if cpu_limit:
+        preexec_fn = lambda: resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit, cpu_limit + 5))
+    process = subprocess.Popen(
+        tool_command(shlex.join(args), preserve_env=preserve_env),
+        shell=True,
+        start_new_session=True,
+        preexec_fn=preexec_fn,
+        stdin=stdin,
+        stdout=stdout,
+        stderr=stderr,
+        text=text
+    )
+    process.output_prefix = prefix
+    return process
+
+
+def discard_output(session: str):
+    """세션 출력 디렉토리 삭제 (도우미 소유 디렉토리는 도우미가 삭제)"""
+    if helper_client.available():
+        try:
+            helper_client.request({'op': 'discard', 'session': session})
+            return
+        except HelperUnavailable as e:
+            logger.warning('%s, 직접 삭제', e)
+    shutil.rmtree(os.path.join(Config.TOOL_OUTPUT_DIR, _name(session)), ignore_errors=True)
+
+
+# 전역 인스턴스
+helper_client = HelperClient(Config.PRIV_HELPER_SOCKET)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m utils.privhelper', description='WiSafe 권한 도우미')
+    parser.add_argument('--socket', default=Config.PRIV_HELPER_SOCKET, help='Unix 소켓 경로')
+    parser.add_argument('--allow-uid', type=int, action='append', default=[],
+                        help='연결을 허용할 uid (root와 sudo를 실행한 사용자는 항상 허용)')
+    parser.add_argument('--output-dir', default=Config.TOOL_OUTPUT_DIR,
+                        help='스캔/캡처 출력 디렉토리 (도우미 소유, 다른 사용자가 쓸 수 없어야 함)')
+    args = parser.parse_args()
+
+    from utils.log import setup_logging
+    setup_logging()
+
+    allowed = list(args.allow_uid)
+    if os.environ.get('SUDO_UID'):
+        allowed.append(int(os.environ['SUDO_UID']))
+    helper = PrivilegedHelper(args.socket, allowed, args.output_dir)
+    signal.signal(signal.SIGTERM, lambda *_: helper.shutdown())
+    try:
+        helper.serve_forever()
+    except KeyboardInterrupt:
+        helper.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
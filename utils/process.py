@@ -0,0 +1,65 @@
+import multiprocessing
+import os
+import signal
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _signal_group(process, sig: int):
+    # 권한 도우미가 실행한 프로세스(HelperProcess)는 도우미가 root로 신호를 보냄
+    signal_group = getattr(process, 'signal_group', None)
+    if signal_group is not None:
+        signal_group(sig)
+    else:
+        os.killpg(process.pid, sig)
+
+
+def kill_process_tree(process: subprocess.Popen, timeout: float = 5):
+    """프로세스 그룹 전체 종료 (SIGTERM 후 응답이 없으면 SIGKILL)
+
+    start_new_session=True로 실행한 프로세스에만 사용합니다 (pid == 프로세스 그룹 ID).
+    sudo는 받은 신호를 실행한 명령에 전달하므로 root로 실행된 airodump-ng 등도 함께 종료됩니다.
+    """
+    try:
+        _signal_group(process, signal.SIGTERM)
+    except OSError:
+        pass
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        try:
+            _signal_group(process, signal.SIGKILL)
+        except OSError:
+            process.kill()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            pass
+
+
+def pool_context():
+    """스레드가 많은 Flask 프로세스에서 fork를 피하기 위한 프로세스 풀 시작 방식"""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def terminate_pool(executor: ProcessPoolExecutor, timeout: float = 5):
+    """프로세스 풀 종료 (대기 중인 작업 취소 후 실행 중인 워커 프로세스까지 종료)
+
+    shutdown(cancel_futures=True)는 이미 워커에서 실행 중인 작업을 멈추지 않으므로,
+    워커 프로세스에 SIGTERM을 보내고 응답이 없으면 SIGKILL로 종료합니다.
+    """
+    # shutdown 후에는 _processes가 비워지므로 먼저 워커 목록을 가져옴
+    processes = list((getattr(executor, '_processes', None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+
+    deadline = time.monotonic() + timeout
+    for process in processes:
+        process.join(max(0.0, deadline - time.monotonic()))
+        if process.is_alive():
+            process.kill()
+            process.join(1)
@@ -0,0 +1,33 @@
+import os
+import sys
+from typing import List
+
+from config import Config
+
+
+def tool_path(name: str) -> str:
+    """무선 도구 실행 파일 (WIRELESS_TOOLS=fake면 tools/fake의 stand-in)"""
+    if Config.WIRELESS_TOOLS == 'fake':
+        return os.path.join(Config.FAKE_TOOLS_DIR, name)
+    return name
+
+
+def tool_argv(args: List[str]) -> List[str]:
+    """셸 없이 실행할 도구 인자 목록 (가짜 도구는 앱과 같은 인터프리터로 실행)"""
+    if Config.WIRELESS_TOOLS == 'fake':
+        return [sys.executable, tool_path(args[0])] + list(args[1:])
+    return list(args)
+
+
+def tool_command(command: str, preserve_env: bool = False) -> str:
+    """root 권한이 필요한 도구의 셸 명령 (sudo 비밀번호 자동 입력, 가짜 도구는 sudo 없이 실행)
+
+    Args:
+        command: '도구 인자...' 형태의 명령
+        preserve_env: sudo -E로 환경 변수 유지
+    """
+    if Config.WIRELESS_TOOLS == 'fake':
+        # 앱과 같은 인터프리터로 실행 (stand-in이 services 패키지를 import)
+        name, _, args = command.partition(' ')
+        return f"{sys.executable} {tool_path(name)} {args}".rstrip()
+    return f"echo '{Config.SUDO_PASSWORD}' | sudo -S {'-E ' if preserve_env else ''}{command}"